@@ -1,9 +1,22 @@
 from flask import Flask
 from flasgger import Swagger
 from .routes import api_blueprint
+from core.customs_tracking.watch.watch_config import CARGO_WATCH_ENABLED
+from dependencies import cargo_watch_scheduler, exchange_rate_prefetcher
+from core.tariff_prediction.tools.get_hs_classification import HS_MODEL_EAGER_LOAD, hs_classifier_registry
+from core.tariff_prediction.data.snapshot import ensure_snapshot
+from core.tariff_prediction.constants.api_config import EXCHANGE_RATE_PREFETCH_ENABLED, KOREAEXIM_API_URL
 
 def create_app():
     app = Flask(__name__)
     Swagger(app)
     app.register_blueprint(api_blueprint)
-    return app
\ No newline at end of file
+    # 관세 참조 데이터 스냅샷을 미리 확인해 첫 요청에서 CSV를 다시 읽지 않도록 합니다.
+    ensure_snapshot()
+    if CARGO_WATCH_ENABLED:
+        cargo_watch_scheduler.start()
+    if EXCHANGE_RATE_PREFETCH_ENABLED and KOREAEXIM_API_URL:
+        exchange_rate_prefetcher.start()
+    if HS_MODEL_EAGER_LOAD:
+        hs_classifier_registry.load_in_background()
+    return app
@@ -1,4 +1,30 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 class Request(BaseModel):
     message: str
+    session_id: Optional[str] = None
+
+
+class CargoWatchRequest(BaseModel):
+    webhook_url: str
+    cargo_mt_no: Optional[str] = None
+    hbl_no: Optional[str] = None
+    mbl_no: Optional[str] = None
+    year: Optional[str] = None
+
+
+class TariffEstimateRequest(BaseModel):
+    product_description: str
+    origin_country: str
+    price: float
+    quantity: int = 1
+    shipping_cost: float = 0
+    scenario: str = "해외직구"
+    top_k: int = 3
+
+
+class HSBatchClassificationRequest(BaseModel):
+    descriptions: List[str]
+    top_k: int = 5
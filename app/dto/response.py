@@ -10,13 +10,16 @@ class Response(BaseModel):
     success: Optional[bool] = None
     progress_details: Optional[List[ProgressDetail]] = None
     error_reason: Optional[str] = None
+    stale_as_of: Optional[str] = None
+    session_id: Optional[str] = None
 
     @staticmethod
     def cargo_progres_result_to_response(result: CargoProgressResult) -> "Response":
         return Response(
             success=result.success,
             error_reason=result.error_reason,
-            progress_details=result.progress_details
+            progress_details=result.progress_details,
+            stale_as_of=result.stale_as_of
         )
 
     @staticmethod
@@ -1,7 +1,26 @@
-from flask import Blueprint, request, jsonify
-from app.dto.request import Request
+from dataclasses import asdict
+
+from flask import Blueprint, Response as FlaskResponse, request, jsonify
+from pydantic import ValidationError
+from app.dto.request import Request, CargoWatchRequest, HSBatchClassificationRequest, TariffEstimateRequest
+from core.tariff_prediction.dto.tariff_request import TariffPredictionRequest
 from flasgger import swag_from
-from .service import run_model
+from core.shared.constants.error_codes import (
+    INVALID_WATCH_REQUEST_MESSAGE, WATCH_NOT_FOUND_MESSAGE,
+    INVALID_HS_BATCH_REQUEST_MESSAGE, INVALID_HS_SUGGEST_REQUEST_MESSAGE, HS_MODEL_NOT_READY_MESSAGE, INVALID_TARIFF_BULK_REQUEST_MESSAGE,
+    INVALID_TARIFF_STEP_REQUEST_MESSAGE, INVALID_TARIFF_ESTIMATE_REQUEST_MESSAGE
+)
+from core.shared.utils.metrics import metrics
+from core.tariff_prediction.tools.get_exchange_rate_info import exchange_rate_store
+from core.tariff_prediction.tools.get_hs_classification import hs_classifier_registry
+from dependencies import exchange_rate_prefetcher
+from .service import (
+    run_model, register_cargo_watch, get_cargo_watch, cancel_cargo_watch,
+    is_valid_hs_batch_request, classify_hs_codes_batch, is_valid_hs_suggest_request, suggest_hs_codes,
+    calculate_bulk_tariff, bulk_tariff_result_to_csv,
+    is_valid_tariff_step_request, run_tariff_step,
+    is_valid_tariff_estimate_request, estimate_tariff_one_shot
+)
 
 api_blueprint = Blueprint("api", __name__)
 
@@ -19,6 +38,10 @@ api_blueprint = Blueprint("api", __name__)
                     'question': {
                         'type': 'string',
                         'example': '이 물건의 세금이 얼마나 나올까?'
+                    },
+                    'session_id': {
+                        'type': 'string',
+                        'description': '이전 응답의 session_id. 생략하면 새 세션을 발급합니다.'
                     }
                 },
                 'required': ['question']
@@ -34,6 +57,10 @@ api_blueprint = Blueprint("api", __name__)
                     'answer': {
                         'type': 'string',
                         'example': '이 물건은 8%의 부가세가 부과됩니다.'
+                    },
+                    'session_id': {
+                        'type': 'string',
+                        'example': '3f2b9c0e6d4a4b1f8e7a5c2d1b0a9f8e'
                     }
                 }
             }
@@ -42,5 +69,274 @@ api_blueprint = Blueprint("api", __name__)
 })
 def predict():
     request_data = Request(**request.get_json())
-    answer = run_model(question=request_data.message)
-    return jsonify(answer.model_dump())
\ No newline at end of file
+    answer = run_model(question=request_data.message, session_id=request_data.session_id)
+    return jsonify(answer.model_dump())
+
+@api_blueprint.route("/health", methods=["GET"])
+@swag_from({
+    'tags': ['Operations'],
+    'responses': {
+        200: {'description': '서버 상태 및 구성 요소 준비 여부 (hs_classifier.ready, exchange_rates.is_today 등)'}
+    }
+})
+def health():
+    return jsonify(
+        status="ok",
+        components={
+            "hs_classifier": {"ready": hs_classifier_registry.is_ready(), **hs_classifier_registry.status()},
+            "exchange_rates": {**exchange_rate_store.freshness(), "prefetcher": exchange_rate_prefetcher.status()}
+        }
+    )
+
+@api_blueprint.route("/metrics", methods=["GET"])
+@swag_from({
+    'tags': ['Operations'],
+    'responses': {
+        200: {'description': '프로세스 단위 카운터/게이지 (서킷 브레이커 상태 등)'}
+    }
+})
+def get_metrics():
+    return jsonify(metrics.snapshot())
+
+@api_blueprint.route("/watch", methods=["POST"])
+@swag_from({
+    'tags': ['Cargo Watch'],
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'webhook_url': {'type': 'string', 'example': 'https://example.com/hooks/cargo'},
+                    'cargo_mt_no': {'type': 'string', 'example': 'KMTCSHA25080001'},
+                    'hbl_no': {'type': 'string'},
+                    'mbl_no': {'type': 'string'},
+                    'year': {'type': 'string', 'example': '2025'}
+                },
+                'required': ['webhook_url']
+            }
+        }
+    ],
+    'responses': {
+        201: {'description': '화물 감시 등록 완료 (새 통관 진행 이벤트가 웹훅으로 전달됩니다)'},
+        400: {'description': '잘못된 요청'}
+    }
+})
+def create_cargo_watch():
+    try:
+        watch_request = CargoWatchRequest(**(request.get_json() or {}))
+    except ValidationError:
+        watch_request = None
+    subscription = register_cargo_watch(watch_request) if watch_request else None
+    if subscription is None:
+        return jsonify(success=False, error_reason=INVALID_WATCH_REQUEST_MESSAGE.message), INVALID_WATCH_REQUEST_MESSAGE.http_status
+    return jsonify(asdict(subscription)), 201
+
+@api_blueprint.route("/watch/<watch_id>", methods=["GET"])
+@swag_from({
+    'tags': ['Cargo Watch'],
+    'parameters': [{'name': 'watch_id', 'in': 'path', 'type': 'string', 'required': True}],
+    'responses': {
+        200: {'description': '화물 감시 상태'},
+        404: {'description': '등록된 화물 감시 정보 없음'}
+    }
+})
+def read_cargo_watch(watch_id: str):
+    subscription = get_cargo_watch(watch_id)
+    if subscription is None:
+        return jsonify(success=False, error_reason=WATCH_NOT_FOUND_MESSAGE.message), WATCH_NOT_FOUND_MESSAGE.http_status
+    return jsonify(asdict(subscription))
+
+@api_blueprint.route("/watch/<watch_id>", methods=["DELETE"])
+@swag_from({
+    'tags': ['Cargo Watch'],
+    'parameters': [{'name': 'watch_id', 'in': 'path', 'type': 'string', 'required': True}],
+    'responses': {
+        204: {'description': '화물 감시 해지 완료'},
+        404: {'description': '등록된 화물 감시 정보 없음'}
+    }
+})
+def delete_cargo_watch(watch_id: str):
+    if not cancel_cargo_watch(watch_id):
+        return jsonify(success=False, error_reason=WATCH_NOT_FOUND_MESSAGE.message), WATCH_NOT_FOUND_MESSAGE.http_status
+    return "", 204
+
+@api_blueprint.route("/hs/classify/batch", methods=["POST"])
+@swag_from({
+    'tags': ['HS Classification'],
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'descriptions': {
+                        'type': 'array',
+                        'items': {'type': 'string'},
+                        'example': ['노트북 컴퓨터', '면 티셔츠', '냉동 새우']
+                    },
+                    'top_k': {'type': 'integer', 'example': 5}
+                },
+                'required': ['descriptions']
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': '입력 순서대로 상품별 top-k HS 코드와 확률'},
+        400: {'description': '잘못된 요청 (목록이 비었거나 HS_BATCH_MAX_ITEMS 초과)'},
+        503: {'description': 'HS 코드 예측 모델 미준비'}
+    }
+})
+def classify_hs_batch():
+    try:
+        batch_request = HSBatchClassificationRequest(**(request.get_json() or {}))
+    except ValidationError:
+        batch_request = None
+    if batch_request is None or not is_valid_hs_batch_request(batch_request):
+        return jsonify(success=False, error_reason=INVALID_HS_BATCH_REQUEST_MESSAGE.message), INVALID_HS_BATCH_REQUEST_MESSAGE.http_status
+    results = classify_hs_codes_batch(batch_request)
+    if results is None:
+        return jsonify(success=False, error_reason=HS_MODEL_NOT_READY_MESSAGE.message), HS_MODEL_NOT_READY_MESSAGE.http_status
+    return jsonify(success=True, results=results)
+
+@api_blueprint.route("/hs/suggest", methods=["GET"])
+@swag_from({
+    'tags': ['HS Classification'],
+    'parameters': [
+        {'name': 'prefix', 'in': 'query', 'type': 'string', 'required': True, 'example': '8517.70',
+         'description': 'HS 코드 앞자리 (2~10자리, 점·하이픈 허용)'},
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'default': 10, 'description': '최대 50'}
+    ],
+    'responses': {
+        200: {'description': '접두사로 시작하는 HS6/HS10 코드(사전순)와 전체 개수(total)'},
+        400: {'description': '잘못된 접두사 또는 개수'}
+    }
+})
+def suggest_hs_code():
+    prefix = request.args.get("prefix", "")
+    limit = request.args.get("limit", default=10, type=int)
+    if not is_valid_hs_suggest_request(prefix, limit):
+        return jsonify(success=False, error_reason=INVALID_HS_SUGGEST_REQUEST_MESSAGE.message), INVALID_HS_SUGGEST_REQUEST_MESSAGE.http_status
+    return jsonify(success=True, **suggest_hs_codes(prefix, limit))
+
+@api_blueprint.route("/tariff/bulk", methods=["POST"])
+@swag_from({
+    'tags': ['Tariff'],
+    'consumes': ['multipart/form-data'],
+    'parameters': [
+        {
+            'name': 'file',
+            'in': 'formData',
+            'type': 'file',
+            'required': True,
+            'description': 'hs_code, origin_country, price[, quantity, shipping_cost, situation] 컬럼의 CSV'
+        },
+        {'name': 'format', 'in': 'query', 'type': 'string', 'enum': ['csv', 'json'], 'default': 'csv'}
+    ],
+    'responses': {
+        200: {'description': '행별 관세율, 관세, 부가세, 총 세금 (계산할 수 없는 행은 error 컬럼에 사유)'},
+        400: {'description': '잘못된 CSV'}
+    }
+})
+def calculate_tariff_bulk():
+    csv_file = request.files.get("file")
+    result = calculate_bulk_tariff(csv_file.stream) if csv_file else None
+    if result is None:
+        return jsonify(success=False, error_reason=INVALID_TARIFF_BULK_REQUEST_MESSAGE.message), INVALID_TARIFF_BULK_REQUEST_MESSAGE.http_status
+    if request.args.get("format") == "json":
+        return FlaskResponse(result.to_json(orient="records", force_ascii=False), mimetype="application/json")
+    return FlaskResponse(
+        bulk_tariff_result_to_csv(result),
+        mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=tariff_estimates.csv"}
+    )
+
+@api_blueprint.route("/tariff/step", methods=["POST"])
+@swag_from({
+    'tags': ['Tariff'],
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'step': {'type': 'string', 'enum': ['input', 'hs6_select', 'hs10_select', 'auto'], 'example': 'input'},
+                    'product_description': {'type': 'string', 'example': '블루투스 무선 이어폰'},
+                    'hs6_code': {'type': 'string', 'example': '851762'},
+                    'hs10_code': {'type': 'string', 'example': '8517620000'},
+                    'origin_country': {'type': 'string', 'example': '미국'},
+                    'price': {'type': 'number', 'example': 150000},
+                    'quantity': {'type': 'integer', 'example': 1},
+                    'shipping_cost': {'type': 'number', 'example': 0},
+                    'scenario': {'type': 'string', 'example': '해외직구'},
+                    'page': {'type': 'integer', 'example': 1, 'description': 'HS10 후보 페이지 (hs6_select)'},
+                    'page_size': {'type': 'integer', 'example': 5, 'description': '페이지당 HS10 후보 수 (최대 50)'}
+                },
+                'required': ['step']
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': '다음 단계(step)와 HS6/HS10 후보 또는 관세 계산 결과'},
+        400: {'description': '단계에 필요한 값 누락'},
+        503: {'description': 'HS 코드 예측 모델 미준비 (input 단계)'}
+    }
+})
+def run_tariff_prediction_step():
+    try:
+        step_request = TariffPredictionRequest(**(request.get_json(silent=True) or {}))
+    except ValidationError:
+        step_request = None
+    if step_request is None or not is_valid_tariff_step_request(step_request):
+        return jsonify(success=False, error_reason=INVALID_TARIFF_STEP_REQUEST_MESSAGE.message), INVALID_TARIFF_STEP_REQUEST_MESSAGE.http_status
+    result = run_tariff_step(step_request)
+    if result is None:
+        return jsonify(success=False, error_reason=HS_MODEL_NOT_READY_MESSAGE.message), HS_MODEL_NOT_READY_MESSAGE.http_status
+    return jsonify(result.model_dump())
+
+@api_blueprint.route("/tariff/estimate", methods=["POST"])
+@swag_from({
+    'tags': ['Tariff'],
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'product_description': {'type': 'string', 'example': '블루투스 무선 이어폰'},
+                    'origin_country': {'type': 'string', 'example': '미국'},
+                    'price': {'type': 'number', 'example': 150000},
+                    'quantity': {'type': 'integer', 'example': 1},
+                    'shipping_cost': {'type': 'number', 'example': 0},
+                    'scenario': {'type': 'string', 'enum': ['해외직구', '해외체류 중 구매', '해외배송'], 'example': '해외직구'},
+                    'top_k': {'type': 'integer', 'example': 3}
+                },
+                'required': ['product_description', 'origin_country', 'price']
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': '자동 선택한 HS6/HS10 코드, 관세·부가세 계산 결과와 다른 HS 코드 후보'},
+        400: {'description': '잘못된 요청'},
+        503: {'description': 'HS 코드 예측 모델 미준비'}
+    }
+})
+def estimate_tariff_quick():
+    try:
+        estimate_request = TariffEstimateRequest(**(request.get_json(silent=True) or {}))
+    except ValidationError:
+        estimate_request = None
+    if estimate_request is None or not is_valid_tariff_estimate_request(estimate_request):
+        return jsonify(success=False, error_reason=INVALID_TARIFF_ESTIMATE_REQUEST_MESSAGE.message), INVALID_TARIFF_ESTIMATE_REQUEST_MESSAGE.http_status
+    result = estimate_tariff_one_shot(estimate_request)
+    if result is None:
+        return jsonify(success=False, error_reason=HS_MODEL_NOT_READY_MESSAGE.message), HS_MODEL_NOT_READY_MESSAGE.http_status
+    return jsonify(success=True, **result)
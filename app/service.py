@@ -1,17 +1,191 @@
+import io
+import os
+import re
+import uuid
+from dataclasses import asdict
+from typing import IO, Any, Dict, List, Optional
+
+import pandas as pd
+
+from app.dto.request import CargoWatchRequest, HSBatchClassificationRequest, TariffEstimateRequest
 from app.dto.response import Response
+from core.customs_tracking.api_spec.unipass_api_spec import CARGO_NO_PATTERN
+from core.customs_tracking.dto.cargo_watch import CargoWatchSubscription
+from core.customs_tracking.watch.watch_config import WATCH_MIN_INTERVAL
+from core.customs_tracking.watch.webhook_guard import is_public_webhook_url
 from core.graphs.runner import run_customs_agent
+from core.tariff_prediction.agent.step_api import resolve_step, tariff_prediction_step_api
+from core.tariff_prediction.constants import STEP_API, VALID_SCENARIOS
+from core.tariff_prediction.constants.model_config import HS10_CANDIDATES_PAGE_SIZE, HS10_CANDIDATES_MAX_PAGE_SIZE
+from core.tariff_prediction.data.hs_prefix_trie import HS_SUGGEST_MAX_LIMIT, get_hs_prefix_trie, normalize_hs_prefix
+from core.tariff_prediction.dto.tariff_request import TariffPredictionRequest
+from core.tariff_prediction.dto.tariff_response import TariffPredictionResponse
+from core.tariff_prediction.tools.calculate_bulk_tariff_amount import calculate_bulk_tariff_amount
+from core.tariff_prediction.tools.estimate_tariff import estimate_tariff
+from core.tariff_prediction.tools.get_hs_classification import hs_classifier_registry, predict_hs_codes_batch
+from dependencies import cargo_watch_store
 
-def run_model(question: str) -> "Response":
+def run_model(question: str, session_id: Optional[str] = None) -> "Response":
     """
         중앙 관리 모델을 통해 각 요청을 적절한 모델로 라우팅
         아무 모델과도 관계없는 경우 중앙 모델에서 적절한 응답을 생성해야 합니다.
         ex : "안녕, 너는 뭘 할 수 있어?"
         예시 코드는 아래와 같습니다.
     """
-    state = run_customs_agent(question)
+    # 세션 ID가 없으면 새 대화로 보고 발급합니다. 다음 요청에 그대로 보내면 관세 예측 대화가 이어집니다.
+    session_id = session_id or uuid.uuid4().hex
+    state = run_customs_agent(question, session_id=session_id)
     return Response(
         reply=state.get("final_response"),
         progress_details=state.get("progress_details"),
         error_reason=state.get("error_reason"),
+        stale_as_of=state.get("stale_as_of"),
+        session_id=session_id,
         success=True
-    )
\ No newline at end of file
+    )
+
+def register_cargo_watch(request: CargoWatchRequest) -> Optional[CargoWatchSubscription]:
+    """화물 감시를 등록합니다. 입력이 올바르지 않으면 None을 반환합니다."""
+    if not is_public_webhook_url(request.webhook_url):
+        return None
+
+    if request.cargo_mt_no:
+        cargo_mt_no = request.cargo_mt_no.replace("-", "").upper()
+        if not CARGO_NO_PATTERN.match(cargo_mt_no):
+            return None
+        return cargo_watch_store.add(request.webhook_url, WATCH_MIN_INTERVAL, cargo_mt_no=cargo_mt_no)
+
+    if request.hbl_no and request.mbl_no and request.year:
+        return cargo_watch_store.add(
+            request.webhook_url, WATCH_MIN_INTERVAL,
+            hbl_no=request.hbl_no, mbl_no=request.mbl_no, bl_year=request.year
+        )
+    return None
+
+def get_cargo_watch(watch_id: str) -> Optional[CargoWatchSubscription]:
+    return cargo_watch_store.get(watch_id)
+
+def cancel_cargo_watch(watch_id: str) -> bool:
+    return cargo_watch_store.remove(watch_id)
+
+# 요청 안에서 CPU로 임베딩하므로 gunicorn --timeout(90초) 안에 충분히 끝나는 크기로 제한합니다.
+HS_BATCH_MAX_ITEMS = int(os.getenv("HS_BATCH_MAX_ITEMS", "256"))
+HS_BATCH_MAX_TOP_K = 10
+
+def is_valid_hs_batch_request(request: HSBatchClassificationRequest) -> bool:
+    return (
+        0 < len(request.descriptions) <= HS_BATCH_MAX_ITEMS
+        and 0 < request.top_k <= HS_BATCH_MAX_TOP_K
+        and all(description.strip() for description in request.descriptions)
+    )
+
+def classify_hs_codes_batch(request: HSBatchClassificationRequest) -> Optional[List[Dict[str, Any]]]:
+    """상품 설명 목록의 HS 코드를 일괄 예측합니다. 모델이 준비되지 않았으면 None을 반환합니다."""
+    embedding_model, label_encoder, classifier_model, device = hs_classifier_registry.get()
+    if not all([embedding_model, label_encoder, classifier_model, device]):
+        return None
+    predictions = predict_hs_codes_batch(
+        [description.strip() for description in request.descriptions],
+        embedding_model, label_encoder, classifier_model, device,
+        top_k=request.top_k
+    )
+    return [
+        {"description": description, "predictions": item_predictions}
+        for description, item_predictions in zip(request.descriptions, predictions)
+    ]
+
+TARIFF_BULK_MAX_ROWS = int(os.getenv("TARIFF_BULK_MAX_ROWS", "20000"))
+
+def calculate_bulk_tariff(csv_file: IO[bytes]) -> Optional[pd.DataFrame]:
+    """주문 목록 CSV의 관세/부가세를 일괄 계산합니다. CSV 형식이 올바르지 않으면 None을 반환합니다."""
+    try:
+        # HS 코드의 앞자리 0을 유지하도록 모든 컬럼을 문자열로 읽습니다.
+        items = pd.read_csv(csv_file, dtype=str, encoding="utf-8-sig")
+    except (ValueError, UnicodeDecodeError, pd.errors.ParserError):
+        return None
+    if items.empty or len(items) > TARIFF_BULK_MAX_ROWS:
+        return None
+    try:
+        return calculate_bulk_tariff_amount(items)
+    except ValueError:
+        return None
+
+HS_SUGGEST_MIN_PREFIX = 2
+
+def is_valid_hs_suggest_request(prefix: str, limit: int) -> bool:
+    digits = normalize_hs_prefix(prefix)
+    return (
+        HS_SUGGEST_MIN_PREFIX <= len(digits) <= 10 and not re.search(r"[^\d.\-\s]", prefix)
+        and 0 < limit <= HS_SUGGEST_MAX_LIMIT
+    )
+
+def suggest_hs_codes(prefix: str, limit: int) -> Dict[str, Any]:
+    """HS 코드 접두사로 시작하는 HS6/HS10 코드를 사전순으로 limit개 반환합니다."""
+    trie = get_hs_prefix_trie()
+    digits = normalize_hs_prefix(prefix)
+    return {
+        "prefix": digits,
+        "total": trie.count(digits),
+        "suggestions": [asdict(entry) for entry in trie.suggest(digits, limit)],
+    }
+
+TARIFF_ESTIMATE_MAX_TOP_K = 10
+
+def is_valid_tariff_estimate_request(request: TariffEstimateRequest) -> bool:
+    return (
+        bool(request.product_description.strip()) and bool(request.origin_country.strip())
+        and request.price >= 0 and request.quantity > 0 and request.shipping_cost >= 0
+        and request.scenario in VALID_SCENARIOS
+        and 0 < request.top_k <= TARIFF_ESTIMATE_MAX_TOP_K
+    )
+
+def estimate_tariff_one_shot(request: TariffEstimateRequest) -> Optional[Dict[str, Any]]:
+    """HS 코드 선택 없이 관세를 추정합니다. HS 코드 예측 모델이 준비되지 않았으면 None을 반환합니다."""
+    return estimate_tariff(
+        request.product_description.strip(), request.origin_country.strip(), request.price,
+        quantity=request.quantity, shipping_cost=request.shipping_cost, scenario=request.scenario,
+        top_k=request.top_k
+    )
+
+HS_CODE_PATTERN = re.compile(r"[\d.\-\s]+")
+
+def _hs_code_digits(code: Optional[str]) -> str:
+    """숫자와 구분자(점, 하이픈, 공백)만으로 된 HS 코드의 숫자를 반환합니다. 다른 문자가 섞여 있으면 빈 문자열입니다."""
+    if not code or not HS_CODE_PATTERN.fullmatch(code.strip()):
+        return ""
+    return normalize_hs_prefix(code)
+
+def is_valid_tariff_step_request(request: TariffPredictionRequest) -> bool:
+    """단계별 필수 값을 확인합니다. 명시한 단계는 LLM 없이 바로 처리되므로 필요한 값이 모두 있어야 합니다."""
+    if request.page < 1 or not 0 < (request.page_size or HS10_CANDIDATES_PAGE_SIZE) <= HS10_CANDIDATES_MAX_PAGE_SIZE:
+        return False
+    if request.step == STEP_API['INPUT_STEP']:
+        return bool(request.product_description and request.product_description.strip())
+    if request.step == STEP_API['HS6_SELECT_STEP']:
+        # 4자리 호(heading)만 알면 그 아래 HS10 전체를 후보로 돌려줍니다.
+        return 4 <= len(_hs_code_digits(request.hs6_code)) <= 6
+    if request.step == STEP_API['HS10_SELECT_STEP']:
+        return bool(
+            len(_hs_code_digits(request.hs10_code)) == 10
+            and request.origin_country and request.price is not None and request.price >= 0
+            and (request.quantity or 0) > 0 and (request.shipping_cost or 0) >= 0
+        )
+    return bool(request.product_description or request.hs6_code or request.hs10_code)
+
+def run_tariff_step(request: TariffPredictionRequest) -> Optional[TariffPredictionResponse]:
+    """관세 예측 단계 하나를 대화 그래프 없이 실행합니다. HS 코드 예측 모델이 필요한데 준비되지 않았으면 None을 반환합니다."""
+    # auto 단계도 먼저 판단해 두어야 상품 설명 단계로 판단된 요청이 빈 후보 대신 503을 받습니다.
+    request = resolve_step(request)
+    if request.step == STEP_API['INPUT_STEP'] and not all(hs_classifier_registry.get()):
+        return None
+    return tariff_prediction_step_api(request)
+
+BULK_AMOUNT_COLUMNS = ["total_price", "tax_amount", "vat", "total_tax"]
+
+def bulk_tariff_result_to_csv(result: pd.DataFrame) -> bytes:
+    """금액 컬럼은 원 단위로 반올림하고, 엑셀에서 바로 열 수 있도록 BOM을 붙여 인코딩합니다."""
+    rendered = result.copy()
+    rendered[BULK_AMOUNT_COLUMNS] = rendered[BULK_AMOUNT_COLUMNS].round(0).astype("Int64")
+    buffer = io.StringIO()
+    rendered.to_csv(buffer, index=False)
+    return buffer.getvalue().encode("utf-8-sig")
@@ -1,3 +1,7 @@
+import logging
+import threading
+from typing import Optional
+
 from langchain.agents import create_openai_functions_agent, AgentExecutor
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
@@ -6,13 +10,9 @@ from core.customs_tracking.tools.get_cargo_progress_details import get_cargo_pro
 from core.shared.states.states import CustomsAgentState
 from core.shared.utils.llm import get_llm
 
+logger = logging.getLogger(__name__)
 
-def customs_tracking_agent(state: CustomsAgentState) -> CustomsAgentState:
-    tools = [get_cargo_progress_details_by_mt, get_cargo_progress_details_by_bl]  # function calling
-    llm = get_llm()
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """ 당신은 통관 진행 조회 서비스를 사용자에게 직접 제공하는 관세청 도우미입니다.
+SYSTEM_PROMPT = """ 당신은 통관 진행 조회 서비스를 사용자에게 직접 제공하는 관세청 도우미입니다.
         아래 도구를 통해 실제 통관 진행 정보를 조회할 수 있으므로, 가능한 경우에는 반드시 도구를 사용하세요.
         
         도구 목록:
@@ -21,7 +21,20 @@ def customs_tracking_agent(state: CustomsAgentState) -> CustomsAgentState:
         
         사용자의 질문이 화물번호나 BL 정보를 포함하지 않은 경우에는 다음 문장으로 안내하세요:
         "통관 진행을 조회하기 위해서는 화물번호 또는 BL 번호가 필요합니다. 화물번호(MT 번호) 또는 연도, MBL, HBL 번호를 제공해 주시면 통관 진행 정보를 조회해 드리겠습니다."
-        """),
+        """
+
+# 프로세스당 한 번만 생성해 모든 요청에서 재사용합니다.
+# AgentExecutor는 호출 간 상태를 갖지 않으므로 동시 요청에서 공유해도 안전합니다.
+_agent_executor: Optional[AgentExecutor] = None
+_agent_executor_lock = threading.Lock()
+
+
+def _build_agent_executor() -> AgentExecutor:
+    tools = [get_cargo_progress_details_by_mt, get_cargo_progress_details_by_bl]  # function calling
+    llm = get_llm()
+
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PROMPT),
         MessagesPlaceholder(variable_name="messages"),
         ("system", "{agent_scratchpad}"),
     ])
@@ -30,15 +43,29 @@ def customs_tracking_agent(state: CustomsAgentState) -> CustomsAgentState:
         tools=tools,
         prompt=prompt
     )
-    print(prompt)
+    logger.debug("customs tracking prompt: %s", prompt)
 
-    agent_executor = AgentExecutor(
+    return AgentExecutor(
         agent=agent,
         tools=tools,
         handle_parsing_errors=True,
         return_intermediate_steps=True
     )
 
+
+def get_agent_executor() -> AgentExecutor:
+    """통관 조회 AgentExecutor를 반환합니다. 최초 호출 시 한 번만 생성합니다."""
+    global _agent_executor
+    if _agent_executor is None:
+        with _agent_executor_lock:
+            if _agent_executor is None:
+                _agent_executor = _build_agent_executor()
+    return _agent_executor
+
+
+def customs_tracking_agent(state: CustomsAgentState) -> CustomsAgentState:
+    agent_executor = get_agent_executor()
+
     result = agent_executor.invoke({
         "input": state["query"],
         "messages": state["messages"]
@@ -51,13 +78,15 @@ def customs_tracking_agent(state: CustomsAgentState) -> CustomsAgentState:
         if isinstance(tool_result, CargoProgressResult):
             state["progress_details"] = tool_result.progress_details
             state["error_reason"] = tool_result.error_reason
+            state["stale_as_of"] = tool_result.stale_as_of
         else:
             state["progress_details"] = None
             state["error_reason"] = None
+            state["stale_as_of"] = None
 
         state["final_response"] = ""
     else:
-        print(result["output"])
+        logger.debug("customs tracking output: %s", result["output"])
         state["final_response"] = result["output"]
 
-    return state
\ No newline at end of file
+    return state
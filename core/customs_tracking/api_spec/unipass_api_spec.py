@@ -1,3 +1,4 @@
+import os
 import re
 
 # XML tag constants
@@ -13,6 +14,21 @@ PARAM_HBL_NO = "hblNo"
 PARAM_MBL_NO = "mblNo"
 PARAM_BL_YEAR = "blYy"
 
+# Request timeout (seconds)
+UNIPASS_TIMEOUT_SECONDS = float(os.getenv("UNIPASS_TIMEOUT_SECONDS", "10"))
+
+# API key quota (shared by all workers through the state file, rate <= 0 disables limiting)
+UNIPASS_RATE_LIMIT_PER_SECOND = float(os.getenv("UNIPASS_RATE_LIMIT_PER_SECOND", "5"))
+UNIPASS_RATE_LIMIT_BURST = int(os.getenv("UNIPASS_RATE_LIMIT_BURST", "10"))
+UNIPASS_DAILY_QUOTA = int(os.getenv("UNIPASS_DAILY_QUOTA", "0"))  # 0: no daily limit
+UNIPASS_RATE_LIMIT_MODE = os.getenv("UNIPASS_RATE_LIMIT_MODE", "queue")  # queue | reject
+UNIPASS_RATE_LIMIT_MAX_WAIT = float(os.getenv("UNIPASS_RATE_LIMIT_MAX_WAIT", "3"))
+UNIPASS_RATE_LIMIT_STATE_PATH = os.getenv(
+    "UNIPASS_RATE_LIMIT_STATE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+                 "var", "unipass_rate_limit.json")
+)
+
 # Fallback value
 NA = "N/A"
 
@@ -1,14 +1,16 @@
-import os
 import requests
-from typing import Dict
+from typing import Dict, Optional
 
 from core.customs_tracking.dto.cargo_progress_result import CargoProgressResult
 from core.customs_tracking.parser.unipass_xml_parser import parse_progress
+from core.shared.utils.circuit_breaker import CircuitBreaker
+from core.shared.utils.rate_limiter import FileTokenBucket, RateLimitExceeded
 from core.shared.constants.error_codes import (
     FETCH_ERROR_MESSAGE,
     INVALID_CARGO_NUMBER_MESSAGE,
     INVALID_BL_NUMBER_MESSAGE,
     NO_PROGRESS_INFO_MESSAGE,
+    RATE_LIMITED_MESSAGE,
 )
 from core.customs_tracking.api_spec.unipass_api_spec import (
     PARAM_API_KEY,
@@ -17,13 +19,17 @@ from core.customs_tracking.api_spec.unipass_api_spec import (
     PARAM_MBL_NO,
     PARAM_BL_YEAR,
     CARGO_NO_PATTERN,
+    UNIPASS_TIMEOUT_SECONDS,
 )
 
 
 class UnipassCargoApiClient:
-    def __init__(self, api_key: str, api_url: str):
+    def __init__(self, api_key: str, api_url: str, circuit_breaker: Optional[CircuitBreaker] = None,
+                 rate_limiter: Optional[FileTokenBucket] = None):
         self.api_key = api_key
         self.api_url = api_url
+        self.circuit_breaker = circuit_breaker or CircuitBreaker("unipass", excluded_exceptions=(RateLimitExceeded,))
+        self.rate_limiter = rate_limiter
 
     def get_cargo_progress_details_by_mt(self, cargo_mt_no: str) -> CargoProgressResult:
         cargo_mt_no = self._format_cargo_number(cargo_mt_no)
@@ -47,17 +53,21 @@ class UnipassCargoApiClient:
 
     def _get_cargo_progress_result(self, query_params: Dict[str, str]) -> CargoProgressResult:
         url = self._build_request_url(query_params)
-        xml = self._fetch_xml(url)
+        cache_key = "&".join(f"{k}={v}" for k, v in sorted(query_params.items()))
 
         try:
-            parsed = parse_progress(xml)
+            fetched = self.circuit_breaker.call(cache_key, self._fetch_xml, url)
+            parsed = parse_progress(fetched.value)
+        except RateLimitExceeded:
+            return CargoProgressResult(success=False, error_reason=RATE_LIMITED_MESSAGE.message)
         except Exception:
             return CargoProgressResult(success=False, error_reason=FETCH_ERROR_MESSAGE.message)
 
+        stale_as_of = fetched.fetched_at_str if fetched.stale else None
         if parsed and len(parsed) > 0:
-            return CargoProgressResult(success=True, progress_details=parsed)
+            return CargoProgressResult(success=True, progress_details=parsed, stale_as_of=stale_as_of)
         else:
-            return CargoProgressResult(success=False, error_reason=NO_PROGRESS_INFO_MESSAGE.message)
+            return CargoProgressResult(success=False, error_reason=NO_PROGRESS_INFO_MESSAGE.message, stale_as_of=stale_as_of)
 
     def _is_valid_cargo_number(self, cargo_mt_no: str) -> bool:
         return bool(CARGO_NO_PATTERN.match(cargo_mt_no))
@@ -67,7 +77,9 @@ class UnipassCargoApiClient:
         return f"{self.api_url}?" + "&".join(f"{k}={v}" for k, v in all_params.items())
 
     def _fetch_xml(self, url: str) -> str:
-        response = requests.get(url)
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        response = requests.get(url, timeout=UNIPASS_TIMEOUT_SECONDS)
         response.raise_for_status()
         return response.text
 
@@ -7,3 +7,4 @@ class CargoProgressResult:
     success: bool
     progress_details: Optional[List[ProgressDetail]] = None
     error_reason: Optional[str] = None
+    stale_as_of: Optional[str] = None  # 외부 API 장애로 마지막 정상 응답을 제공한 경우 그 조회 시각
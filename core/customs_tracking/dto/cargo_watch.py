@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+# (datetime, status, comment)
+EventKey = Tuple[str, str, str]
+
+
+@dataclass
+class CargoWatchSubscription:
+    watch_id: str
+    webhook_url: str
+    poll_interval: int
+    next_poll_at: float
+    created_at: float
+    cargo_mt_no: Optional[str] = None
+    hbl_no: Optional[str] = None
+    mbl_no: Optional[str] = None
+    bl_year: Optional[str] = None
+    seen_events: List[EventKey] = field(default_factory=list)
+    last_polled_at: Optional[float] = None
+    active: bool = True
+    failure_count: int = 0  # 연속 조회·전달 실패 횟수
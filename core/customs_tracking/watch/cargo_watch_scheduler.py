@@ -0,0 +1,172 @@
+import logging
+import threading
+import time
+from dataclasses import asdict
+from typing import List, Optional
+
+import requests
+
+from core.customs_tracking.client.unipass_cargo_api_client import UnipassCargoApiClient
+from core.customs_tracking.dto.cargo_progress_result import CargoProgressResult
+from core.customs_tracking.dto.cargo_watch import CargoWatchSubscription
+from core.customs_tracking.dto.progress_detail import ProgressDetail
+from core.customs_tracking.watch.cargo_watch_store import CargoWatchStore
+from core.customs_tracking.watch.webhook_guard import is_public_webhook_url
+from core.customs_tracking.watch.watch_config import (
+    WATCH_MIN_INTERVAL,
+    WATCH_EXPECTING_MAX_INTERVAL,
+    WATCH_IDLE_MAX_INTERVAL,
+    WATCH_BACKOFF_FACTOR,
+    WATCH_MAX_CONSECUTIVE_FAILURES,
+    WATCH_MAX_LIFETIME_SECONDS,
+    WATCH_TICK_SECONDS,
+    WATCH_CLAIM_LEASE_SECONDS,
+    WATCH_BATCH_SIZE,
+    WATCH_EXPECTING_STATUSES,
+    WATCH_TERMINAL_STATUSES,
+    WEBHOOK_TIMEOUT_SECONDS,
+)
+from core.shared.constants.error_codes import NO_PROGRESS_INFO_MESSAGE
+
+logger = logging.getLogger(__name__)
+
+
+def diff_progress_events(details: Optional[List[ProgressDetail]],
+                         subscription: CargoWatchSubscription) -> List[ProgressDetail]:
+    """이미 알린 이벤트를 제외한 새 통관 진행 이벤트를 시간 순서대로 반환합니다."""
+    seen = set(subscription.seen_events)
+    return [d for d in (details or []) if (d.datetime, d.status, d.comment) not in seen]
+
+
+def next_poll_interval(subscription: CargoWatchSubscription, has_new_events: bool,
+                       latest: Optional[ProgressDetail]) -> int:
+    """새 이벤트가 있으면 가장 짧은 주기로, 없으면 상태에 따른 상한까지 주기를 늘립니다."""
+    if has_new_events:
+        return WATCH_MIN_INTERVAL
+    expecting = latest is not None and latest.status in WATCH_EXPECTING_STATUSES
+    max_interval = WATCH_EXPECTING_MAX_INTERVAL if expecting else WATCH_IDLE_MAX_INTERVAL
+    return min(max(subscription.poll_interval, WATCH_MIN_INTERVAL) * WATCH_BACKOFF_FACTOR, max_interval)
+
+
+class CargoWatchScheduler:
+    """등록된 화물 번호를 주기적으로 조회해 새 통관 진행 이벤트를 웹훅으로 전달합니다."""
+
+    def __init__(self, store: CargoWatchStore, client: UnipassCargoApiClient):
+        self.store = store
+        self.client = client
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="cargo-watch-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=WATCH_TICK_SECONDS * 2)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("cargo watch tick failed")
+            self._stop_event.wait(WATCH_TICK_SECONDS)
+
+    def run_once(self, now: Optional[float] = None) -> int:
+        """폴링할 시각이 된 구독을 처리하고, 처리한 구독 수를 반환합니다."""
+        now = now or time.time()
+        due = self.store.claim_due(now, WATCH_CLAIM_LEASE_SECONDS, WATCH_BATCH_SIZE)
+        polled = 0
+        for subscription in due:
+            # 앞의 구독을 처리하느라 배치 전체가 임대 시간을 넘겨도 중복 폴링하지 않도록, 구독마다 처리 직전에 임대를 연장합니다.
+            if not self.store.renew_claim(subscription, time.time() + WATCH_CLAIM_LEASE_SECONDS):
+                continue
+            self.poll(subscription)
+            polled += 1
+        return polled
+
+    def poll(self, subscription: CargoWatchSubscription) -> None:
+        result = self._fetch(subscription)
+        now = time.time()
+        subscription.last_polled_at = now
+
+        if not result.success and result.error_reason != NO_PROGRESS_INFO_MESSAGE.message:
+            # 조회 실패: 알린 이벤트는 그대로 두고 주기만 늘려 다시 시도합니다.
+            self._record_failure(subscription, now)
+            return
+
+        details = result.progress_details or []
+        new_events = diff_progress_events(details, subscription)
+        latest = details[-1] if details else None
+        completed = latest is not None and latest.status in WATCH_TERMINAL_STATUSES
+
+        if new_events:
+            if not self._deliver(subscription, new_events, completed):
+                # 전달 실패 시 이벤트를 미확인 상태로 남겨 다음 폴링에서 다시 전달합니다.
+                # 주기를 줄이지 않아야 계속 실패하는 웹훅이 Unipass 일일 호출량을 소모하지 않습니다.
+                self._record_failure(subscription, now)
+                return
+            subscription.seen_events.extend((e.datetime, e.status, e.comment) for e in new_events)
+
+        subscription.failure_count = 0
+        subscription.active = not completed and not self._expired(subscription, now)
+        subscription.poll_interval = next_poll_interval(subscription, bool(new_events), latest)
+        subscription.next_poll_at = now + subscription.poll_interval
+        self.store.update_after_poll(subscription)
+
+    def _record_failure(self, subscription: CargoWatchSubscription, now: float) -> None:
+        subscription.failure_count += 1
+        subscription.poll_interval = next_poll_interval(subscription, False, None)
+        subscription.next_poll_at = now + subscription.poll_interval
+        if subscription.failure_count >= WATCH_MAX_CONSECUTIVE_FAILURES or self._expired(subscription, now):
+            logger.warning("cargo watch %s stopped (consecutive failures: %d)",
+                           subscription.watch_id, subscription.failure_count)
+            subscription.active = False
+        self.store.update_after_poll(subscription)
+
+    @staticmethod
+    def _expired(subscription: CargoWatchSubscription, now: float) -> bool:
+        return now - subscription.created_at >= WATCH_MAX_LIFETIME_SECONDS
+
+    def _fetch(self, subscription: CargoWatchSubscription) -> CargoProgressResult:
+        try:
+            if subscription.cargo_mt_no:
+                return self.client.get_cargo_progress_details_by_mt(subscription.cargo_mt_no)
+            return self.client.get_cargo_progress_details_by_bl(
+                hbl_no=subscription.hbl_no, mbl_no=subscription.mbl_no, year=subscription.bl_year
+            )
+        except Exception as e:
+            logger.warning("cargo watch %s fetch failed: %s", subscription.watch_id, e)
+            return CargoProgressResult(success=False, error_reason=str(e))
+
+    def _deliver(self, subscription: CargoWatchSubscription, events: List[ProgressDetail], completed: bool) -> bool:
+        payload = {
+            "watch_id": subscription.watch_id,
+            "cargo_mt_no": subscription.cargo_mt_no,
+            "hbl_no": subscription.hbl_no,
+            "mbl_no": subscription.mbl_no,
+            "year": subscription.bl_year,
+            "new_events": [asdict(event) for event in events],
+            "completed": completed,
+        }
+        # 등록 후 DNS가 내부 주소로 바뀌었을 수 있으므로 보낼 때마다 다시 확인하고, 리다이렉트는 따라가지 않습니다.
+        if not is_public_webhook_url(subscription.webhook_url):
+            logger.warning("cargo watch %s webhook url resolves to a non-public address", subscription.watch_id)
+            return False
+        try:
+            response = requests.post(subscription.webhook_url, json=payload, timeout=WEBHOOK_TIMEOUT_SECONDS,
+                                     allow_redirects=False)
+            response.raise_for_status()
+            if response.status_code >= 300:
+                raise requests.HTTPError(f"unexpected redirect {response.status_code}", response=response)
+            return True
+        except Exception as e:
+            logger.warning("cargo watch %s webhook delivery failed: %s", subscription.watch_id, e)
+            return False
@@ -0,0 +1,181 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+from core.customs_tracking.dto.cargo_watch import CargoWatchSubscription, EventKey
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cargo_watch (
+    watch_id TEXT PRIMARY KEY,
+    cargo_mt_no TEXT,
+    hbl_no TEXT,
+    mbl_no TEXT,
+    bl_year TEXT,
+    webhook_url TEXT NOT NULL,
+    seen_events TEXT NOT NULL DEFAULT '[]',
+    poll_interval INTEGER NOT NULL,
+    next_poll_at REAL NOT NULL,
+    last_polled_at REAL,
+    active INTEGER NOT NULL DEFAULT 1,
+    created_at REAL NOT NULL,
+    failure_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_cargo_watch_due ON cargo_watch (active, next_poll_at);
+"""
+
+_COLUMNS = (
+    "watch_id, cargo_mt_no, hbl_no, mbl_no, bl_year, webhook_url, seen_events, "
+    "poll_interval, next_poll_at, last_polled_at, active, created_at, failure_count"
+)
+
+
+class CargoWatchStore:
+    """화물 감시 구독을 로컬 SQLite에 저장합니다. 여러 워커가 같은 파일을 공유할 수 있습니다."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._migrate(conn)
+                    self._initialized = True
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        # failure_count가 없던 기존 파일에 열을 추가합니다.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cargo_watch)")}
+        if "failure_count" not in columns:
+            conn.execute("ALTER TABLE cargo_watch ADD COLUMN failure_count INTEGER NOT NULL DEFAULT 0")
+
+    def add(self, webhook_url: str, poll_interval: int, cargo_mt_no: Optional[str] = None,
+            hbl_no: Optional[str] = None, mbl_no: Optional[str] = None,
+            bl_year: Optional[str] = None) -> CargoWatchSubscription:
+        now = time.time()
+        subscription = CargoWatchSubscription(
+            watch_id=uuid.uuid4().hex,
+            webhook_url=webhook_url,
+            poll_interval=poll_interval,
+            next_poll_at=now,
+            created_at=now,
+            cargo_mt_no=cargo_mt_no,
+            hbl_no=hbl_no,
+            mbl_no=mbl_no,
+            bl_year=bl_year,
+        )
+        self._connect().execute(
+            f"INSERT INTO cargo_watch ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(subscription),
+        )
+        return subscription
+
+    def get(self, watch_id: str) -> Optional[CargoWatchSubscription]:
+        row = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM cargo_watch WHERE watch_id = ?", (watch_id,)
+        ).fetchone()
+        return self._from_row(row) if row else None
+
+    def remove(self, watch_id: str) -> bool:
+        cursor = self._connect().execute("DELETE FROM cargo_watch WHERE watch_id = ?", (watch_id,))
+        return cursor.rowcount > 0
+
+    def claim_due(self, now: float, lease_seconds: int, limit: int) -> List[CargoWatchSubscription]:
+        """
+        폴링할 시각이 된 구독을 선점합니다. 선점한 구독의 next_poll_at은 임대 만료 시각으로 밀리며,
+        반환하는 구독의 next_poll_at에도 이 시각을 넣어 renew_claim에서 임대를 확인하는 데 씁니다.
+        """
+        conn = self._connect()
+        rows = conn.execute(
+            f"SELECT {_COLUMNS} FROM cargo_watch WHERE active = 1 AND next_poll_at <= ? "
+            "ORDER BY next_poll_at LIMIT ?",
+            (now, limit),
+        ).fetchall()
+
+        claimed = []
+        for row in rows:
+            subscription = self._from_row(row)
+            cursor = conn.execute(
+                "UPDATE cargo_watch SET next_poll_at = ? WHERE watch_id = ? AND next_poll_at = ?",
+                (now + lease_seconds, subscription.watch_id, subscription.next_poll_at),
+            )
+            if cursor.rowcount == 1:
+                subscription.next_poll_at = now + lease_seconds
+                claimed.append(subscription)
+        return claimed
+
+    def renew_claim(self, subscription: CargoWatchSubscription, lease_until: float) -> bool:
+        """선점한 구독의 임대를 lease_until까지 연장합니다. 임대가 만료되어 다른 워커가 가져갔으면 False를 반환합니다."""
+        cursor = self._connect().execute(
+            "UPDATE cargo_watch SET next_poll_at = ? WHERE watch_id = ? AND next_poll_at = ? AND active = 1",
+            (lease_until, subscription.watch_id, subscription.next_poll_at),
+        )
+        if cursor.rowcount != 1:
+            return False
+        subscription.next_poll_at = lease_until
+        return True
+
+    def update_after_poll(self, subscription: CargoWatchSubscription) -> None:
+        self._connect().execute(
+            "UPDATE cargo_watch SET seen_events = ?, poll_interval = ?, next_poll_at = ?, "
+            "last_polled_at = ?, active = ?, failure_count = ? WHERE watch_id = ?",
+            (
+                json.dumps(subscription.seen_events, ensure_ascii=False, separators=(",", ":")),
+                subscription.poll_interval,
+                subscription.next_poll_at,
+                subscription.last_polled_at,
+                int(subscription.active),
+                subscription.failure_count,
+                subscription.watch_id,
+            ),
+        )
+
+    def _to_row(self, subscription: CargoWatchSubscription) -> tuple:
+        return (
+            subscription.watch_id,
+            subscription.cargo_mt_no,
+            subscription.hbl_no,
+            subscription.mbl_no,
+            subscription.bl_year,
+            subscription.webhook_url,
+            json.dumps(subscription.seen_events, ensure_ascii=False, separators=(",", ":")),
+            subscription.poll_interval,
+            subscription.next_poll_at,
+            subscription.last_polled_at,
+            int(subscription.active),
+            subscription.created_at,
+            subscription.failure_count,
+        )
+
+    def _from_row(self, row: tuple) -> CargoWatchSubscription:
+        seen_events: List[EventKey] = [tuple(event) for event in json.loads(row[6])]
+        return CargoWatchSubscription(
+            watch_id=row[0],
+            cargo_mt_no=row[1],
+            hbl_no=row[2],
+            mbl_no=row[3],
+            bl_year=row[4],
+            webhook_url=row[5],
+            seen_events=seen_events,
+            poll_interval=row[7],
+            next_poll_at=row[8],
+            last_polled_at=row[9],
+            active=bool(row[10]),
+            created_at=row[11],
+            failure_count=row[12],
+        )
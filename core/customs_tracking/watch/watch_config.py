@@ -0,0 +1,29 @@
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+CARGO_WATCH_ENABLED = os.getenv("CARGO_WATCH_ENABLED", "false").lower() == "true"
+CARGO_WATCH_DB_PATH = os.getenv("CARGO_WATCH_DB_PATH", os.path.join(PROJECT_ROOT, "var", "cargo_watch.sqlite3"))
+
+# 폴링 주기 (초)
+WATCH_MIN_INTERVAL = int(os.getenv("CARGO_WATCH_MIN_INTERVAL", "300"))            # 새 이벤트 직후
+WATCH_EXPECTING_MAX_INTERVAL = int(os.getenv("CARGO_WATCH_EXPECTING_MAX_INTERVAL", "1800"))  # 다음 단계가 임박한 경우
+WATCH_IDLE_MAX_INTERVAL = int(os.getenv("CARGO_WATCH_IDLE_MAX_INTERVAL", "21600"))  # 변화가 없는 경우
+WATCH_BACKOFF_FACTOR = 2
+
+# 조회나 웹훅 전달이 연속으로 이만큼 실패하거나, 등록 후 이 시간이 지나면 감시를 종료합니다.
+WATCH_MAX_CONSECUTIVE_FAILURES = int(os.getenv("CARGO_WATCH_MAX_CONSECUTIVE_FAILURES", "20"))
+WATCH_MAX_LIFETIME_SECONDS = int(os.getenv("CARGO_WATCH_MAX_LIFETIME_SECONDS", str(60 * 24 * 3600)))
+WATCH_TICK_SECONDS = 5
+# 다른 워커가 같은 구독을 중복 폴링하지 않도록 선점하는 시간. 구독마다 처리 직전에 연장하므로
+# 구독 하나의 최악 처리 시간(호출량 대기 3초 + Unipass 10초 + 웹훅 10초)보다 충분히 길면 됩니다.
+WATCH_CLAIM_LEASE_SECONDS = 120
+WATCH_BATCH_SIZE = 20
+
+WEBHOOK_TIMEOUT_SECONDS = 10
+
+# 이후 단계가 곧 이어지는 통관 진행 상태 (짧은 주기 유지)
+WATCH_EXPECTING_STATUSES = ["하선신고 수리", "반입신고", "수입신고", "수입신고수리"]
+
+# 통관이 끝난 상태 (알림 후 구독 종료)
+WATCH_TERMINAL_STATUSES = ["반출신고"]
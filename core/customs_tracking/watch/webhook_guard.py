@@ -0,0 +1,34 @@
+import ipaddress
+import socket
+from urllib.parse import urlsplit
+
+
+def is_public_webhook_url(url: str) -> bool:
+    """
+    http(s) URL이고 호스트가 가리키는 주소가 모두 공인 주소인지 확인합니다.
+    서버에서 웹훅을 보내므로 루프백, 사설, 링크 로컬(메타데이터 169.254.169.254 포함), 예약 주소는 허용하지 않습니다.
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return False
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    try:
+        infos = socket.getaddrinfo(parts.hostname, port or (443 if parts.scheme == "https" else 80),
+                                   proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError):
+        return False
+    addresses = {info[4][0] for info in infos}
+    return bool(addresses) and all(_is_public_address(address) for address in addresses)
+
+
+def _is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not (
+        ip.is_loopback or ip.is_private or ip.is_link_local or ip.is_reserved
+        or ip.is_multicast or ip.is_unspecified
+    )
@@ -31,4 +31,60 @@ INVALID_BL_NUMBER_MESSAGE = ErrorCode(
     http_status=HTTPStatus.BAD_REQUEST,
     code="TRACK-DELIVERY-004",
     message="BL 번호 형식이 올바르지 않습니다.",
-)
\ No newline at end of file
+)
+RATE_LIMITED_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.TOO_MANY_REQUESTS,
+    code="TRACK-DELIVERY-005",
+    message="통관 조회 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+)
+
+
+INVALID_WATCH_REQUEST_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.BAD_REQUEST,
+    code="WATCH-CARGO-001",
+    message="화물번호(또는 연도, MBL, HBL 번호)와 공인 주소로 연결되는 http(s) 웹훅 URL이 필요합니다.",
+)
+
+WATCH_NOT_FOUND_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.NOT_FOUND,
+    code="WATCH-CARGO-002",
+    message="등록된 화물 감시 정보가 없습니다.",
+)
+
+
+INVALID_HS_BATCH_REQUEST_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.BAD_REQUEST,
+    code="HS-CLASSIFY-001",
+    message="분류할 상품 설명 목록(descriptions)이 올바르지 않습니다.",
+)
+
+INVALID_HS_SUGGEST_REQUEST_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.BAD_REQUEST,
+    code="HS-SUGGEST-001",
+    message="2~10자리 숫자 HS 코드 접두사(prefix)와 1~50 사이의 개수(limit)가 필요합니다.",
+)
+
+HS_MODEL_NOT_READY_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.SERVICE_UNAVAILABLE,
+    code="HS-CLASSIFY-002",
+    message="HS 코드 예측 모델이 준비되어 있지 않습니다.",
+)
+
+INVALID_TARIFF_BULK_REQUEST_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.BAD_REQUEST,
+    code="TARIFF-BULK-001",
+    message="hs_code, origin_country, price 컬럼이 있는 CSV 파일(file)이 필요합니다.",
+)
+
+INVALID_TARIFF_ESTIMATE_REQUEST_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.BAD_REQUEST,
+    code="TARIFF-ESTIMATE-001",
+    message="상품 설명(product_description), 원산지(origin_country), 0 이상의 가격(price)과 올바른 시나리오(scenario)가 필요합니다.",
+)
+
+INVALID_TARIFF_STEP_REQUEST_MESSAGE = ErrorCode(
+    http_status=HTTPStatus.BAD_REQUEST,
+    code="TARIFF-STEP-001",
+    message="단계(step)에 필요한 값이 없습니다. input은 product_description, hs6_select는 4~6자리 hs6_code, "
+            "hs10_select는 10자리 hs10_code와 origin_country, price가 필요합니다. page는 1 이상, page_size는 1~50입니다.",
+)
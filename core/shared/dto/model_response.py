@@ -9,4 +9,5 @@ class ModelResponse(BaseModel):
     reply: Optional[str] = None
     success: Optional[bool] = None
     progress_details: Optional[List[ProgressDetail]] = None
-    error_reason: Optional[str] = None
\ No newline at end of file
+    error_reason: Optional[str] = None
+    stale_as_of: Optional[str] = None
\ No newline at end of file
@@ -4,10 +4,10 @@ from typing import List, Optional
 
 from core.shared.states.states import CustomsAgentState
 from core.shared.utils.llm import get_llm
+from core.shared.utils.keyword_matcher import (
+    keyword_matcher, CUSTOMS_TRACKING, TARIFF_PREDICTION, TARIFF_SESSION
+)
 from core.shared.constants import (
-    TARIFF_SESSION_KEYWORDS,
-    TARIFF_PREDICTION_KEYWORDS,
-    CUSTOMS_TRACKING_KEYWORDS,
     NUMBER_SELECTION_PATTERNS,
     QUESTION_PATTERNS,
     INTENT_CLASSIFICATION_PROMPT,
@@ -29,16 +29,14 @@ def _is_question(query: str) -> bool:
 
 def _classify_by_keywords(query: str) -> Optional[str]:
     """키워드 기반으로 의도를 분류합니다."""
-    query_lower = query.lower()
+    categories = keyword_matcher.categories(query)
     
     # 배송 추적 관련 키워드 확인
-    tracking_keywords = [kw for kw in CUSTOMS_TRACKING_KEYWORDS if kw in query_lower]
-    if tracking_keywords:
+    if CUSTOMS_TRACKING in categories:
         return "customs_tracking"
     
     # 관세 예측 관련 키워드 확인
-    tariff_keywords = [kw for kw in TARIFF_PREDICTION_KEYWORDS if kw in query_lower]
-    if tariff_keywords:
+    if TARIFF_PREDICTION in categories:
         return "tariff_prediction"
     
     return None
@@ -58,8 +56,7 @@ def _is_in_tariff_session(state: CustomsAgentState) -> bool:
     recent_messages = messages[-SESSION_CHECK_MESSAGE_COUNT:]
     for msg in recent_messages:
         if hasattr(msg, 'content') and isinstance(msg.content, str):
-            content = msg.content.lower()
-            if any(keyword in content for keyword in TARIFF_SESSION_KEYWORDS):
+            if TARIFF_SESSION in keyword_matcher.categories(msg.content):
                 return True
     
     # 3. 마지막 메시지에서 세션 상태 확인
@@ -15,4 +15,6 @@ class CustomsAgentState(TypedDict):
     final_response: str
     intermediate_results: Dict[str, Any]
     progress_details: Optional[List[ProgressDetail]]
-    error_reason: Optional[str]
\ No newline at end of file
+    error_reason: Optional[str]
+    stale_as_of: Optional[str]
+    session_id: Optional[str]
\ No newline at end of file
@@ -0,0 +1,187 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from core.shared.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+DEFAULT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30"))
+DEFAULT_MAX_CACHED_RESPONSES = 1024
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있고 제공할 마지막 정상 응답도 없는 경우 발생합니다."""
+
+
+@dataclass(frozen=True)
+class BreakerResult(Generic[T]):
+    value: T
+    stale: bool
+    fetched_at: float
+
+    @property
+    def fetched_at_str(self) -> str:
+        return datetime.fromtimestamp(self.fetched_at).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class CircuitBreaker:
+    """
+    외부 API별 서킷 브레이커.
+
+    연속 실패가 failure_threshold에 도달하면 회로를 열고 reset_timeout 동안 호출 없이 바로 실패합니다.
+    요청 키별 마지막 정상 응답을 보관해, 호출이 실패하거나 회로가 열려 있으면 이를 stale 표시와 함께
+    돌려주고, 재시도 시각이 되면 백그라운드에서 한 번만 재검증합니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 max_cached_responses: int = DEFAULT_MAX_CACHED_RESPONSES,
+                 excluded_exceptions: Tuple[Type[Exception], ...] = ()):
+        self.name = name
+        # 외부 API 장애가 아닌 예외 (예: 자체 호출량 제한). 실패로 세지 않습니다.
+        self.excluded_exceptions = excluded_exceptions
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_cached_responses = max_cached_responses
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._last_good: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._revalidating: set = set()
+
+        metrics.register_gauge(f"circuit_breaker.{name}.state", lambda: self.state)
+        metrics.register_gauge(f"circuit_breaker.{name}.cached_responses", lambda: len(self._last_good))
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.time() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def call(self, key: str, func: Callable[..., T], *args, **kwargs) -> BreakerResult[T]:
+        """func를 회로 상태에 따라 호출합니다. 실패하면 마지막 정상 응답을 stale로 반환합니다."""
+        if not self._acquire(key):
+            metrics.increment(f"circuit_breaker.{self.name}.rejected")
+            return self._serve_stale(key, func, args, kwargs)
+
+        try:
+            value = func(*args, **kwargs)
+        except self.excluded_exceptions as e:
+            self._release_trial()
+            return self._serve_stale(key, func, args, kwargs, cause=e, revalidate=False)
+        except Exception as e:
+            self._record_failure(e)
+            return self._serve_stale(key, func, args, kwargs, cause=e, revalidate=False)
+
+        self._record_success(key, value)
+        return BreakerResult(value=value, stale=False, fetched_at=time.time())
+
+    def _acquire(self, key: str) -> bool:
+        """지금 호출해도 되는지 판단합니다. 반개방 상태에서 보관된 응답이 있으면 백그라운드 재검증에 맡깁니다."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and key not in self._last_good and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def _record_success(self, key: str, value: Any) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("circuit %s closed", self.name)
+            self._state = CLOSED
+            self._failure_count = 0
+            self._trial_in_flight = False
+            self._last_good[key] = (value, time.time())
+            self._last_good.move_to_end(key)
+            while len(self._last_good) > self.max_cached_responses:
+                self._last_good.popitem(last=False)
+
+    def _release_trial(self) -> None:
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _record_failure(self, error: Exception) -> None:
+        metrics.increment(f"circuit_breaker.{self.name}.failures")
+        with self._lock:
+            self._failure_count += 1
+            was_trial = self._trial_in_flight
+            self._trial_in_flight = False
+            if was_trial or self._failure_count >= self.failure_threshold:
+                if self._state != OPEN or was_trial:
+                    logger.warning("circuit %s opened: %s", self.name, type(error).__name__)
+                self._state = OPEN
+                self._opened_at = time.time()
+
+    def _serve_stale(self, key: str, func: Callable[..., T], args: tuple, kwargs: Dict[str, Any],
+                     cause: Optional[Exception] = None, revalidate: bool = True) -> BreakerResult[T]:
+        with self._lock:
+            cached = self._last_good.get(key)
+        if cached is None:
+            if cause is not None:
+                raise cause
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        if revalidate:
+            self._revalidate_in_background(key, func, args, kwargs)
+        metrics.increment(f"circuit_breaker.{self.name}.stale_served")
+        value, fetched_at = cached
+        return BreakerResult(value=value, stale=True, fetched_at=fetched_at)
+
+    def _revalidate_in_background(self, key: str, func: Callable[..., T], args: tuple, kwargs: Dict[str, Any]) -> None:
+        """재시도 시각이 지난 경우에만, 키마다 하나의 재검증 호출을 백그라운드로 실행합니다."""
+        with self._lock:
+            if self._current_state() != HALF_OPEN or self._trial_in_flight or key in self._revalidating:
+                return
+            self._trial_in_flight = True
+            self._revalidating.add(key)
+
+        def revalidate():
+            metrics.increment(f"circuit_breaker.{self.name}.revalidations")
+            try:
+                value = func(*args, **kwargs)
+            except self.excluded_exceptions:
+                self._release_trial()
+            except Exception as e:
+                self._record_failure(e)
+            else:
+                self._record_success(key, value)
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=revalidate, name=f"{self.name}-revalidate", daemon=True).start()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """이름별로 공유되는 서킷 브레이커를 반환합니다."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, **kwargs)
+        return _breakers[name]
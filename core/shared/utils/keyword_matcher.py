@@ -0,0 +1,96 @@
+"""
+의도 분류와 관세 예측 대화에서 쓰는 키워드 목록을 하나의 Aho-Corasick 오토마톤으로 묶어,
+메시지를 한 번만 훑어 일치한 키워드 범주를 모두 찾습니다. 키워드와 입력은 소문자로 비교합니다.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+from core.shared.constants import (
+    TARIFF_PREDICTION_KEYWORDS, CUSTOMS_TRACKING_KEYWORDS, TARIFF_SESSION_KEYWORDS
+)
+from core.tariff_prediction.constants import (
+    OFF_TOPIC_KEYWORDS, TARIFF_CONTEXT_KEYWORDS, CORRECTION_KEYWORDS,
+    SESSION_TERMINATION_KEYWORDS, HS10_MORE_KEYWORDS, SUPPORTED_COUNTRIES
+)
+
+# 키워드 범주
+TARIFF_PREDICTION = "tariff_prediction"
+CUSTOMS_TRACKING = "customs_tracking"
+TARIFF_SESSION = "tariff_session"
+OFF_TOPIC = "off_topic"
+TARIFF_CONTEXT = "tariff_context"
+CORRECTION = "correction"
+SESSION_TERMINATION = "session_termination"
+HS10_MORE = "hs10_more"
+COUNTRY = "country"
+
+class KeywordAutomaton:
+    """여러 범주의 키워드를 담은 Aho-Corasick 오토마톤. 텍스트 길이에 비례하는 한 번의 순회로 모든 일치를 찾습니다."""
+
+    def __init__(self, keywords_by_category: Mapping[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, str]]] = [[]]
+        for category, keywords in keywords_by_category.items():
+            for keyword in keywords:
+                if keyword:
+                    self._add(category, keyword.lower())
+        self._build_fail_links()
+
+    def _add(self, category: str, keyword: str) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        if (category, keyword) not in self._outputs[state]:
+            self._outputs[state].append((category, keyword))
+
+    def _build_fail_links(self) -> None:
+        # 루트의 자식은 루트로 실패하고, 나머지는 너비 우선으로 부모의 실패 경로를 따라 연결합니다.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # 접미사로 끝나는 키워드도 같은 위치에서 일치한 것으로 봅니다.
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def find(self, text: str) -> Dict[str, Set[str]]:
+        """범주 → 일치한 키워드 집합을 반환합니다."""
+        matches: Dict[str, Set[str]] = {}
+        state = 0
+        for char in text.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for category, keyword in self._outputs[state]:
+                matches.setdefault(category, set()).add(keyword)
+        return matches
+
+    def categories(self, text: str) -> Set[str]:
+        return set(self.find(text))
+
+def build_keyword_matcher() -> KeywordAutomaton:
+    return KeywordAutomaton({
+        TARIFF_PREDICTION: TARIFF_PREDICTION_KEYWORDS,
+        CUSTOMS_TRACKING: CUSTOMS_TRACKING_KEYWORDS,
+        TARIFF_SESSION: TARIFF_SESSION_KEYWORDS,
+        OFF_TOPIC: OFF_TOPIC_KEYWORDS,
+        TARIFF_CONTEXT: TARIFF_CONTEXT_KEYWORDS,
+        CORRECTION: CORRECTION_KEYWORDS,
+        SESSION_TERMINATION: SESSION_TERMINATION_KEYWORDS,
+        HS10_MORE: HS10_MORE_KEYWORDS,
+        COUNTRY: SUPPORTED_COUNTRIES.keys(),
+    })
+
+keyword_matcher = build_keyword_matcher()
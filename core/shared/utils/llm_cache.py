@@ -0,0 +1,198 @@
+"""
+같은 입력에 대한 LLM 도우미 호출 결과를 재사용하는 메모 캐시.
+
+키는 (도구 이름, 프롬프트 템플릿 해시, 정규화한 입력)이므로 템플릿을 고치면 이전 결과는 자동으로 쓰이지 않고
+TTL/LRU로 밀려납니다. 값은 JSON으로 저장하며, 여러 워커가 결과를 공유하려면 sqlite 백엔드를 사용합니다.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from core.shared.utils.metrics import metrics
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+BACKEND_OFF = "off"
+
+MISS = object()
+
+def normalize_cache_input(text: str) -> str:
+    """전각/반각, 대소문자, 공백 차이만 있는 입력이 같은 키가 되도록 정규화합니다."""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFKC', text or '')).strip().casefold()
+
+def template_version(template: str) -> str:
+    return hashlib.sha256(template.encode('utf-8')).hexdigest()[:12]
+
+def cache_key(tool_name: str, template: str, user_input: str) -> str:
+    return f"{tool_name}:{template_version(template)}:{normalize_cache_input(user_input)}"
+
+class InMemoryLLMCache:
+    """프로세스 내부 LRU 캐시. 저장 후 ttl_seconds가 지난 항목과 max_entries를 넘는 오래된 항목을 지웁니다."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            created_at, data = entry
+            if time.time() - created_at > self.ttl_seconds:
+                del self._entries[key]
+                return MISS
+            self._entries.move_to_end(key)
+        return json.loads(data)
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._entries[key] = (time.time(), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache (created_at);
+"""
+
+class SqliteLLMCache:
+    """
+    로컬 SQLite 캐시. 같은 파일을 쓰는 워커끼리 결과를 공유하고 재시작 후에도 유지됩니다.
+    만료 항목은 purge_interval마다 지우고, 항목 수는 trim_every번 저장할 때마다 세어 max_entries로 줄이므로
+    워커마다 최대 trim_every - 1개까지 max_entries를 넘을 수 있습니다.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float, max_entries: int, purge_interval: float = 300,
+                 trim_every: Optional[int] = None):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.purge_interval = purge_interval
+        # 기본은 max_entries의 1/10 (1~100)
+        self.trim_every = trim_every or max(1, min(100, max_entries // 10))
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._next_purge_at = 0.0
+        self._puts_since_trim = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Any:
+        row = self._connect().execute(
+            "SELECT value FROM llm_cache WHERE cache_key = ? AND created_at >= ?",
+            (key, time.time() - self.ttl_seconds),
+        ).fetchone()
+        return json.loads(row[0]) if row else MISS
+
+    def put(self, key: str, value: Any) -> None:
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO llm_cache (cache_key, value, created_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(cache_key) DO UPDATE SET value = excluded.value, created_at = excluded.created_at",
+            (key, json.dumps(value, ensure_ascii=False), now),
+        )
+        self._puts_since_trim += 1
+        if now >= self._next_purge_at:
+            self._next_purge_at = now + self.purge_interval
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._trim(conn)
+        elif self._puts_since_trim >= self.trim_every:
+            self._trim(conn)
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """max_entries를 넘으면 오래된 항목부터 지워 max_entries만 남깁니다."""
+        self._puts_since_trim = 0
+        if conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] <= self.max_entries:
+            return
+        conn.execute(
+            "DELETE FROM llm_cache WHERE cache_key IN "
+            "(SELECT cache_key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+class LLMMemo:
+    """
+    LLM 도우미 앞에 두는 메모 캐시. compute가 예외를 던지면 저장하지 않으므로,
+    실패 시 대체값을 돌려주는 도구는 대체값을 compute 밖에서 처리해야 합니다.
+    """
+
+    def __init__(self, cache=None, metric_prefix: str = "llm_cache"):
+        self.cache = cache
+        self.metric_prefix = metric_prefix
+        metrics.register_gauge(f"{metric_prefix}.hit_rate", self.hit_rate)
+        metrics.register_gauge(f"{metric_prefix}.size", lambda: len(self.cache) if self.cache is not None else 0)
+
+    def get_or_compute(self, tool_name: str, template: str, user_input: str, compute: Callable[[], Any]) -> Any:
+        if self.cache is None:
+            return compute()
+        key = cache_key(tool_name, template, user_input)
+        try:
+            value = self.cache.get(key)
+        except (sqlite3.Error, ValueError):
+            value = MISS
+        if value is not MISS:
+            self._count(tool_name, "hit")
+            return value
+        self._count(tool_name, "miss")
+        value = compute()
+        try:
+            self.cache.put(key, value)
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+        return value
+
+    def _count(self, tool_name: str, outcome: str) -> None:
+        metrics.increment(f"{self.metric_prefix}.{outcome}")
+        metrics.increment(f"{self.metric_prefix}.{tool_name}.{outcome}")
+
+    def hit_rate(self) -> Optional[float]:
+        hits = metrics.get_counter(f"{self.metric_prefix}.hit")
+        total = hits + metrics.get_counter(f"{self.metric_prefix}.miss")
+        return round(hits / total, 3) if total else None
+
+def create_llm_memo(backend: str, db_path: str, ttl_seconds: float, max_entries: int,
+                    metric_prefix: str = "llm_cache") -> LLMMemo:
+    """backend가 off이면 항상 LLM을 호출하는 메모를 반환합니다."""
+    if backend == BACKEND_SQLITE:
+        return LLMMemo(SqliteLLMCache(db_path, ttl_seconds, max_entries), metric_prefix)
+    if backend == BACKEND_MEMORY:
+        return LLMMemo(InMemoryLLMCache(ttl_seconds, max_entries), metric_prefix)
+    if backend == BACKEND_OFF:
+        return LLMMemo(None, metric_prefix)
+    raise ValueError(f"지원하지 않는 LLM 캐시 백엔드입니다: {backend}")
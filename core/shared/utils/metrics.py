@@ -0,0 +1,44 @@
+import threading
+from typing import Any, Callable, Dict
+
+
+class MetricsRegistry:
+    """프로세스 단위 카운터/게이지 저장소. /metrics 엔드포인트로 노출됩니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, Any] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], Any]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: Any) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def register_gauge(self, name: str, callback: Callable[[], Any]) -> None:
+        """조회 시점에 값을 계산하는 게이지를 등록합니다."""
+        with self._lock:
+            self._gauge_callbacks[name] = callback
+
+    def get_counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            callbacks = dict(self._gauge_callbacks)
+        for name, callback in callbacks.items():
+            try:
+                gauges[name] = callback()
+            except Exception as e:
+                gauges[name] = f"error: {e}"
+        return {"counters": counters, "gauges": gauges}
+
+
+metrics = MetricsRegistry()
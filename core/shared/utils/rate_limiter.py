@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows 등: 프로세스 내부에서만 공유
+    FCNTL_AVAILABLE = False
+
+from core.shared.utils.metrics import metrics
+
+MODE_QUEUE = "queue"
+MODE_REJECT = "reject"
+
+
+class RateLimitExceeded(Exception):
+    """허용량을 넘어 요청을 보낼 수 없는 경우 발생합니다."""
+
+
+class FileTokenBucket:
+    """
+    파일에 상태를 두어 여러 워커 프로세스가 함께 쓰는 토큰 버킷.
+
+    초당 rate_per_second개씩 최대 burst개까지 토큰이 차오르며, daily_quota가 있으면 하루 사용량도 제한합니다.
+    queue 모드는 토큰이 찰 때까지 최대 max_wait초 기다리고, reject 모드는 즉시 RateLimitExceeded를 발생시킵니다.
+    """
+
+    def __init__(self, name: str, state_path: str, rate_per_second: float, burst: int,
+                 daily_quota: int = 0, mode: str = MODE_QUEUE, max_wait: float = 3.0):
+        self.name = name
+        self.state_path = state_path
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.daily_quota = daily_quota
+        self.mode = mode
+        self.max_wait = max_wait
+        self._thread_lock = threading.Lock()
+
+        metrics.register_gauge(f"rate_limiter.{name}.daily_usage", lambda: self.usage()["daily_count"])
+        metrics.register_gauge(f"rate_limiter.{name}.tokens", lambda: round(self.usage()["tokens"], 2))
+
+    def acquire(self) -> None:
+        """토큰 하나를 사용합니다. 허용량을 넘으면 RateLimitExceeded를 발생시킵니다."""
+        deadline = time.monotonic() + (self.max_wait if self.mode == MODE_QUEUE else 0)
+        queued = False
+        while True:
+            wait = self._try_take()
+            if wait == 0:
+                metrics.increment(f"rate_limiter.{self.name}.acquired")
+                return
+            if time.monotonic() + wait > deadline:
+                metrics.increment(f"rate_limiter.{self.name}.rejected")
+                raise RateLimitExceeded(f"{self.name} rate limit exceeded")
+            if not queued:
+                queued = True
+                metrics.increment(f"rate_limiter.{self.name}.queued")
+            metrics.increment(f"rate_limiter.{self.name}.wait_seconds", wait)
+            time.sleep(wait)
+
+    def usage(self) -> Dict[str, Any]:
+        """현재 토큰 수와 하루 사용량을 반환합니다. 공유 잠금으로 읽기만 하고 상태 파일은 고치지 않습니다."""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(f, fcntl.LOCK_SH)
+                try:
+                    raw = f.read()
+                finally:
+                    if FCNTL_AVAILABLE:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+        except FileNotFoundError:
+            raw = ""
+        return self._refill(self._load(raw))
+
+    def _try_take(self) -> float:
+        """토큰을 얻으면 0을, 아니면 다음 토큰까지 기다릴 시간을 반환합니다."""
+        with self._locked_state() as state:
+            if self.daily_quota and state["daily_count"] >= self.daily_quota:
+                metrics.increment(f"rate_limiter.{self.name}.daily_quota_exhausted")
+                raise RateLimitExceeded(f"{self.name} daily quota exhausted")
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                state["daily_count"] += 1
+                return 0
+            return (1 - state["tokens"]) / self.rate_per_second
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, Any]]:
+        """상태 파일을 배타적으로 잠근 채 토큰을 채운 상태를 넘겨주고, 블록이 끝나면 저장합니다."""
+        with self._thread_lock:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            with open(self.state_path, "a+", encoding="utf-8") as f:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    state = self._refill(self._load(f.read()))
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    if FCNTL_AVAILABLE:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load(self, raw: str) -> Dict[str, Any]:
+        try:
+            state = json.loads(raw)
+            if isinstance(state, dict) and {"tokens", "updated_at", "day", "daily_count"} <= state.keys():
+                return state
+        except ValueError:
+            pass
+        return {"tokens": float(self.burst), "updated_at": time.time(), "day": _today(), "daily_count": 0}
+
+    def _refill(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.time()
+        elapsed = max(0.0, now - state["updated_at"])
+        state["tokens"] = min(float(self.burst), state["tokens"] + elapsed * self.rate_per_second)
+        state["updated_at"] = now
+        if state["day"] != _today():
+            state["day"] = _today()
+            state["daily_count"] = 0
+        return state
+
+
+def _today() -> str:
+    return datetime.now().strftime("%Y%m%d")
+
+
+def create_rate_limiter(name: str, state_path: str, rate_per_second: float, burst: int,
+                        daily_quota: int = 0, mode: str = MODE_QUEUE,
+                        max_wait: float = 3.0) -> Optional[FileTokenBucket]:
+    """rate_per_second가 0 이하이면 제한을 두지 않습니다(None)."""
+    if rate_per_second <= 0:
+        return None
+    return FileTokenBucket(name, state_path, rate_per_second, burst, daily_quota, mode, max_wait)
@@ -0,0 +1,140 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from core.tariff_prediction.constants.session_config import (
+    TARIFF_SESSION_BACKEND, TARIFF_SESSION_DB_PATH, TARIFF_SESSION_TTL_SECONDS,
+    TARIFF_SESSION_MAX_SESSIONS, TARIFF_SESSION_PURGE_INTERVAL
+)
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+
+# 저장하지 않는 상태 키: responses는 대화가 길어질수록 커지고 다음 턴 처리에 쓰이지 않습니다.
+TRANSIENT_STATE_KEYS = ('responses',)
+
+def serialize_state(state: Dict[str, Any]) -> str:
+    return json.dumps(
+        {key: value for key, value in state.items() if key not in TRANSIENT_STATE_KEYS},
+        ensure_ascii=False, separators=(',', ':'), default=str
+    )
+
+def deserialize_state(data: str) -> Dict[str, Any]:
+    state = json.loads(data)
+    state.setdefault('responses', [])
+    return state
+
+class InMemorySessionStore:
+    """프로세스 내부 LRU 세션 저장소. ttl_seconds 동안 사용하지 않은 세션과 max_sessions를 넘는 오래된 세션을 지웁니다."""
+
+    def __init__(self, ttl_seconds: float = TARIFF_SESSION_TTL_SECONDS,
+                 max_sessions: int = TARIFF_SESSION_MAX_SESSIONS):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            updated_at, data = entry
+            if time.time() - updated_at > self.ttl_seconds:
+                del self._sessions[session_id]
+                return None
+            self._sessions.move_to_end(session_id)
+        return deserialize_state(data)
+
+    def put(self, session_id: str, state: Dict[str, Any]) -> None:
+        data = serialize_state(state)
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = (now, data)
+            self._sessions.move_to_end(session_id)
+            # 가장 오래 쓰지 않은 세션부터 만료 또는 개수 초과 여부를 확인합니다.
+            while self._sessions:
+                oldest_id, (updated_at, _) = next(iter(self._sessions.items()))
+                if len(self._sessions) <= self.max_sessions and now - updated_at <= self.ttl_seconds:
+                    break
+                del self._sessions[oldest_id]
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tariff_session (
+    session_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tariff_session_updated ON tariff_session (updated_at);
+"""
+
+class SqliteSessionStore:
+    """세션 상태를 로컬 SQLite에 저장합니다. 같은 파일을 쓰는 여러 워커가 세션을 공유합니다."""
+
+    def __init__(self, db_path: str = TARIFF_SESSION_DB_PATH, ttl_seconds: float = TARIFF_SESSION_TTL_SECONDS,
+                 purge_interval: float = TARIFF_SESSION_PURGE_INTERVAL):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._next_purge_at = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT state FROM tariff_session WHERE session_id = ? AND updated_at >= ?",
+            (session_id, time.time() - self.ttl_seconds),
+        ).fetchone()
+        return deserialize_state(row[0]) if row else None
+
+    def put(self, session_id: str, state: Dict[str, Any]) -> None:
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO tariff_session (session_id, state, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at",
+            (session_id, serialize_state(state), now),
+        )
+        if now >= self._next_purge_at:
+            self._next_purge_at = now + self.purge_interval
+            conn.execute("DELETE FROM tariff_session WHERE updated_at < ?", (now - self.ttl_seconds,))
+
+    def delete(self, session_id: str) -> None:
+        self._connect().execute("DELETE FROM tariff_session WHERE session_id = ?", (session_id,))
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM tariff_session").fetchone()[0]
+
+def create_session_store(backend: str = TARIFF_SESSION_BACKEND):
+    """여러 워커로 실행할 때는 sqlite 백엔드를 사용해야 같은 세션이 워커 사이에서 이어집니다."""
+    if backend == BACKEND_SQLITE:
+        return SqliteSessionStore()
+    if backend != BACKEND_MEMORY:
+        raise ValueError(f"지원하지 않는 세션 저장소입니다: {backend}")
+    return InMemorySessionStore()
@@ -1,66 +1,100 @@
 from core.tariff_prediction.dto.tariff_request import TariffPredictionRequest
 from core.tariff_prediction.dto.tariff_response import TariffPredictionResponse
-from core.tariff_prediction.tools.get_hs_classification import get_hs_classification
-from core.tariff_prediction.tools.parse_hs_results import parse_hs6_result, generate_hs10_candidates
-from core.tariff_prediction.tools.calculate_tariff_amount import calculate_tariff_amount
-from core.tariff_prediction.tools.parse_tariff_result import parse_tariff_result
+from core.tariff_prediction.tools.get_hs_classification import classify_hs_code
+from core.tariff_prediction.tools.parse_hs_results import hs6_candidates_from_results, list_hs10_candidates
+from core.tariff_prediction.tools.calculate_tariff_amount import compute_tariff_amount, TariffCalculationError
+from core.tariff_prediction.tools.parse_tariff_result import tariff_result_to_dict
+from core.tariff_prediction.tools.rank_hs10_candidates import rank_hs10_candidates, paginate_candidates
 from core.shared.utils.llm import get_llm
+from core.shared.utils.metrics import metrics
+from core.tariff_prediction.agent.step_classifier import classify_step, fill_codes_for_step
 from core.tariff_prediction.constants import LLM_PROMPT_TEMPLATES, STEP_API
+from core.tariff_prediction.constants.model_config import HS10_CANDIDATES_PAGE_SIZE
+from core.tariff_prediction.data.hs_prefix_trie import normalize_hs_prefix
 
-def tariff_prediction_step_api(req: TariffPredictionRequest) -> TariffPredictionResponse:
-    step = req.step
-    if not step or step == STEP_API['AUTO_STEP']:
+STEP_CHOICES = (STEP_API['INPUT_STEP'], STEP_API['HS6_SELECT_STEP'], STEP_API['HS10_SELECT_STEP'])
+
+def resolve_auto_step(req: TariffPredictionRequest) -> str:
+    """규칙으로 단계를 판단하고, 신뢰도가 낮을 때만 LLM에 묻습니다."""
+    step, confidence = classify_step(req)
+    user_input = req.product_description or req.hs6_code or req.hs10_code or ''
+    if confidence >= STEP_API['CLASSIFIER_MIN_CONFIDENCE'] or not user_input.strip():
+        metrics.increment("tariff_step.classifier.rule")
+        return step
+    metrics.increment("tariff_step.classifier.llm")
+    try:
         llm = get_llm()
-        user_input = req.product_description or req.hs6_code or req.hs10_code or ''
         step_prompt = LLM_PROMPT_TEMPLATES['step_classification'].format(user_input=user_input)
         step_result = llm.invoke([{"role": "system", "content": step_prompt}])
-        step = str(getattr(step_result, 'content', step_result)).strip()
+        llm_step = str(getattr(step_result, 'content', step_result)).strip()
+    except Exception:
+        metrics.increment("tariff_step.classifier.llm_failed")
+        return step
+    # LLM이 정해진 단계 이외의 답을 하면 규칙 판단을 사용합니다.
+    if llm_step not in STEP_CHOICES:
+        metrics.increment("tariff_step.classifier.llm_failed")
+        return step
+    return llm_step
+
+def resolve_step(req: TariffPredictionRequest) -> TariffPredictionRequest:
+    """auto 단계를 판단하고 HS 코드 필드를 숫자만 남긴 요청을 반환합니다. 반환한 요청의 step은 항상 구체적인 단계입니다."""
+    if not req.step or req.step == STEP_API['AUTO_STEP']:
+        step = resolve_auto_step(req)
+        req = fill_codes_for_step(req, step).model_copy(update={'step': step})
+    # '8517.62-0000'처럼 구분자가 섞인 코드는 관세율·HS10 조회 전에 숫자만 남깁니다.
+    return req.model_copy(update={
+        'hs6_code': normalize_hs_prefix(req.hs6_code) or None,
+        'hs10_code': normalize_hs_prefix(req.hs10_code) or None,
+    })
+
+def tariff_prediction_step_api(req: TariffPredictionRequest) -> TariffPredictionResponse:
+    req = resolve_step(req)
+    step = req.step
     if step == STEP_API['INPUT_STEP']:
         # 상품 설명 → HS6 후보 예측
-        hs6_result = get_hs_classification(req.product_description)
-        hs6_candidates = parse_hs6_result(hs6_result)
+        hs6_candidates = hs6_candidates_from_results(classify_hs_code(req.product_description) or [])
         return TariffPredictionResponse(
             step=STEP_API['HS6_SELECT_STEP'],
             hs6_candidates=hs6_candidates,
             message=STEP_API['HS6_SELECTION_MESSAGE']
         )
     elif step == STEP_API['HS6_SELECT_STEP']:
-        # HS6 코드 → HS10 후보 추출
-        hs10_candidates = generate_hs10_candidates(req.hs6_code)
+        # HS6 코드 → HS10 후보 추출 (상품 설명이 있으면 품목명 유사도 순으로 정렬)
+        hs10_candidates = rank_hs10_candidates(list_hs10_candidates(req.hs6_code), req.product_description)
+        page_size = req.page_size or HS10_CANDIDATES_PAGE_SIZE
         return TariffPredictionResponse(
             step=STEP_API['HS10_SELECT_STEP'],
-            hs10_candidates=hs10_candidates,
+            hs10_candidates=paginate_candidates(hs10_candidates, req.page, page_size),
+            hs10_total=len(hs10_candidates),
             message=STEP_API['HS10_SELECTION_MESSAGE']
         )
     elif step == STEP_API['HS10_SELECT_STEP']:
         # HS10 코드, 국가, 가격 등 입력받아 관세 계산
-        result = calculate_tariff_amount.invoke({
-            "product_code": req.hs10_code,
-            "value": req.price,
-            "origin_country": req.origin_country,
-            "item_count": req.quantity,
-            "shipping_cost": req.shipping_cost,
-            "situation": req.scenario
-        })
-    
-        # 결과를 문자열로 변환
-        result_str = str(result)
-        
-        if any(keyword in result_str for keyword in STEP_API['ERROR_KEYWORDS']):
+        if not req.hs10_code or not req.origin_country or req.price is None:
             return TariffPredictionResponse(
-                step=STEP_API['RESULT_STEP'],
-                calculation_result=None,
-                message=result_str
+                step=STEP_API['HS10_SELECT_STEP'],
+                message=STEP_API['CALCULATION_INPUT_REQUIRED_MESSAGE']
             )
-        else:
-            parsed_result = parse_tariff_result(result_str)
-            formatted_result = parsed_result['formatted_result']
-            
+        try:
+            result = compute_tariff_amount(
+                req.hs10_code, req.price, req.origin_country,
+                item_count=req.quantity, shipping_cost=req.shipping_cost, situation=req.scenario
+            )
+        except TariffCalculationError as e:
+            return TariffPredictionResponse(step=STEP_API['RESULT_STEP'], calculation_result=None, message=str(e))
+        except Exception as e:
             return TariffPredictionResponse(
                 step=STEP_API['RESULT_STEP'],
-                calculation_result=parsed_result, 
-                message=formatted_result
+                calculation_result=None,
+                message=f"관세 계산 중 오류 발생: {str(e)}"
             )
+
+        calculation_result = tariff_result_to_dict(result)
+        return TariffPredictionResponse(
+            step=STEP_API['RESULT_STEP'],
+            calculation_result=calculation_result,
+            message=calculation_result['formatted_result']
+        )
     else:
         return TariffPredictionResponse(
             step=STEP_API['HS6_SELECT_STEP'],
@@ -0,0 +1,57 @@
+import re
+from typing import Optional, Tuple
+
+from core.tariff_prediction.constants import STEP_API
+from core.tariff_prediction.dto.tariff_request import TariffPredictionRequest
+
+_CODE_ONLY = re.compile(r"\d{4}[.\-]?\d{2}(?:[.\-]?\d{4})?")
+_EMBEDDED_CODE = re.compile(r"(?<!\d)\d{4}[.\-]?\d{2}(?:[.\-]?\d{4})?(?!\d)")
+
+def _digits(code: Optional[str]) -> str:
+    return re.sub(r"\D", "", code or "")
+
+def classify_step(req: TariffPredictionRequest) -> Tuple[str, float]:
+    """
+    요청에 채워진 필드와 코드 자릿수(6/10)로 단계를 판단해 (단계, 신뢰도)를 반환합니다.
+    신뢰도가 STEP_API['CLASSIFIER_MIN_CONFIDENCE']보다 낮으면 LLM 단계 분류를 사용합니다.
+    """
+    hs10_digits = _digits(req.hs10_code)
+    hs6_digits = _digits(req.hs6_code)
+    has_calculation_inputs = bool(req.origin_country) and req.price is not None
+
+    # 원산지와 가격이 없으면 관세를 계산할 수 없으므로 hs10_select로 확신하지 않습니다.
+    if len(hs10_digits) == 10:
+        return STEP_API['HS10_SELECT_STEP'], 1.0 if has_calculation_inputs else 0.5
+    if len(hs6_digits) == 6:
+        return STEP_API['HS6_SELECT_STEP'], 1.0
+    # 코드가 다른 필드에 들어온 경우
+    if len(hs6_digits) == 10:
+        return STEP_API['HS10_SELECT_STEP'], 0.8 if has_calculation_inputs else 0.5
+    if len(hs10_digits) == 6:
+        return STEP_API['HS6_SELECT_STEP'], 0.8
+
+    description = (req.product_description or "").strip()
+    if not description:
+        return STEP_API['INPUT_STEP'], 0.0
+    if _CODE_ONLY.fullmatch(description):
+        # 상품 설명 자리에 코드만 들어온 경우
+        if len(_digits(description)) == 10:
+            return STEP_API['HS10_SELECT_STEP'], 0.8 if has_calculation_inputs else 0.5
+        return STEP_API['HS6_SELECT_STEP'], 0.8
+    if _EMBEDDED_CODE.search(description):
+        # 설명 속에 코드가 섞여 있으면 상품 설명인지 코드 선택인지 모호합니다.
+        return STEP_API['INPUT_STEP'], 0.4
+    return STEP_API['INPUT_STEP'], 0.9
+
+def fill_codes_for_step(req: TariffPredictionRequest, step: str) -> TariffPredictionRequest:
+    """자동 판단한 단계에 맞는 코드 필드가 비어 있으면 다른 필드에 들어온 같은 자릿수의 코드로 채웁니다."""
+    field, length = {
+        STEP_API['HS6_SELECT_STEP']: ('hs6_code', 6),
+        STEP_API['HS10_SELECT_STEP']: ('hs10_code', 10),
+    }.get(step, (None, 0))
+    if field is None or len(_digits(getattr(req, field))) == length:
+        return req
+    for value in (req.hs6_code, req.hs10_code, req.product_description):
+        if value and _CODE_ONLY.fullmatch(value.strip()) and len(_digits(value)) == length:
+            return req.model_copy(update={field: _digits(value)})
+    return req
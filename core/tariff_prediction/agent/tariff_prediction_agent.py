@@ -2,38 +2,48 @@ from typing import Dict, Any, List
 import re
 
 from core.shared.states.states import CustomsAgentState
-from core.tariff_prediction.tools.calculate_tariff_amount import calculate_tariff_amount
+from core.shared.utils.keyword_matcher import (
+    keyword_matcher, CORRECTION, HS10_MORE, OFF_TOPIC, SESSION_TERMINATION, TARIFF_CONTEXT
+)
+from core.tariff_prediction.tools.calculate_tariff_amount import compute_tariff_amount
 from core.tariff_prediction.tools.detect_scenario import detect_scenario_from_input
 from core.tariff_prediction.tools.parse_user_input import parse_user_input
-from core.tariff_prediction.tools.parse_hs_results import parse_hs6_result, generate_hs10_candidates
-from core.tariff_prediction.tools.parse_tariff_result import parse_tariff_result
+from core.tariff_prediction.tools.parse_hs_results import parse_hs6_result, list_hs10_candidates
+from core.tariff_prediction.tools.parse_tariff_result import parse_tariff_result, render_tariff_markdown
+from core.tariff_prediction.tools.rank_hs10_candidates import rank_hs10_candidates
+from core.tariff_prediction.tools.search_hs6_candidates import search_hs6_candidates
 from core.tariff_prediction.constants import (
-    SUPPORTED_COUNTRIES, OFF_TOPIC_KEYWORDS, CORRECTION_KEYWORDS, 
-    SESSION_TERMINATION_KEYWORDS, SIMPLE_TARIFF_REQUESTS, 
-    TARIFF_CONTEXT_KEYWORDS, DEFAULT_EXCHANGE_RATES,
+    SUPPORTED_COUNTRIES, SIMPLE_TARIFF_REQUESTS, DEFAULT_EXCHANGE_RATES,
     DEFAULT_COUNTRY, DEFAULT_QUANTITY, DEFAULT_SHIPPING_COST, DEFAULT_SESSION_ID,
     ERROR_MESSAGES, CORRECTION_MESSAGES, RESPONSE_MESSAGES, STATE_KEYS, STEPS, LLM_PROMPTS
 )
 from core.tariff_prediction.tools.context_utils import extract_llm_response, extract_info_from_context, merge_context_with_current
 from core.tariff_prediction.agent.step_api import tariff_prediction_step_api
+from core.tariff_prediction.agent.session_store import create_session_store
 from core.tariff_prediction.dto.tariff_request import TariffPredictionRequest
-from core.tariff_prediction.dto.tariff_response import TariffPredictionResponse
+from core.tariff_prediction.dto.tariff_response import TariffPredictionResponse, TariffCalculationResult
 
 # 전역 워크플로우 매니저
 class WorkflowManager:
-    def __init__(self):
-        self.sessions = {}
+    """세션별 워크플로우 상태를 세션 저장소에서 불러오고, 한 턴을 처리한 뒤 다시 저장합니다."""
+    def __init__(self, store=None):
+        self.store = store if store is not None else create_session_store()
     
     def get_session(self, session_id: str) -> 'TariffPredictionWorkflow':
         """세션을 가져오거나 새로 생성합니다."""
-        if session_id not in self.sessions:
-            self.sessions[session_id] = TariffPredictionWorkflow()
-        return self.sessions[session_id]
+        workflow = TariffPredictionWorkflow()
+        state = self.store.get(session_id)
+        if state is not None:
+            workflow.state.update(state)
+        return workflow
+    
+    def save_session(self, session_id: str, workflow: 'TariffPredictionWorkflow'):
+        """워크플로우 상태를 저장합니다."""
+        self.store.put(session_id, workflow.state)
     
     def cleanup_session(self, session_id: str):
         """세션을 정리합니다."""
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        self.store.delete(session_id)
 
 # 전역 매니저 인스턴스
 workflow_manager = WorkflowManager()
@@ -94,7 +104,7 @@ class TariffPredictionWorkflow:
 
     def handle_correction_request(self, user_input: str) -> str:
         """수정 요청을 처리합니다."""
-        if any(word in user_input for word in CORRECTION_KEYWORDS):
+        if CORRECTION in keyword_matcher.categories(user_input):
             if self.state['current_step'] == 'scenario_selection':
                 return CORRECTION_MESSAGES['scenario_selection']
             elif self.state['current_step'] == 'input_collection':
@@ -109,8 +119,7 @@ class TariffPredictionWorkflow:
 
     def is_off_topic(self, user_input: str) -> bool:
         """관세 계산과 관련 없는 주제인지 확인합니다."""
-        input_lower = user_input.lower()
-        return any(keyword in input_lower for keyword in OFF_TOPIC_KEYWORDS)
+        return OFF_TOPIC in keyword_matcher.categories(user_input)
 
     def process_user_input(self, user_input: str) -> str:
         current_query = user_input
@@ -119,12 +128,12 @@ class TariffPredictionWorkflow:
             if len(parts) > 1:
                 current_query = parts[1].strip()
         
-        if any(word in current_query for word in SESSION_TERMINATION_KEYWORDS):
+        if SESSION_TERMINATION in keyword_matcher.categories(current_query):
             self.reset_session()
             return ERROR_MESSAGES['session_terminated']
 
         if self.state['session_active']:
-            has_tariff_context = any(keyword in user_input.lower() for keyword in TARIFF_CONTEXT_KEYWORDS)
+            has_tariff_context = TARIFF_CONTEXT in keyword_matcher.categories(user_input)
             
             if not has_tariff_context and self.is_off_topic(current_query):
                 return RESPONSE_MESSAGES['off_topic_warning']
@@ -291,19 +300,15 @@ class TariffPredictionWorkflow:
             if 1 <= selection <= len(candidates):
                 selected = candidates[selection - 1]
                 self.state['hs6_code'] = selected['code']
-                req = TariffPredictionRequest(
-                    step=STEPS['hs6_select'],
-                    hs6_code=selected['code']
-                )
-                resp: TariffPredictionResponse = tariff_prediction_step_api(req)
+                resp: TariffPredictionResponse = self._fetch_hs10_page(1)
                 if resp.message and (not resp.hs10_candidates):
                     self.state['responses'].append(resp.message)
                     return resp.message
                 self.state['hs10_candidates'] = resp.hs10_candidates
+                self.state['hs10_page'] = 1
+                self.state['hs10_total'] = resp.hs10_total
                 self.state['current_step'] = STEPS['hs10_selection']
-                response = f"{RESPONSE_MESSAGES['hs6_code_selected']} {selected['code']}\n\n{RESPONSE_MESSAGES['hs10_code_prediction_prompt']}\n" + '\n'.join([
-                    f"{i+1}. {c['code']} - {c['description']}" for i, c in enumerate(resp.hs10_candidates or [])
-                ]) + f"\n\n{RESPONSE_MESSAGES['hs10_code_selection_prompt']}\n예시: \"1번\", \"2번\", \"3번\" 등"
+                response = f"{RESPONSE_MESSAGES['hs6_code_selected']} {selected['code']}\n\n{RESPONSE_MESSAGES['hs10_code_prediction_prompt']}\n" + self._format_hs10_candidates(resp.hs10_candidates) + f"\n\n{RESPONSE_MESSAGES['hs10_code_selection_prompt']}\n예시: \"1번\", \"2번\", \"3번\" 등" + self._hs10_more_hint()
                 self.state['responses'].append(response)
                 return response
             else:
@@ -334,7 +339,7 @@ class TariffPredictionWorkflow:
 
     def generate_hs10_candidates(self, hs6_code: str) -> List[Dict]:
         """HS10 후보를 생성합니다."""
-        return generate_hs10_candidates(hs6_code)
+        return list_hs10_candidates(hs6_code)
 
     def format_hs10_candidates(self) -> str:
         """HS10 후보를 포맷팅합니다."""
@@ -343,7 +348,47 @@ class TariffPredictionWorkflow:
             formatted += f"{i}. {candidate['code']} - {candidate['description']}\n"
         return formatted
 
+    def _fetch_hs10_page(self, page: int) -> TariffPredictionResponse:
+        """선택한 HS6 아래 HS10 후보 중 상품명과 가까운 순으로 page번째 페이지를 가져옵니다."""
+        req = TariffPredictionRequest(
+            step=STEPS['hs6_select'],
+            hs6_code=self.state['hs6_code'],
+            product_description=self.state.get('product_name'),
+            page=page
+        )
+        return tariff_prediction_step_api(req)
+
+    def _format_hs10_candidates(self, candidates: List[Dict], start: int = 0) -> str:
+        return '\n'.join([f"{start + i}. {c['code']} - {c['description']}" for i, c in enumerate(candidates, 1)])
+
+    def _hs10_more_hint(self) -> str:
+        shown = len(self.state.get('hs10_candidates') or [])
+        total = self.state.get('hs10_total') or shown
+        if shown >= total:
+            return ""
+        return "\n" + RESPONSE_MESSAGES['hs10_more_hint'].format(total=total, shown=shown)
+
+    def _show_more_hs10_candidates(self) -> str:
+        """다음 페이지 후보를 기존 목록 뒤에 이어 붙여 번호가 이어지도록 보여 줍니다."""
+        shown = self.state.get('hs10_candidates') or []
+        more = []
+        if len(shown) < (self.state.get('hs10_total') or 0):
+            page = (self.state.get('hs10_page') or 1) + 1
+            more = self._fetch_hs10_page(page).hs10_candidates or []
+            self.state['hs10_page'] = page
+        if not more:
+            response = f"{RESPONSE_MESSAGES['hs10_no_more_candidates']}\n\n{RESPONSE_MESSAGES['hs10_code_selection_prompt']}"
+            self.state['responses'].append(response)
+            return response
+        self.state['hs10_candidates'] = shown + more
+        response = self._format_hs10_candidates(more, start=len(shown)) + f"\n\n{RESPONSE_MESSAGES['hs10_code_selection_prompt']}\n예시: \"1번\", \"2번\", \"3번\" 등" + self._hs10_more_hint()
+        self.state['responses'].append(response)
+        return response
+
     def handle_hs10_selection(self, user_input: str) -> str:
+        if HS10_MORE in keyword_matcher.categories(user_input):
+            return self._show_more_hs10_candidates()
+
         number_match = re.search(r'(\d+)', user_input)
         
         if number_match and self.state.get('hs10_candidates'):
@@ -399,6 +444,11 @@ class TariffPredictionWorkflow:
             self.state['responses'].append(response)
             return response
         try:
+            # 로컬 HS6 색인으로 먼저 찾고, 색인이 없을 때만 LLM에 예측을 요청합니다.
+            shown_codes = [c.get('code') for c in self.state.get('hs6_candidates') or []]
+            hs6_candidates = search_hs6_candidates(product_name, user_input, exclude_codes=shown_codes)
+            if hs6_candidates:
+                return self._respond_hs6_reprediction(product_name, hs6_candidates)
             reprediction_prompt = f"{LLM_PROMPTS['hs6_reprediction_prompt']}\n\n{LLM_PROMPTS['product_name']}: {product_name}\n{LLM_PROMPTS['user_additional_opinion']}: {user_input}\n\n{LLM_PROMPTS['hs6_reprediction_format']}\n{LLM_PROMPTS['hs6_reprediction_example']}"
             llm = get_llm()
             hs6_response = llm.invoke([{"role": "user", "content": reprediction_prompt}])
@@ -417,21 +467,23 @@ class TariffPredictionWorkflow:
                 response = RESPONSE_MESSAGES['hs6_code_prediction_failed']
                 self.state['responses'].append(response)
                 return response
-            self.state['hs6_candidates'] = hs6_candidates
-            scenario_str = self.state.get('scenario', '')
-            scenario_guide = f"{self.josa_으로(scenario_str)} {RESPONSE_MESSAGES['scenario_guide_prefix']}\n\n" if scenario_str else ""
-            response = scenario_guide + f"상품묘사: {product_name}\n국가: {self.state.get('country','')}\n가격: {self.state.get('price',0):,}원\n수량: {self.state.get('quantity',1)}개\n\n{RESPONSE_MESSAGES['hs6_code_reprediction_result']}\n" + '\n'.join([
-                f"{i+1}. {c['description']} ({RESPONSE_MESSAGES['hs6_confidence']} {c['confidence']:.1%})" for i, c in enumerate(hs6_candidates)
-            ]) + f"\n\n{RESPONSE_MESSAGES['hs6_code_selection_prompt']}\n예시: \"1번\", \"2번\", \"3번\" 등"
-            self.state['responses'].append(response)
-            return response
+            return self._respond_hs6_reprediction(product_name, hs6_candidates)
         except Exception:
             response = RESPONSE_MESSAGES['hs6_code_reprediction_error']
             self.state['responses'].append(response)
             return response
 
+    def _respond_hs6_reprediction(self, product_name: str, hs6_candidates: List[Dict]) -> str:
+        self.state['hs6_candidates'] = hs6_candidates
+        scenario_str = self.state.get('scenario', '')
+        scenario_guide = f"{self.josa_으로(scenario_str)} {RESPONSE_MESSAGES['scenario_guide_prefix']}\n\n" if scenario_str else ""
+        response = scenario_guide + f"상품묘사: {product_name}\n국가: {self.state.get('country','')}\n가격: {self.state.get('price',0):,}원\n수량: {self.state.get('quantity',1)}개\n\n{RESPONSE_MESSAGES['hs6_code_reprediction_result']}\n" + '\n'.join([
+            f"{i+1}. {c['description']} ({RESPONSE_MESSAGES['hs6_confidence']} {c['confidence']:.1%})" for i, c in enumerate(hs6_candidates)
+        ]) + f"\n\n{RESPONSE_MESSAGES['hs6_code_selection_prompt']}\n예시: \"1번\", \"2번\", \"3번\" 등"
+        self.state['responses'].append(response)
+        return response
+
     def _perform_hs10_reprediction(self, user_input: str) -> str:
-        from core.tariff_prediction.tools.parse_hs_results import generate_hs10_candidates
         from core.shared.utils.llm import get_llm
         
         hs6_code = self.state.get('hs6_code')
@@ -441,7 +493,7 @@ class TariffPredictionWorkflow:
             return response
         
         try:
-            hs10_candidates = generate_hs10_candidates(hs6_code)
+            hs10_candidates = rank_hs10_candidates(list_hs10_candidates(hs6_code), self.state.get('product_name'))
             
             if not hs10_candidates:
                 response = RESPONSE_MESSAGES['hs10_code_prediction_failed']
@@ -464,7 +516,7 @@ class TariffPredictionWorkflow:
 
     def perform_calculation(self) -> str:
         try:
-            tariff_result = calculate_tariff_amount(
+            tariff_result = compute_tariff_amount(
                 product_code=self.state['hs10_code'],
                 value=self.state['price'],
                 origin_country=self.state['country'],
@@ -483,8 +535,7 @@ class TariffPredictionWorkflow:
             self.reset_session()
             return f"{ERROR_MESSAGES['calculation_error']} {str(e)}"
 
-    def generate_friendly_result(self, tariff_result: str) -> str:
-        parsed_result = self.parse_tariff_result(tariff_result)
+    def generate_friendly_result(self, tariff_result: TariffCalculationResult) -> str:
         
         product_name = self.state.get('product_name', RESPONSE_MESSAGES['product_name_placeholder'])
         country = self.state.get('country', RESPONSE_MESSAGES['country_placeholder'])
@@ -500,7 +551,7 @@ class TariffPredictionWorkflow:
 - **{STATE_KEYS['scenario']}**: {scenario}
 
 ## 📊 {RESPONSE_MESSAGES['calculation_result']}
-{parsed_result['formatted_result']}
+{render_tariff_markdown(tariff_result)}
 
 ## 💡 {RESPONSE_MESSAGES['note']}
 - {RESPONSE_MESSAGES['tariff_note_1']}
@@ -516,7 +567,7 @@ class TariffPredictionWorkflow:
 
 
 def tariff_prediction_agent(state: CustomsAgentState) -> CustomsAgentState:
-    session_id = DEFAULT_SESSION_ID 
+    session_id = state.get("session_id") or DEFAULT_SESSION_ID
     
     workflow = workflow_manager.get_session(session_id)
     
@@ -550,6 +601,7 @@ def tariff_prediction_agent(state: CustomsAgentState) -> CustomsAgentState:
         response = workflow.process_user_input(enhanced_query)
     else:
         response = workflow.process_user_input(state["query"])
+    workflow_manager.save_session(session_id, workflow)
     
     state["final_response"] = response
     return state
\ No newline at end of file
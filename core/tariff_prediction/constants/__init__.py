@@ -9,6 +9,7 @@ __all__ = [
     'OFF_TOPIC_KEYWORDS',
     'REMOVE_KEYWORDS',
     'CORRECTION_KEYWORDS',
+    'HS10_MORE_KEYWORDS',
     'SESSION_TERMINATION_KEYWORDS',
     'SIMPLE_TARIFF_REQUESTS',
     'TARIFF_CONTEXT_KEYWORDS',
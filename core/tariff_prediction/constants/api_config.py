@@ -1,4 +1,17 @@
 import os
 
 KOREAEXIM_API_URL = os.getenv("KOREAEXIM_API_URL", "")
-KOREAEXIM_API_KEY = os.getenv("KOREAEXIM_API_KEY", "")
\ No newline at end of file
+KOREAEXIM_API_KEY = os.getenv("KOREAEXIM_API_KEY", "")
+KOREAEXIM_TIMEOUT_SECONDS = float(os.getenv("KOREAEXIM_TIMEOUT_SECONDS", "10"))
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# 환율표 캐시: 영업일마다 한 번 조회해 디스크에 보관합니다.
+EXCHANGE_RATE_CACHE_PATH = os.getenv("EXCHANGE_RATE_CACHE_PATH", os.path.join(PROJECT_ROOT, "var", "exchange_rates.json"))
+EXCHANGE_RATE_MAX_LOOKBACK_DAYS = int(os.getenv("EXCHANGE_RATE_MAX_LOOKBACK_DAYS", "10"))
+EXCHANGE_RATE_RETRY_SECONDS = float(os.getenv("EXCHANGE_RATE_RETRY_SECONDS", "1800"))  # 오늘 환율 게시 전 재확인 주기
+
+# 환율 예열: 워커 시작 시, 그리고 매 영업일 환율 게시 시각(KST) 직후 환율표를 미리 받아 둡니다.
+EXCHANGE_RATE_PREFETCH_ENABLED = os.getenv("EXCHANGE_RATE_PREFETCH_ENABLED", "true").lower() == "true"
+EXCHANGE_RATE_PUBLISH_TIME = os.getenv("EXCHANGE_RATE_PUBLISH_TIME", "11:05")
+EXCHANGE_RATE_PREFETCH_RETRY_SECONDS = float(os.getenv("EXCHANGE_RATE_PREFETCH_RETRY_SECONDS", "600"))  # 게시가 늦을 때 재시도 간격
@@ -31,6 +31,9 @@ CORRECTION_KEYWORDS = ['수정', '잘못', '다시', '틀렸']
 
 SESSION_TERMINATION_KEYWORDS = ['중단', '그만', '취소', '종료']
 
+# HS10 후보 다음 페이지 요청
+HS10_MORE_KEYWORDS = ['더보기', '더 보기', '더 보여', '다음 후보', '다음 페이지']
+
 # 간단한 관세 요청 키워드
 SIMPLE_TARIFF_REQUESTS = [
     "관세 계산해줘", "관세 예측해줘", "관세 계산", "관세 예측", 
@@ -159,7 +162,10 @@ LLM_PROMPTS = {
     'product_name': "상품명",
     'user_additional_opinion': "사용자 추가 의견",
     'hs6_reprediction_format': "다음 형식으로 HS 코드 후보 3개 이내를 반환하세요:\n1. [6자리 HS코드] (확률: [확률]%)\n2. [6자리 HS코드] (확률: [확률]%)\n3. [6자리 HS코드] (확률: [확률]%)",
-    'hs6_reprediction_example': "예시:\n1. 851770 (확률: 85.5%)\n2. 851712 (확률: 12.3%)\n3. 851713 (확률: 2.2%)"
+    'hs6_reprediction_example': "예시:\n1. 851770 (확률: 85.5%)\n2. 851712 (확률: 12.3%)\n3. 851713 (확률: 2.2%)",
+    'hs6_rerank_prompt': "아래 상품명과 사용자의 추가 의견에 가장 적합한 HS 코드를 후보 목록에서만 골라 적합한 순서대로 정렬해주세요.",
+    'hs6_rerank_candidates': "후보 목록",
+    'hs6_rerank_format': "후보 목록에 있는 6자리 HS코드만 한 줄에 하나씩, 최대 3개까지 적합한 순서대로 반환하세요."
 }
 
 # 응답 메시지 상수
@@ -226,6 +232,8 @@ RESPONSE_MESSAGES = {
     'hs6_code_selected': "선택하신 HS 6자리 코드:",
     'hs10_code_prediction_prompt': "HS 10자리 코드 후보를 선택해 주세요:",
     'hs10_code_selection_prompt': "💡 **위 후보 중 하나를 선택해 주세요.**",
+    'hs10_more_hint': "원하는 코드가 없으면 \"더보기\"를 입력해 주세요. (전체 {total}개 중 {shown}개 표시)",
+    'hs10_no_more_candidates': "더 보여드릴 HS10 코드 후보가 없습니다.",
     'invalid_number': "**잘못된 번호입니다.**",
     'hs6_code_reprediction_hint': "만약 후보가 모두 적합하지 않으면 '코드가 없다', '다시', '재예측' 등으로 입력해 주세요.",
     'input_processing_error': "입력 처리 중 오류가 발생했습니다. 숫자를 입력하거나, 재예측을 원하시면 '다시', '재예측' 등으로 입력해 주세요.",
@@ -416,10 +424,11 @@ STEP_API = {
     'HS6_SELECT_STEP': 'hs6_select',
     'HS10_SELECT_STEP': 'hs10_select',
     'RESULT_STEP': 'result',
-    'ERROR_KEYWORDS': ['오류', 'Error', '실패'],
+    'CLASSIFIER_MIN_CONFIDENCE': 0.7,  # 규칙 기반 단계 판단 신뢰도가 이보다 낮으면 LLM으로 판단
     'DEFAULT_ERROR_MESSAGE': '잘못된 요청입니다. 상품 설명을 입력해 주세요.',
     'HS6_SELECTION_MESSAGE': '상품에 해당하는 HS6 코드를 선택해 주세요.',
-    'HS10_SELECTION_MESSAGE': 'HS10 코드 후보를 선택해 주세요.'
+    'HS10_SELECTION_MESSAGE': 'HS10 코드 후보를 선택해 주세요.',
+    'CALCULATION_INPUT_REQUIRED_MESSAGE': '관세를 계산하려면 10자리 HS 코드와 함께 원산지(origin_country)와 가격(price)을 입력해 주세요.'
 }
 
 # 관세 결과 파싱 관련 상수
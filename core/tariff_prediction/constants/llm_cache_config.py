@@ -0,0 +1,9 @@
+import os
+
+from core.tariff_prediction.constants.session_config import PROJECT_ROOT
+
+# 관세 예측 LLM 도우미(상품 설명 정리, 시나리오 감지, 입력 파싱) 결과 캐시: memory | sqlite | off
+TARIFF_LLM_CACHE_BACKEND = os.getenv("TARIFF_LLM_CACHE_BACKEND", "memory").lower()
+TARIFF_LLM_CACHE_DB_PATH = os.getenv("TARIFF_LLM_CACHE_DB_PATH", os.path.join(PROJECT_ROOT, "var", "tariff_llm_cache.sqlite3"))
+TARIFF_LLM_CACHE_TTL_SECONDS = int(os.getenv("TARIFF_LLM_CACHE_TTL_SECONDS", "86400"))
+TARIFF_LLM_CACHE_MAX_ENTRIES = int(os.getenv("TARIFF_LLM_CACHE_MAX_ENTRIES", "20000"))
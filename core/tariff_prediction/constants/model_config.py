@@ -0,0 +1,31 @@
+import os
+
+MODEL_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'model'))
+EMBEDDING_MODEL_PATH = os.path.join(MODEL_DIR, 'bge-m3-custom-supervised')
+LABEL_ENCODER_PATH = os.path.join(MODEL_DIR, 'label_encoder.pkl')
+MLP_MODEL_PATH = os.path.join(MODEL_DIR, 'mlp_classifier.pth')
+
+# HS 코드 분류 추론 백엔드: torch(기본) | onnx
+HS_CLASSIFIER_BACKEND = os.getenv("HS_CLASSIFIER_BACKEND", "torch").lower()
+HS_ONNX_DIR = os.getenv("HS_ONNX_DIR", os.path.join(MODEL_DIR, 'onnx'))
+HS_ONNX_QUANTIZED = os.getenv("HS_ONNX_QUANTIZED", "true").lower() == "true"
+HS_ONNX_THREADS = int(os.getenv("HS_ONNX_THREADS", "0"))
+
+ONNX_ENCODER_FILE = "encoder.onnx"
+ONNX_HEAD_FILE = "head.onnx"
+ONNX_QUANTIZED_SUFFIX = ".int8.onnx"
+ONNX_TOKENIZER_DIR = "tokenizer"
+ONNX_META_FILE = "export_meta.json"
+
+# HS6 검색텍스트 임베딩 색인 (재예측용)
+HS6_INDEX_PATH = os.getenv("HS6_INDEX_PATH", os.path.join(MODEL_DIR, 'hs6_index.npy'))
+HS6_INDEX_META_PATH = os.path.splitext(HS6_INDEX_PATH)[0] + '.json'
+HS6_REPREDICTION_SEARCH_SIZE = int(os.getenv("HS6_REPREDICTION_SEARCH_SIZE", "10"))  # LLM 재정렬에 넘길 후보 수
+HS6_REPREDICTION_TOP_K = 3
+HS6_RERANK_WITH_LLM = os.getenv("HS6_RERANK_WITH_LLM", "false").lower() == "true"
+
+# HS10 한글품목명 임베딩 색인 (HS10 후보 정렬용)
+HS10_INDEX_PATH = os.getenv("HS10_INDEX_PATH", os.path.join(MODEL_DIR, 'hs10_index.npy'))
+HS10_INDEX_META_PATH = os.path.splitext(HS10_INDEX_PATH)[0] + '.json'
+HS10_CANDIDATES_PAGE_SIZE = int(os.getenv("HS10_CANDIDATES_PAGE_SIZE", "5"))
+HS10_CANDIDATES_MAX_PAGE_SIZE = 50
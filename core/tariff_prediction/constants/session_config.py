@@ -0,0 +1,10 @@
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# 관세 예측 대화 세션 저장소: memory(프로세스 내부 LRU) 또는 sqlite(여러 워커가 공유)
+TARIFF_SESSION_BACKEND = os.getenv("TARIFF_SESSION_BACKEND", "memory").lower()
+TARIFF_SESSION_DB_PATH = os.getenv("TARIFF_SESSION_DB_PATH", os.path.join(PROJECT_ROOT, "var", "tariff_sessions.sqlite3"))
+TARIFF_SESSION_TTL_SECONDS = int(os.getenv("TARIFF_SESSION_TTL_SECONDS", "1800"))  # 마지막 대화 후 세션 유지 시간
+TARIFF_SESSION_MAX_SESSIONS = int(os.getenv("TARIFF_SESSION_MAX_SESSIONS", "10000"))  # memory 백엔드 최대 세션 수
+TARIFF_SESSION_PURGE_INTERVAL = 300  # sqlite 백엔드에서 만료 세션을 지우는 주기 (초)
@@ -0,0 +1 @@
+# Tariff Prediction Reference Data
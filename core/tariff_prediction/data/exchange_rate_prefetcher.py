@@ -0,0 +1,89 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from core.tariff_prediction.constants.api_config import (
+    EXCHANGE_RATE_PUBLISH_TIME, EXCHANGE_RATE_PREFETCH_RETRY_SECONDS
+)
+from core.tariff_prediction.data.exchange_rate_store import ExchangeRateStore
+
+logger = logging.getLogger(__name__)
+
+def parse_publish_time(value: str) -> timedelta:
+    hour, minute = value.split(":")
+    return timedelta(hours=int(hour), minutes=int(minute))
+
+def next_publication_after(now: datetime, publish_time: timedelta) -> datetime:
+    """now 이후 첫 영업일의 환율 게시 시각을 반환합니다."""
+    day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    candidate = day + publish_time
+    while candidate <= now or candidate.weekday() >= 5:
+        day += timedelta(days=1)
+        candidate = day + publish_time
+    return candidate
+
+class ExchangeRatePrefetcher:
+    """
+    워커 시작 시 환율표를 미리 받아 두고, 매 영업일 게시 시각 직후 다시 받아 첫 관세 계산이 API를 기다리지 않게 합니다.
+    게시가 늦어지면 오늘 환율을 받을 때까지 retry_seconds 간격으로 다시 시도합니다.
+    여러 워커가 동시에 갱신해도 ExchangeRateStore의 파일 잠금으로 한 워커만 API를 호출합니다.
+    """
+
+    def __init__(self, store: ExchangeRateStore, publish_time: str = EXCHANGE_RATE_PUBLISH_TIME,
+                 retry_seconds: float = EXCHANGE_RATE_PREFETCH_RETRY_SECONDS):
+        self.store = store
+        self.publish_time = parse_publish_time(publish_time)
+        self.retry_seconds = retry_seconds
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_run_at: Optional[datetime] = None
+        self._next_run_at: Optional[datetime] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="exchange-rate-prefetcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        # 워커 시작 시 예열
+        self.run_once()
+        while not self._stop_event.is_set():
+            self._next_run_at = self.next_run_at()
+            wait_seconds = max((self._next_run_at - self.store.now()).total_seconds(), 0)
+            if self._stop_event.wait(wait_seconds):
+                break
+            self.run_once()
+
+    def run_once(self) -> bool:
+        """환율표를 갱신하고, 오늘 환율을 가지고 있으면 True를 반환합니다."""
+        self._last_run_at = self.store.now()
+        try:
+            self.store.refresh()
+        except Exception:
+            logger.exception("exchange rate prefetch failed")
+        return self.store.has_today()
+
+    def next_run_at(self) -> datetime:
+        now = self.store.now()
+        today_publication = now.replace(hour=0, minute=0, second=0, microsecond=0) + self.publish_time
+        # 게시 시각이 지났는데 오늘 환율이 아직 없으면 짧은 간격으로 다시 시도합니다.
+        if now.weekday() < 5 and now >= today_publication and not self.store.has_today():
+            return now + timedelta(seconds=self.retry_seconds)
+        return next_publication_after(now, self.publish_time)
+
+    def status(self) -> Dict[str, object]:
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "last_run_at": self._last_run_at.strftime("%Y-%m-%d %H:%M:%S") if self._last_run_at else None,
+            "next_run_at": self._next_run_at.strftime("%Y-%m-%d %H:%M:%S") if self._next_run_at else None,
+        }
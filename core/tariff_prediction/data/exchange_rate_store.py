@@ -0,0 +1,232 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows 등: 프로세스 내부에서만 단일 실행
+    FCNTL_AVAILABLE = False
+
+from core.tariff_prediction.constants.api_config import (
+    EXCHANGE_RATE_CACHE_PATH, EXCHANGE_RATE_MAX_LOOKBACK_DAYS, EXCHANGE_RATE_RETRY_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+# 시나리오별 환율 종류: 해외직구/해외체류 중 구매는 전신환 매입률(ttb), 해외배송은 전신환 매도율(tts)
+SITUATION_RATE_TYPES = {'해외직구': 'ttb', '해외체류 중 구매': 'ttb', '해외배송': 'tts'}
+RATE_FIELDS = ('ttb', 'tts', 'deal_bas_r')
+NO_TABLE_RETRY_SECONDS = 60
+# 요청 처리 중 갱신할 때의 최대 API 호출 수. 더 거슬러 올라가는 조회는 백그라운드에서 합니다.
+INLINE_MAX_FETCHES = 1
+
+# 환율은 한국 영업일 기준으로 게시되므로 서버 시간대와 관계없이 KST로 날짜를 계산합니다.
+KST = timezone(timedelta(hours=9))
+
+def now_kst() -> datetime:
+    return datetime.now(KST)
+
+@dataclass
+class ExchangeRateTable:
+    """한국수출입은행 AP01 환율표 하루치. rates는 통화 코드 → {ttb, tts, deal_bas_r} 입니다."""
+    searchdate: str
+    fetched_at: float
+    rates: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def fetched_at_str(self) -> str:
+        return datetime.fromtimestamp(self.fetched_at, KST).strftime("%Y-%m-%d %H:%M:%S")
+
+def _parse_rate(value) -> Optional[float]:
+    try:
+        return float(re.sub(r'(?<=\d),(?=\d)', '', str(value)))
+    except ValueError:
+        return None
+
+def parse_exchange_table(searchdate: str, rows: List[dict]) -> Optional[ExchangeRateTable]:
+    """API 응답을 통화별 dict로 바꿉니다. 게시 전·휴일처럼 환율이 없으면 None을 반환합니다."""
+    rates: Dict[str, Dict[str, float]] = {}
+    for row in rows or []:
+        if not isinstance(row, dict) or row.get('result') != 1 or not row.get('cur_unit'):
+            continue
+        parsed = {name: _parse_rate(row.get(name)) for name in RATE_FIELDS}
+        rates[row['cur_unit']] = {name: rate for name, rate in parsed.items() if rate is not None}
+    if not rates:
+        return None
+    return ExchangeRateTable(searchdate=searchdate, fetched_at=time.time(), rates=rates)
+
+def recent_business_days(today: datetime, max_days: int) -> List[str]:
+    """오늘부터 거슬러 올라가며 주말을 뺀 날짜(YYYYMMDD)를 반환합니다."""
+    days = []
+    for offset in range(max_days + 1):
+        day = today - timedelta(days=offset)
+        if day.weekday() < 5:
+            days.append(day.strftime('%Y%m%d'))
+    return days
+
+class ExchangeRateStore:
+    """
+    환율표를 영업일마다 한 번만 조회해 통화별 dict로 보관하고 디스크에 저장합니다.
+
+    오늘 환율이 아직 게시되지 않았거나(빈 응답) 조회에 실패하면 가장 최근에 게시된 날짜까지 거슬러 올라가며,
+    그렇게 찾은 과거 환율표를 쓰는 동안에는 retry_seconds 간격으로만 오늘 환율을 다시 확인합니다.
+    요청 처리 중(get_table)에는 API를 한 번만 호출하고, 더 거슬러 올라가는 조회는 백그라운드 스레드(refresh)에 맡깁니다.
+    """
+
+    def __init__(self, fetch_table: Callable[[str], List[dict]], cache_path: str = EXCHANGE_RATE_CACHE_PATH,
+                 max_lookback_days: int = EXCHANGE_RATE_MAX_LOOKBACK_DAYS,
+                 retry_seconds: float = EXCHANGE_RATE_RETRY_SECONDS,
+                 now: Callable[[], datetime] = now_kst):
+        self.fetch_table = fetch_table
+        self.cache_path = cache_path
+        self.max_lookback_days = max_lookback_days
+        self.retry_seconds = retry_seconds
+        self.now = now
+        self._lock = threading.Lock()
+        self._table: Optional[ExchangeRateTable] = None
+        self._next_check_at = 0.0
+        self._initialized = False
+        self._background_refresh: Optional[threading.Thread] = None
+
+    def get_table(self) -> Optional[ExchangeRateTable]:
+        """필요하면 갱신한 뒤 현재 환율표를 반환합니다. 한 번도 조회하지 못했으면 None입니다."""
+        if self._needs_refresh():
+            with self._lock:
+                if self._needs_refresh() and not self._refresh(max_fetches=INLINE_MAX_FETCHES):
+                    self._start_background_refresh()
+        return self._table
+
+    def get_rate(self, cur_unit: str, situation: str = '해외직구') -> Optional[float]:
+        rate_type = SITUATION_RATE_TYPES.get(situation)
+        if rate_type is None:
+            logger.warning("지원하지 않는 시나리오입니다: %s", situation)
+            return None
+        table = self.get_table()
+        if table is None:
+            return None
+        return table.rates.get(cur_unit, {}).get(rate_type)
+
+    def refresh(self) -> Optional[ExchangeRateTable]:
+        """주기와 관계없이 오늘 환율을 다시 확인합니다. 다른 워커가 이미 받아 두었으면 API를 호출하지 않습니다."""
+        with self._lock:
+            self._refresh()
+        return self._table
+
+    def _start_background_refresh(self) -> None:
+        if self._background_refresh is not None and self._background_refresh.is_alive():
+            return
+        self._background_refresh = threading.Thread(target=self.refresh, name="exchange-rate-lookback", daemon=True)
+        self._background_refresh.start()
+
+    def has_today(self) -> bool:
+        return self._table is not None and self._table.searchdate == self._today()
+
+    def freshness(self) -> Dict[str, object]:
+        table = self._table
+        today = self.now().strftime('%Y%m%d')
+        return {
+            "searchdate": table.searchdate if table else None,
+            "fetched_at": table.fetched_at_str if table else None,
+            "is_today": bool(table and table.searchdate == today),
+            "age_seconds": round(time.time() - table.fetched_at) if table else None,
+        }
+
+    def _today(self) -> str:
+        return self.now().strftime('%Y%m%d')
+
+    def _needs_refresh(self) -> bool:
+        if not self._initialized:
+            return True
+        table = self._table
+        if table is not None and table.searchdate == self._today():
+            return False
+        return time.time() >= self._next_check_at
+
+    @contextmanager
+    def _worker_lock(self) -> Iterator[None]:
+        """같은 캐시 파일을 쓰는 워커끼리 한 번에 하나만 환율을 조회하도록 잠급니다."""
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        with open(self.cache_path + ".lock", "a+") as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self, max_fetches: Optional[int] = None) -> bool:
+        try:
+            with self._worker_lock():
+                return self._refresh_locked(max_fetches)
+        except OSError as e:
+            logger.warning("환율 캐시 잠금 실패: %s", e)
+            return self._refresh_locked(max_fetches)
+
+    def _refresh_locked(self, max_fetches: Optional[int] = None) -> bool:
+        """
+        환율표를 갱신합니다. max_fetches번 호출하고도 더 거슬러 올라가야 하면 중단하고 False를 반환합니다.
+        """
+        # 다른 워커가 먼저 받아 저장한 환율표가 있으면 API를 다시 호출하지 않고 사용합니다.
+        self._initialized = True
+        disk_table = self._load_from_disk()
+        if disk_table is not None and (self._table is None or disk_table.searchdate > self._table.searchdate):
+            self._table = disk_table
+        if self._table is not None and self._table.searchdate == self._today():
+            return True
+
+        known = self._table.searchdate if self._table else ""
+        fetches = 0
+        completed = True
+        for searchdate in recent_business_days(self.now(), self.max_lookback_days):
+            if searchdate < known:
+                # 이미 가진 환율표보다 오래된 날짜는 조회하지 않습니다.
+                break
+            if searchdate == known and searchdate != self._today():
+                break
+            if max_fetches is not None and fetches >= max_fetches:
+                completed = False
+                break
+            fetches += 1
+            try:
+                table = parse_exchange_table(searchdate, self.fetch_table(searchdate))
+            except Exception as e:
+                logger.warning("환율 조회 실패 (%s): %s", searchdate, type(e).__name__)
+                continue
+            if table is not None:
+                self._table = table
+                self._save_to_disk(table)
+                break
+
+        if self._table is None or self._table.searchdate != self._today():
+            # 환율표가 하나도 없으면 기본 환율로 계산되므로 더 자주 다시 시도합니다.
+            retry_seconds = self.retry_seconds if self._table is not None else min(self.retry_seconds, NO_TABLE_RETRY_SECONDS)
+            self._next_check_at = time.time() + retry_seconds
+            if self._table is not None:
+                logger.info("오늘 환율이 아직 없어 %s 환율을 사용합니다.", self._table.searchdate)
+        return completed
+
+    def _load_from_disk(self) -> Optional[ExchangeRateTable]:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return ExchangeRateTable(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_to_disk(self, table: ExchangeRateTable) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(table), f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("환율표를 저장하지 못했습니다: %s", e)
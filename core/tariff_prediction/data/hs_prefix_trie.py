@@ -0,0 +1,117 @@
+"""
+HS6/HS10 코드를 자릿수 단위 트라이로 색인해 '8471', '8517.70' 같은 부분 코드로 시작하는 코드를 바로 찾습니다.
+노드마다 그 아래 코드 중 사전순으로 앞선 코드를 최대 HS_SUGGEST_MAX_LIMIT개까지 미리 담아 두므로,
+자동완성 조회는 접두사 길이만큼만 트라이를 내려갑니다.
+"""
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from core.tariff_prediction.data.hs_tables import HSTables, get_hs_tables
+
+HS_LEVEL_HS6 = "hs6"
+HS_LEVEL_HS10 = "hs10"
+HS_SUGGEST_MAX_LIMIT = 50
+
+@dataclass(frozen=True)
+class HSCodeEntry:
+    code: str
+    level: str
+    description: str
+
+def normalize_hs_prefix(prefix: str) -> str:
+    """'8517.70', '8471-30' 처럼 구분자가 섞인 입력에서 숫자만 남깁니다."""
+    return re.sub(r'\D', '', prefix or '')
+
+class HSPrefixTrie:
+    """
+    코드 한 자리당 노드 하나인 트라이. 사전순으로 삽입하므로 HS6 코드가 그 아래 HS10 코드보다 먼저 나옵니다.
+    """
+
+    def __init__(self, entries: Iterable[HSCodeEntry], max_suggestions: int = HS_SUGGEST_MAX_LIMIT):
+        self.max_suggestions = max_suggestions
+        self._children: List[Dict[str, int]] = [{}]
+        self._entry: List[Optional[HSCodeEntry]] = [None]
+        self._suggestions: List[List[HSCodeEntry]] = [[]]
+        self._counts: List[int] = [0]
+        for entry in sorted(entries, key=lambda entry: entry.code):
+            self._add(entry)
+
+    def _add(self, entry: HSCodeEntry) -> None:
+        state = 0
+        self._record(state, entry)
+        for char in entry.code:
+            next_state = self._children[state].get(char)
+            if next_state is None:
+                next_state = len(self._children)
+                self._children.append({})
+                self._entry.append(None)
+                self._suggestions.append([])
+                self._counts.append(0)
+                self._children[state][char] = next_state
+            state = next_state
+            self._record(state, entry)
+        self._entry[state] = entry
+
+    def _record(self, state: int, entry: HSCodeEntry) -> None:
+        self._counts[state] += 1
+        if len(self._suggestions[state]) < self.max_suggestions:
+            self._suggestions[state].append(entry)
+
+    def _find(self, prefix: str) -> Optional[int]:
+        state = 0
+        for char in normalize_hs_prefix(prefix):
+            state = self._children[state].get(char)
+            if state is None:
+                return None
+        return state
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[HSCodeEntry]:
+        """접두사로 시작하는 코드를 사전순으로 최대 limit개(HS_SUGGEST_MAX_LIMIT 이하) 반환합니다."""
+        state = self._find(prefix)
+        return [] if state is None else self._suggestions[state][:limit]
+
+    def count(self, prefix: str) -> int:
+        state = self._find(prefix)
+        return 0 if state is None else self._counts[state]
+
+    def codes_under(self, prefix: str, level: Optional[str] = None) -> List[HSCodeEntry]:
+        """접두사로 시작하는 코드를 개수 제한 없이 사전순으로 반환합니다. level을 주면 해당 자릿수만 반환합니다."""
+        state = self._find(prefix)
+        if state is None:
+            return []
+        entries: List[HSCodeEntry] = []
+        stack = [state]
+        while stack:
+            state = stack.pop()
+            entry = self._entry[state]
+            if entry is not None and (level is None or entry.level == level):
+                entries.append(entry)
+            # 자식은 사전순으로 삽입되어 있으므로 역순으로 쌓아야 사전순으로 꺼냅니다.
+            stack.extend(reversed(list(self._children[state].values())))
+        return entries
+
+def build_hs_prefix_trie(tables: HSTables) -> HSPrefixTrie:
+    entries = [
+        HSCodeEntry(code=code, level=HS_LEVEL_HS6, description=text or "")
+        for code, text in tables.hs6_search_text.items()
+    ]
+    entries.extend(
+        HSCodeEntry(code=hs10_code, level=HS_LEVEL_HS10, description=description or "")
+        for candidates in tables.hs10_by_hs6.values()
+        for hs10_code, description in candidates
+    )
+    return HSPrefixTrie(entries)
+
+_hs_prefix_trie: Optional[HSPrefixTrie] = None
+_hs_prefix_trie_lock = threading.Lock()
+
+def get_hs_prefix_trie() -> HSPrefixTrie:
+    """HS 코드 트라이를 프로세스당 한 번만 만들어 공유합니다."""
+    global _hs_prefix_trie
+    if _hs_prefix_trie is None:
+        with _hs_prefix_trie_lock:
+            if _hs_prefix_trie is None:
+                _hs_prefix_trie = build_hs_prefix_trie(get_hs_tables())
+    return _hs_prefix_trie
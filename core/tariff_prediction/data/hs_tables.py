@@ -0,0 +1,36 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from core.tariff_prediction.data.snapshot import TariffSnapshot, tariff_snapshot
+
+@dataclass
+class HSTables:
+    """HS6/HS10 참조 테이블을 조회용 dict로 보관합니다. 코드는 모두 앞자리 0을 유지한 문자열입니다."""
+    hs6_search_text: Dict[str, str] = field(default_factory=dict)
+    hs10_by_hs6: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+
+    def get_hs6_search_text(self, hs6_code: str) -> Optional[str]:
+        return self.hs6_search_text.get(hs6_code)
+
+    def get_hs10_candidates(self, hs6_code: str) -> List[Tuple[str, str]]:
+        return self.hs10_by_hs6.get(hs6_code, [])
+
+def load_hs_tables(snapshot: TariffSnapshot = tariff_snapshot) -> HSTables:
+    """참조 데이터 스냅샷에서 HS6/HS10 테이블을 읽습니다. 코드는 스냅샷 생성 시 자릿수를 맞춰 둡니다."""
+    tables = HSTables(hs6_search_text=dict(snapshot.hs6_rows()))
+    for hs6_code, hs10_code, description in snapshot.hs10_rows():
+        tables.hs10_by_hs6.setdefault(hs6_code, []).append((hs10_code, description))
+    return tables
+
+_hs_tables: Optional[HSTables] = None
+_hs_tables_lock = threading.Lock()
+
+def get_hs_tables() -> HSTables:
+    """HS6/HS10 테이블을 프로세스당 한 번만 읽어 공유합니다."""
+    global _hs_tables
+    if _hs_tables is None:
+        with _hs_tables_lock:
+            if _hs_tables is None:
+                _hs_tables = load_hs_tables()
+    return _hs_tables
@@ -0,0 +1,241 @@
+"""
+관세 참조 데이터(HS6, HS10, 통화별 국가, 국가별 관세율) CSV를 하나의 SQLite 스냅샷으로 컴파일합니다.
+
+    python -m core.tariff_prediction.data.snapshot          # 필요할 때만 재생성
+    python -m core.tariff_prediction.data.snapshot --force  # 강제 재생성
+
+스냅샷에는 형식 버전과 원본 CSV의 sha256이 기록되며, 런타임은 이 값이 다르면 자동으로 다시 만듭니다.
+여러 워커가 같은 파일을 읽기 전용 mmap으로 공유하고, 재생성은 파일 잠금 후 임시 파일을 os.replace로 교체합니다.
+"""
+import argparse
+import errno
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows 등: 프로세스 내부에서만 잠금
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+SNAPSHOT_VERSION = "1"
+TARIFF_SNAPSHOT_PATH = os.getenv("TARIFF_SNAPSHOT_PATH", os.path.join(PROJECT_ROOT, "var", "tariff_snapshot.sqlite3"))
+SNAPSHOT_MMAP_SIZE = 64 * 1024 * 1024
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+HS6_CSV_PATH = os.path.join(DATA_DIR, 'HS6.csv')
+HS10_CSV_PATH = os.path.join(DATA_DIR, 'HS10.csv')
+CURRENCY_CSV_PATH = os.path.join(DATA_DIR, '통화별_국가.csv')
+TARIFF_CSV_PATH = os.path.join(DATA_DIR, '국가별_관세_적용.csv')
+
+SOURCE_FILES = {
+    "hs6": HS6_CSV_PATH,
+    "hs10": HS10_CSV_PATH,
+    "currency": CURRENCY_CSV_PATH,
+    "tariff": TARIFF_CSV_PATH,
+}
+MISSING_SOURCE = "missing"
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE hs6 (code TEXT PRIMARY KEY, search_text TEXT NOT NULL);
+CREATE TABLE hs10 (seq INTEGER PRIMARY KEY, hs6 TEXT NOT NULL, code TEXT NOT NULL, description TEXT NOT NULL);
+CREATE INDEX idx_hs10_hs6 ON hs10 (hs6, seq);
+CREATE TABLE currency (country TEXT PRIMARY KEY, cur_unit TEXT NOT NULL);
+-- tax_rate, fta는 CSV에서 읽힌 값의 타입(정수/실수/문자열)을 그대로 보존하기 위해 타입을 지정하지 않습니다.
+CREATE TABLE tariff_rate (seq INTEGER PRIMARY KEY, number TEXT, country TEXT, tax_rate, fta, category);
+CREATE INDEX idx_tariff_rate_number ON tariff_rate (number, seq);
+"""
+
+def file_sha256(path: str) -> str:
+    if not os.path.exists(path):
+        return MISSING_SOURCE
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def source_hashes() -> Dict[str, str]:
+    return {name: file_sha256(path) for name, path in SOURCE_FILES.items()}
+
+def _python_value(value):
+    """numpy 스칼라를 sqlite가 저장할 수 있는 파이썬 값으로 바꿉니다."""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+def build_snapshot(output_path: str, hashes: Dict[str, str]) -> None:
+    """CSV를 읽어 output_path에 스냅샷을 새로 만듭니다."""
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    conn = sqlite3.connect(output_path)
+    try:
+        conn.executescript(SCHEMA)
+
+        hs6_df = pd.read_csv(HS6_CSV_PATH, dtype=str, keep_default_na=False)
+        conn.executemany(
+            "INSERT OR IGNORE INTO hs6 (code, search_text) VALUES (?, ?)",
+            ((code.strip().zfill(6), text) for code, text in zip(hs6_df['HS코드'], hs6_df['검색텍스트']))
+        )
+
+        hs10_df = pd.read_csv(HS10_CSV_PATH, dtype=str, keep_default_na=False)
+        conn.executemany(
+            "INSERT INTO hs10 (hs6, code, description) VALUES (?, ?, ?)",
+            ((hs6.strip().zfill(6), hs10.strip().zfill(10), description)
+             for hs6, hs10, description in zip(hs10_df['HS6'], hs10_df['HS10'], hs10_df['한글품목명']))
+        )
+
+        currency_df = pd.read_csv(CURRENCY_CSV_PATH)
+        # 같은 국가가 여러 번 나오면 첫 행을 사용합니다.
+        conn.executemany(
+            "INSERT OR IGNORE INTO currency (country, cur_unit) VALUES (?, ?)",
+            ((str(country), str(cur_unit)) for country, cur_unit in zip(currency_df['country'], currency_df['cur_unit']))
+        )
+
+        if hashes["tariff"] != MISSING_SOURCE:
+            tariff_df = pd.read_csv(TARIFF_CSV_PATH, dtype={'number': str})
+            conn.executemany(
+                "INSERT INTO tariff_rate (number, country, tax_rate, fta, category) VALUES (?, ?, ?, ?, ?)",
+                (tuple(_python_value(value) for value in row)
+                 for row in tariff_df[['number', 'country', 'tax_rate', 'fta', 'category']].itertuples(index=False))
+            )
+
+        meta = {"snapshot_version": SNAPSHOT_VERSION, "built_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        meta.update({f"source_sha256.{name}": digest for name, digest in hashes.items()})
+        conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta.items())
+        conn.commit()
+    finally:
+        conn.close()
+
+def read_snapshot_meta(path: str) -> Dict[str, str]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+
+def is_snapshot_fresh(meta: Dict[str, str], hashes: Dict[str, str]) -> bool:
+    if meta.get("snapshot_version") != SNAPSHOT_VERSION:
+        return False
+    return all(meta.get(f"source_sha256.{name}") == digest for name, digest in hashes.items())
+
+def ensure_snapshot(path: str = TARIFF_SNAPSHOT_PATH, force: bool = False) -> bool:
+    """스냅샷이 없거나 원본 CSV와 다르면 다시 만듭니다. 재생성했으면 True를 반환합니다."""
+    hashes = source_hashes()
+    if not force and is_snapshot_fresh(read_snapshot_meta(path), hashes):
+        return False
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".lock", "a+") as lock_file:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            # 잠금을 기다리는 동안 다른 워커가 이미 만들었을 수 있습니다.
+            if not force and is_snapshot_fresh(read_snapshot_meta(path), hashes):
+                return False
+            started = time.time()
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            build_snapshot(tmp_path, hashes)
+            os.replace(tmp_path, path)
+            logger.info("관세 참조 데이터 스냅샷 생성: %s (%.2fs)", path, time.time() - started)
+            return True
+        finally:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+class TariffSnapshot:
+    """
+    스냅샷 파일을 읽기 전용으로 조회합니다.
+    sqlite 연결은 스레드 간에 공유하지 않도록 스레드마다 따로 엽니다.
+    """
+
+    def __init__(self, path: str = TARIFF_SNAPSHOT_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._checked = False
+        self._meta: Dict[str, str] = {}
+
+    def _ensure(self) -> None:
+        if self._checked:
+            return
+        with self._lock:
+            if not self._checked:
+                ensure_snapshot(self.path)
+                self._meta = read_snapshot_meta(self.path)
+                self._checked = True
+
+    def _connection(self) -> sqlite3.Connection:
+        self._ensure()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            conn.execute(f"PRAGMA mmap_size = {SNAPSHOT_MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
+
+    def meta(self) -> Dict[str, str]:
+        self._ensure()
+        return dict(self._meta)
+
+    def hs6_rows(self) -> List[Tuple[str, str]]:
+        return self._connection().execute("SELECT code, search_text FROM hs6").fetchall()
+
+    def hs10_rows(self) -> List[Tuple[str, str, str]]:
+        return self._connection().execute("SELECT hs6, code, description FROM hs10 ORDER BY seq").fetchall()
+
+    def get_currency_unit(self, country: str) -> Optional[str]:
+        row = self._connection().execute("SELECT cur_unit FROM currency WHERE country = ?", (country,)).fetchone()
+        return row[0] if row else None
+
+    def _check_tariff_source(self) -> None:
+        if self.meta().get("source_sha256.tariff") == MISSING_SOURCE:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), TARIFF_CSV_PATH)
+
+    def all_tariff_rows(self) -> List[Tuple]:
+        """(number, country, tax_rate, fta, category) 관세율 규칙 전체를 원본 CSV 순서대로 반환합니다."""
+        self._check_tariff_source()
+        return self._connection().execute(
+            "SELECT number, country, tax_rate, fta, category FROM tariff_rate ORDER BY seq"
+        ).fetchall()
+
+    def tariff_rows(self, hs_code: str) -> pd.DataFrame:
+        """HS 코드에 해당하는 관세율 규칙을 원본 CSV 순서대로 반환합니다."""
+        self._check_tariff_source()
+        rows = self._connection().execute(
+            "SELECT number, country, tax_rate, fta, category FROM tariff_rate WHERE number = ? ORDER BY seq",
+            (hs_code,)
+        ).fetchall()
+        return pd.DataFrame(rows, columns=['number', 'country', 'tax_rate', 'fta', 'category'])
+
+tariff_snapshot = TariffSnapshot()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="관세 참조 데이터 스냅샷 생성")
+    parser.add_argument("--path", default=TARIFF_SNAPSHOT_PATH)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    rebuilt = ensure_snapshot(args.path, force=args.force)
+    print(f"{'생성' if rebuilt else '최신 상태'}: {args.path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+관세율 규칙을 (HS 코드, 국가/협정 구분) 키로 미리 색인해 get_tariff_info와 같은 결과를 dict 조회로 반환합니다.
+
+pandas 구현(get_tariff_info)과 전체 테이블에서 결과가 같은지 확인하려면 다음을 실행합니다.
+
+    python -m core.tariff_prediction.data.tariff_rate_index --verify
+"""
+import argparse
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.tariff_prediction.constants import COUNTRY_GROUPS
+from core.tariff_prediction.data.snapshot import TARIFF_CSV_PATH, TariffSnapshot, tariff_snapshot
+
+WTO_CATEGORY = 'WTO 회원국'
+DEFAULT_CATEGORY = '모든 국가'
+
+# 국가 그룹별로 국가명 다음에 확인할 협정 구분 (get_tariff_info의 우선순위와 같은 순서)
+GROUP_CATEGORIES = [
+    ('EU_COUNTRIES', ['EU 27개국']),
+    ('EFTA_COUNTRIES', ['스위스, 리히텐슈타인', 'EFTA 4개국']),
+    ('ASEAN_COUNTRIES', ['아세안 10개국']),
+]
+
+def build_priority_chains() -> Dict[str, Tuple[str, ...]]:
+    """COUNTRY_GROUPS에 속한 국가별 관세율 검색 우선순위를 미리 계산합니다."""
+    chains: Dict[str, Tuple[str, ...]] = {}
+    countries = {country for members in COUNTRY_GROUPS.values() for country in members}
+    for country in countries:
+        chain = [country]
+        for group_name, categories in GROUP_CATEGORIES:
+            if country in COUNTRY_GROUPS[group_name]:
+                chain.extend(categories)
+        chain.extend([WTO_CATEGORY, DEFAULT_CATEGORY])
+        chains[country] = tuple(chain)
+    return chains
+
+COUNTRY_PRIORITY_CHAINS = build_priority_chains()
+
+def get_priority_chain(country: str) -> Tuple[str, ...]:
+    return COUNTRY_PRIORITY_CHAINS.get(country) or (country, WTO_CATEGORY, DEFAULT_CATEGORY)
+
+class TariffRateIndex:
+    """(HS 코드, 국가/협정 구분) → (관세율, FTA 코드, 적용 관세) 색인. 같은 키가 여러 번 나오면 첫 규칙을 사용합니다."""
+
+    def __init__(self, rows: List[Tuple]):
+        self._rules: Dict[Tuple[str, str], Tuple[Any, Any, Any]] = {}
+        self._hs_codes = set()
+        for number, country, tax_rate, fta, category in rows:
+            self._hs_codes.add(number)
+            self._rules.setdefault((number, country), (tax_rate, fta, category))
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def has_hs_code(self, hs_code: str) -> bool:
+        return hs_code in self._hs_codes
+
+    def find_rule(self, hs_code: str, input_country: str) -> Optional[Tuple[str, Tuple[Any, Any, Any]]]:
+        """우선순위에 따라 처음 일치한 (국가/협정 구분, 규칙)을 반환합니다."""
+        for country_category in get_priority_chain(input_country):
+            rule = self._rules.get((hs_code, country_category))
+            if rule is not None:
+                return country_category, rule
+        return None
+
+    def resolve(self, hs_code: str, input_country: str) -> dict:
+        """get_tariff_info와 같은 형식의 관세율 정보를 반환합니다."""
+        if hs_code not in self._hs_codes:
+            return {'오류': f"HS Code '{hs_code}'를 찾을 수 없습니다."}
+        found = self.find_rule(hs_code, input_country)
+        if found is None:
+            return {'오류': f"HS Code '{hs_code}'에 대한 적용 가능한 관세 규칙을 찾을 수 없습니다."}
+        country_category, (rate, fta_code, category) = found
+        return {
+            '관세율': rate,
+            '적용 관세': category,
+            # fta 코드(1 또는 2)에 따라 'Yes'/'No' 결정
+            'FTA 적용': 'Yes' if fta_code == 2 else 'No',
+            '비고': f"'{country_category}' 조건에 따라 세율이 결정되었습니다."
+        }
+
+def load_tariff_rate_index(snapshot: TariffSnapshot = tariff_snapshot) -> TariffRateIndex:
+    return TariffRateIndex(snapshot.all_tariff_rows())
+
+_tariff_rate_index: Optional[TariffRateIndex] = None
+_tariff_rate_index_lock = threading.Lock()
+
+def get_tariff_rate_index() -> TariffRateIndex:
+    """관세율 색인을 프로세스당 한 번만 만들어 공유합니다."""
+    global _tariff_rate_index
+    if _tariff_rate_index is None:
+        with _tariff_rate_index_lock:
+            if _tariff_rate_index is None:
+                _tariff_rate_index = load_tariff_rate_index()
+    return _tariff_rate_index
+
+def verification_countries(table_countries: List[str]) -> List[str]:
+    """
+    우선순위가 달라지는 경우를 모두 포함하는 국가 목록을 만듭니다.
+    테이블에 직접 나오는 국가/협정 구분 전부와, 그 외 국가는 같은 우선순위(그룹 구성)마다 대표 한 곳,
+    그리고 어느 그룹에도 속하지 않는 국가와 빈 값을 포함합니다.
+    """
+    countries = set(table_countries)
+    representatives: Dict[Tuple[str, ...], str] = {}
+    for country in sorted(set(COUNTRY_PRIORITY_CHAINS) - countries):
+        representatives.setdefault(get_priority_chain(country)[1:], country)
+    countries.update(representatives.values())
+    countries.update(['일본', ''])
+    return sorted(countries)
+
+def verify_against_pandas() -> Dict[str, Any]:
+    """전체 관세율 테이블에서 색인 결과가 pandas 구현(get_tariff_info)과 같은지 확인합니다."""
+    import pandas as pd
+    from core.tariff_prediction.tools.calculate_tariff_amount import get_tariff_info
+
+    # 기준 결과는 기존 구현과 같이 원본 CSV를 pandas로 읽어 계산하고, 색인은 스냅샷에서 만듭니다.
+    full_tariff_df = pd.read_csv(TARIFF_CSV_PATH, dtype={'number': str})
+    index = load_tariff_rate_index()
+    countries = verification_countries(full_tariff_df['country'].dropna().unique().tolist())
+
+    started = time.time()
+    checked, mismatches = 0, []
+    # HS 코드별 부분 테이블을 넘겨도 get_tariff_info의 첫 필터 결과는 전체 테이블과 같습니다.
+    for hs_code, item_df in full_tariff_df.groupby('number', sort=False):
+        for country in countries:
+            expected = get_tariff_info(hs_code, country, item_df)
+            actual = index.resolve(hs_code, country)
+            checked += 1
+            if expected != actual or str(expected.get('관세율')) != str(actual.get('관세율')):
+                mismatches.append({'hs_code': hs_code, 'country': country, 'expected': expected, 'actual': actual})
+    missing_code = '0000000000'
+    checked += 1
+    if get_tariff_info(missing_code, '미국', full_tariff_df) != index.resolve(missing_code, '미국'):
+        mismatches.append({'hs_code': missing_code, 'country': '미국'})
+
+    return {
+        'rules': len(full_tariff_df),
+        'hs_codes': full_tariff_df['number'].nunique(),
+        'countries': len(countries),
+        'checked': checked,
+        'mismatches': len(mismatches),
+        'mismatch_examples': mismatches[:10],
+        'seconds': round(time.time() - started, 1),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="관세율 색인 검증")
+    parser.add_argument("--verify", action="store_true", help="pandas 구현과 전체 테이블 결과 비교")
+    args = parser.parse_args()
+    if args.verify:
+        report = verify_against_pandas()
+        print(report)
+        if report['mismatches']:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
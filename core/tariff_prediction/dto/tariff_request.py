@@ -2,7 +2,7 @@ from pydantic import BaseModel
 from typing import Optional, Literal
 
 class TariffPredictionRequest(BaseModel):
-    step: Literal["input", "hs6_select", "hs10_select"]  # 현재 단계
+    step: Literal["auto", "input", "hs6_select", "hs10_select"] = "auto"  # 현재 단계 (auto이면 규칙으로 판단하고, 모호할 때만 LLM이 판단)
     product_description: Optional[str] = None  # 상품 설명 (input 단계)
     hs6_code: Optional[str] = None             # 선택한 HS6 코드 (hs6_select 단계)
     hs10_code: Optional[str] = None            # 선택한 HS10 코드 (hs10_select 단계)
@@ -10,4 +10,6 @@ class TariffPredictionRequest(BaseModel):
     price: Optional[float] = None              # 상품 가격 (hs10_select 단계)
     quantity: Optional[int] = 1                # 수량 (hs10_select 단계)
     shipping_cost: Optional[float] = 0         # 배송비 (hs10_select 단계)
-    scenario: Optional[str] = "해외직구"         # 시나리오 (hs10_select 단계) 
\ No newline at end of file
+    scenario: Optional[str] = "해외직구"         # 시나리오 (hs10_select 단계)
+    page: int = 1                              # HS10 후보 페이지 (hs6_select 단계, 1부터)
+    page_size: Optional[int] = None            # 페이지당 HS10 후보 수 (hs6_select 단계, 생략 시 HS10_CANDIDATES_PAGE_SIZE) 
\ No newline at end of file
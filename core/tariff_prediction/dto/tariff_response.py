@@ -4,13 +4,19 @@ from typing import List, Optional, Dict, Any, Literal
 class HSClassificationResult(BaseModel):
     """HS 코드 분류 결과"""
     hs_code: str
-    probability: str
+    probability: float                      # 0~1
     description: Optional[str] = None
 
 class TariffCalculationResult(BaseModel):
     """관세 계산 결과"""
     hs_code: str
-    tariff_rate: float
+    origin_country: str
+    product_price: float                    # 원
+    quantity: int
+    shipping_cost: float                    # 원
+    currency: str
+    exchange_rate: float                    # 1 통화 단위당 원
+    tariff_rate: float                      # %
     tariff_amount: float
     vat_amount: float
     total_tax: float
@@ -27,6 +33,7 @@ class ExchangeRateResult(BaseModel):
 class TariffPredictionResponse(BaseModel):
     step: Literal["hs6_select", "hs10_select", "result"]  # 다음 단계
     hs6_candidates: Optional[List[Dict[str, Any]]] = None     # HS6 후보 리스트 (input 단계 응답)
-    hs10_candidates: Optional[List[Dict[str, Any]]] = None    # HS10 후보 리스트 (hs6_select 단계 응답)
+    hs10_candidates: Optional[List[Dict[str, Any]]] = None    # HS10 후보 리스트 (hs6_select 단계 응답, 요청한 페이지만)
+    hs10_total: Optional[int] = None                          # 전체 HS10 후보 수 (hs6_select 단계 응답)
     calculation_result: Optional[Dict[str, Any]] = None       # 관세 계산 결과 (hs10_select 단계 응답)
     message: Optional[str] = None                             # 안내/에러 메시지 
\ No newline at end of file
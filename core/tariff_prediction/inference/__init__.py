@@ -0,0 +1 @@
+# Tariff Prediction Inference Backends
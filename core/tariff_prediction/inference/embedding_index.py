@@ -0,0 +1,99 @@
+"""
+(코드, 텍스트) 목록을 번들된 bge-m3 임베딩 모델로 미리 임베딩해 행렬 파일로 저장하고 읽는 공통 로직.
+HS6 검색 색인과 HS10 품목명 색인이 사용합니다.
+
+색인 파일과 함께 코드 순서와 텍스트 해시를 담은 메타 파일을 저장하며,
+데이터가 바뀌어 해시나 코드 순서가 다르면 색인을 사용하지 않습니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+from core.tariff_prediction.tools.get_hs_classification import HS_BATCH_SIZE, hs_classifier_registry
+
+logger = logging.getLogger(__name__)
+
+IndexT = TypeVar("IndexT")
+
+def search_texts_hash(codes: Sequence[str], texts: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for code, text in zip(codes, texts):
+        digest.update(f"{code}\t{text}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+class EmbeddingIndex(Generic[IndexT]):
+    """
+    entries()가 돌려주는 (코드 목록, 텍스트 목록)의 정규화된 임베딩 행렬 파일을 만들고 읽습니다.
+    읽은 행렬은 index_factory(codes, matrix)로 감싸 반환하며, get()은 프로세스당 한 번만 읽어 공유합니다.
+    """
+
+    def __init__(self, name: str, entries: Callable[[], Tuple[List[str], List[str]]],
+                 index_factory: Callable[[List[str], np.ndarray], IndexT], index_path: str, meta_path: str):
+        self.name = name
+        self.entries = entries
+        self.index_factory = index_factory
+        self.index_path = index_path
+        self.meta_path = meta_path
+        self._index: Optional[IndexT] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def build(self, index_path: Optional[str] = None, meta_path: Optional[str] = None) -> dict:
+        index_path = index_path or self.index_path
+        meta_path = meta_path or self.meta_path
+        embedding_model, _, _, _ = hs_classifier_registry.get()
+        if embedding_model is None:
+            raise RuntimeError("HS 코드 분류 임베딩 모델을 로드하지 못했습니다.")
+        codes, texts = self.entries()
+        started = time.time()
+        matrix = embedding_model.encode(texts, batch_size=HS_BATCH_SIZE, normalize_embeddings=True)
+        matrix = np.asarray(matrix, dtype=np.float32)
+
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 바꿉니다.
+        os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, matrix)
+        os.replace(tmp_path, index_path)
+        meta = {
+            "codes": codes,
+            "texts_sha256": search_texts_hash(codes, texts),
+            "dimension": int(matrix.shape[1]),
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "build_seconds": round(time.time() - started, 1),
+        }
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        return {key: value for key, value in meta.items() if key != "codes"} | {"rows": len(codes)}
+
+    def load(self, index_path: Optional[str] = None, meta_path: Optional[str] = None) -> Optional[IndexT]:
+        """색인을 읽습니다. 파일이 없거나 현재 데이터와 맞지 않으면 None을 반환합니다."""
+        index_path = index_path or self.index_path
+        meta_path = meta_path or self.meta_path
+        if not (os.path.exists(index_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        codes, texts = self.entries()
+        if meta.get("texts_sha256") != search_texts_hash(codes, texts) or meta.get("codes") != codes:
+            logger.warning("%s 색인이 현재 %s 데이터와 맞지 않아 사용하지 않습니다. --build로 다시 만들어 주세요.",
+                           self.name, self.name)
+            return None
+        return self.index_factory(codes, np.load(index_path, mmap_mode="r"))
+
+    def get(self) -> Optional[IndexT]:
+        """색인을 프로세스당 한 번만 읽어 공유합니다."""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    try:
+                        self._index = self.load()
+                    except (OSError, ValueError) as e:
+                        logger.warning("%s 색인을 읽지 못했습니다: %s", self.name, e)
+                    self._loaded = True
+        return self._index
@@ -0,0 +1,70 @@
+"""
+HS10.csv 한글품목명을 번들된 bge-m3 임베딩 모델로 미리 임베딩해 행렬 파일로 저장하고,
+HS6 아래 HS10 후보를 상품명과의 코사인 유사도 순으로 정렬하는 데 사용합니다.
+
+    python -m core.tariff_prediction.inference.hs10_description_index --build
+
+HS6 검색 색인과 같이 저장과 검증, 프로세스당 한 번 읽기는 embedding_index.EmbeddingIndex가 담당합니다.
+"""
+import argparse
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.tariff_prediction.constants.model_config import HS10_INDEX_PATH, HS10_INDEX_META_PATH
+from core.tariff_prediction.data.hs_tables import HSTables, get_hs_tables
+from core.tariff_prediction.inference.embedding_index import EmbeddingIndex
+
+def hs10_index_entries(hs_tables: HSTables) -> Tuple[List[str], List[str]]:
+    """품목명이 있는 HS10 코드와 품목명을 코드 순으로 반환합니다."""
+    items = sorted(
+        (hs10_code, description)
+        for candidates in hs_tables.hs10_by_hs6.values()
+        for hs10_code, description in candidates
+        if description and description.strip()
+    )
+    return [code for code, _ in items], [text for _, text in items]
+
+class HS10DescriptionIndex:
+    """정규화된 HS10 품목명 임베딩 행렬. 주어진 코드의 행만 골라 코사인 유사도(내적)를 계산합니다."""
+
+    def __init__(self, codes: List[str], matrix: np.ndarray):
+        self.codes = codes
+        self.matrix = matrix
+        self.rows: Dict[str, int] = {code: row for row, code in enumerate(codes)}
+
+    def scores(self, query_embedding: np.ndarray, codes: Sequence[str]) -> Dict[str, float]:
+        """codes 중 색인에 있는 코드의 유사도를 반환합니다. 색인에 없는 코드는 결과에 없습니다."""
+        known = [code for code in codes if code in self.rows]
+        if not known:
+            return {}
+        rows = self.matrix[[self.rows[code] for code in known]]
+        similarities = rows @ np.asarray(query_embedding, dtype=self.matrix.dtype)
+        return {code: float(score) for code, score in zip(known, similarities)}
+
+hs10_embedding_index = EmbeddingIndex(
+    "HS10", lambda: hs10_index_entries(get_hs_tables()), HS10DescriptionIndex, HS10_INDEX_PATH, HS10_INDEX_META_PATH
+)
+
+def build_hs10_index(index_path: str = HS10_INDEX_PATH, meta_path: str = HS10_INDEX_META_PATH) -> dict:
+    return hs10_embedding_index.build(index_path, meta_path)
+
+def load_hs10_index(index_path: str = HS10_INDEX_PATH, meta_path: str = HS10_INDEX_META_PATH) -> Optional[HS10DescriptionIndex]:
+    """색인을 읽습니다. 파일이 없거나 HS10 데이터와 맞지 않으면 None을 반환합니다."""
+    return hs10_embedding_index.load(index_path, meta_path)
+
+def get_hs10_description_index() -> Optional[HS10DescriptionIndex]:
+    """색인을 프로세스당 한 번만 읽어 공유합니다."""
+    return hs10_embedding_index.get()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HS10 한글품목명 임베딩 색인")
+    parser.add_argument("--build", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.build:
+        print(build_hs10_index())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+HS6.csv 검색텍스트를 번들된 bge-m3 임베딩 모델로 미리 임베딩해 행렬 파일로 저장하고, 로컬에서 가장 가까운 HS6 코드를 찾습니다.
+
+    python -m core.tariff_prediction.inference.hs6_search_index --build
+
+색인 파일(HS6_INDEX_PATH) 저장과 검증, 프로세스당 한 번 읽기는 embedding_index.EmbeddingIndex가 담당합니다.
+"""
+import argparse
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.tariff_prediction.constants.model_config import HS6_INDEX_PATH, HS6_INDEX_META_PATH
+from core.tariff_prediction.data.hs_tables import HSTables, get_hs_tables
+from core.tariff_prediction.inference.embedding_index import EmbeddingIndex
+
+def hs6_index_entries(hs_tables: HSTables) -> Tuple[List[str], List[str]]:
+    """검색텍스트가 있는 HS6 코드와 텍스트를 코드 순으로 반환합니다."""
+    items = sorted((code, text) for code, text in hs_tables.hs6_search_text.items() if text.strip())
+    return [code for code, _ in items], [text for _, text in items]
+
+class HS6SearchIndex:
+    """정규화된 HS6 검색텍스트 임베딩 행렬. 코사인 유사도(내적)로 가까운 코드를 찾습니다."""
+
+    def __init__(self, codes: List[str], matrix: np.ndarray):
+        self.codes = codes
+        self.matrix = matrix
+
+    def search(self, query_embedding: np.ndarray, top_k: int,
+               exclude_codes: Sequence[str] = ()) -> List[Tuple[str, float]]:
+        scores = self.matrix @ np.asarray(query_embedding, dtype=self.matrix.dtype)
+        excluded = set(exclude_codes)
+        limit = min(top_k + len(excluded), len(self.codes))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        results = [(self.codes[i], float(scores[i])) for i in top if self.codes[i] not in excluded]
+        return results[:top_k]
+
+hs6_embedding_index = EmbeddingIndex(
+    "HS6", lambda: hs6_index_entries(get_hs_tables()), HS6SearchIndex, HS6_INDEX_PATH, HS6_INDEX_META_PATH
+)
+
+def build_hs6_index(index_path: str = HS6_INDEX_PATH, meta_path: str = HS6_INDEX_META_PATH) -> dict:
+    return hs6_embedding_index.build(index_path, meta_path)
+
+def load_hs6_index(index_path: str = HS6_INDEX_PATH, meta_path: str = HS6_INDEX_META_PATH) -> Optional[HS6SearchIndex]:
+    """색인을 읽습니다. 파일이 없거나 HS6 데이터와 맞지 않으면 None을 반환합니다."""
+    return hs6_embedding_index.load(index_path, meta_path)
+
+def get_hs6_search_index() -> Optional[HS6SearchIndex]:
+    """색인을 프로세스당 한 번만 읽어 공유합니다."""
+    return hs6_embedding_index.get()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HS6 검색텍스트 임베딩 색인")
+    parser.add_argument("--build", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.build:
+        print(build_hs6_index())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import json
+import logging
+import os
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from core.tariff_prediction.constants.model_config import (
+    HS_ONNX_DIR, HS_ONNX_QUANTIZED, HS_ONNX_THREADS,
+    ONNX_ENCODER_FILE, ONNX_HEAD_FILE, ONNX_QUANTIZED_SUFFIX, ONNX_TOKENIZER_DIR, ONNX_META_FILE
+)
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+def onnx_model_path(onnx_dir: str, file_name: str, quantized: bool) -> str:
+    if quantized:
+        file_name = file_name.replace(".onnx", ONNX_QUANTIZED_SUFFIX)
+    return os.path.join(onnx_dir, file_name)
+
+def create_session(path: str) -> "ort.InferenceSession":
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if HS_ONNX_THREADS > 0:
+        options.intra_op_num_threads = HS_ONNX_THREADS
+    return ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+
+class OnnxEmbeddingModel:
+    """
+    ONNX로 내보낸 bge-m3 인코더(풀링·정규화 포함)를 SentenceTransformer.encode와 같은 형태로 감쌉니다.
+    predict_hs_codes_batch 등 기존 torch 경로의 코드를 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, session: "ort.InferenceSession", tokenizer, max_seq_length: int):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_seq_length = max_seq_length
+
+    def encode(self, sentences, batch_size: int = 32, convert_to_tensor: bool = False,
+               normalize_embeddings: bool = True, **kwargs):
+        # 정규화는 그래프 안에서 수행되므로 normalize_embeddings는 호환용 인자입니다.
+        single_input = isinstance(sentences, str)
+        texts: List[str] = [sentences] if single_input else list(sentences)
+        # 패딩 낭비를 줄이기 위해 SentenceTransformer와 같이 길이순으로 배치를 구성합니다.
+        order = np.argsort([-len(text) for text in texts], kind="stable")
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            batch_indices = order[start:start + batch_size]
+            encoded = self.tokenizer(
+                [texts[i] for i in batch_indices], padding=True, truncation=True,
+                max_length=self.max_seq_length, return_tensors="np"
+            )
+            (batch_embeddings,) = self.session.run(None, {
+                "input_ids": encoded["input_ids"].astype(np.int64),
+                "attention_mask": encoded["attention_mask"].astype(np.int64),
+            })
+            for i, embedding in zip(batch_indices, batch_embeddings):
+                embeddings[i] = embedding
+        result = np.stack(embeddings) if texts else np.zeros((0, 1024), dtype=np.float32)
+        if single_input:
+            result = result[0]
+        return torch.from_numpy(result) if convert_to_tensor else result
+
+class OnnxClassifierHead:
+    """ONNX로 내보낸 MLP 분류기를 torch 모듈처럼 호출할 수 있게 감쌉니다."""
+
+    def __init__(self, session: "ort.InferenceSession"):
+        self.session = session
+
+    def __call__(self, embeddings: torch.Tensor) -> torch.Tensor:
+        (logits,) = self.session.run(None, {"embedding": embeddings.cpu().numpy().astype(np.float32)})
+        return torch.from_numpy(logits)
+
+    def eval(self) -> "OnnxClassifierHead":
+        return self
+
+def load_onnx_models(onnx_dir: str = HS_ONNX_DIR, quantized: bool = HS_ONNX_QUANTIZED) -> Tuple[Any, Any]:
+    """(embedding_model, classifier_model)을 반환합니다. 내보낸 파일이 없으면 (None, None)을 반환합니다."""
+    if not ONNX_RUNTIME_AVAILABLE:
+        logger.warning("onnxruntime이 설치되어 있지 않아 ONNX 백엔드를 사용할 수 없습니다.")
+        return None, None
+    encoder_path = onnx_model_path(onnx_dir, ONNX_ENCODER_FILE, quantized)
+    head_path = onnx_model_path(onnx_dir, ONNX_HEAD_FILE, quantized)
+    tokenizer_dir = os.path.join(onnx_dir, ONNX_TOKENIZER_DIR)
+    meta_path = os.path.join(onnx_dir, ONNX_META_FILE)
+    if not all(os.path.exists(path) for path in [encoder_path, head_path, tokenizer_dir, meta_path]):
+        logger.warning("ONNX 모델 파일이 없습니다: %s", onnx_dir)
+        return None, None
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_dir)
+    embedding_model = OnnxEmbeddingModel(create_session(encoder_path), tokenizer, meta["max_seq_length"])
+    classifier_model = OnnxClassifierHead(create_session(head_path))
+    return embedding_model, classifier_model
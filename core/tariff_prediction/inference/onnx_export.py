@@ -0,0 +1,157 @@
+"""
+HS 코드 분류 모델(bge-m3 인코더 + MLP 분류기)을 ONNX로 내보냅니다.
+
+    python -m core.tariff_prediction.inference.onnx_export --quantize \
+        --validation-file core/tariff_prediction/data/HS6.csv --column 검색텍스트
+
+출력 디렉터리(기본 HS_ONNX_DIR)에 encoder.onnx(풀링·정규화 포함), head.onnx, 토크나이저와 메타데이터를 저장하고,
+--quantize를 주면 가중치를 int8로 동적 양자화한 *.int8.onnx도 함께 만듭니다.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+
+import joblib
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from core.tariff_prediction.constants.model_config import (
+    EMBEDDING_MODEL_PATH, LABEL_ENCODER_PATH, MLP_MODEL_PATH, HS_ONNX_DIR,
+    ONNX_ENCODER_FILE, ONNX_HEAD_FILE, ONNX_TOKENIZER_DIR, ONNX_META_FILE
+)
+from core.tariff_prediction.inference.onnx_backend import onnx_model_path
+from core.tariff_prediction.tools.get_hs_classification import MLP
+
+logger = logging.getLogger(__name__)
+
+ONNX_OPSET_VERSION = 17
+POOLING_CLS = "cls"
+POOLING_MEAN = "mean"
+
+class EncoderWithPooling(nn.Module):
+    """트랜스포머 출력에 SentenceTransformer와 같은 풀링과 L2 정규화를 붙여 하나의 그래프로 내보냅니다."""
+
+    def __init__(self, auto_model: nn.Module, pooling_mode: str):
+        super().__init__()
+        self.auto_model = auto_model
+        self.pooling_mode = pooling_mode
+
+    def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        token_embeddings = self.auto_model(input_ids=input_ids, attention_mask=attention_mask)[0]
+        if self.pooling_mode == POOLING_CLS:
+            embedding = token_embeddings[:, 0]
+        else:
+            mask = attention_mask.unsqueeze(-1).to(token_embeddings.dtype)
+            embedding = (token_embeddings * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        return F.normalize(embedding, p=2, dim=1)
+
+def resolve_pooling_mode(embedding_model) -> str:
+    config = embedding_model[1].get_config_dict()
+    if config.get("pooling_mode_cls_token"):
+        return POOLING_CLS
+    if config.get("pooling_mode_mean_tokens"):
+        return POOLING_MEAN
+    raise ValueError(f"지원하지 않는 풀링 방식입니다: {config}")
+
+def export_encoder(embedding_model, output_path: str) -> str:
+    pooling_mode = resolve_pooling_mode(embedding_model)
+    encoder = EncoderWithPooling(embedding_model[0].auto_model, pooling_mode).eval()
+    dummy = embedding_model.tokenizer(["품명: 노트북 컴퓨터 [SEP] 상세설명:"], return_tensors="pt")
+    with torch.no_grad():
+        # 2GB를 넘는 가중치는 torch가 외부 데이터 파일로 나눠 저장합니다.
+        torch.onnx.export(
+            encoder,
+            (dummy["input_ids"], dummy["attention_mask"]),
+            output_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["embedding"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "embedding": {0: "batch"},
+            },
+            opset_version=ONNX_OPSET_VERSION,
+        )
+    return pooling_mode
+
+def export_head(classifier_model: nn.Module, output_path: str) -> None:
+    with torch.no_grad():
+        torch.onnx.export(
+            classifier_model.eval(),
+            (torch.zeros(1, 1024),),
+            output_path,
+            input_names=["embedding"],
+            output_names=["logits"],
+            dynamic_axes={"embedding": {0: "batch"}, "logits": {0: "batch"}},
+            opset_version=ONNX_OPSET_VERSION,
+        )
+
+def quantize_model(input_path: str, output_path: str) -> None:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    quantize_dynamic(input_path, output_path, weight_type=QuantType.QInt8)
+
+def export_onnx(output_dir: str = HS_ONNX_DIR, quantize: bool = False) -> dict:
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(output_dir, exist_ok=True)
+    embedding_model = SentenceTransformer(EMBEDDING_MODEL_PATH, device="cpu")
+    label_encoder = joblib.load(LABEL_ENCODER_PATH)
+    classifier_model = MLP(len(label_encoder.classes_))
+    classifier_model.load_state_dict(torch.load(MLP_MODEL_PATH, map_location="cpu"))
+
+    started = time.time()
+    pooling_mode = export_encoder(embedding_model, os.path.join(output_dir, ONNX_ENCODER_FILE))
+    export_head(classifier_model, os.path.join(output_dir, ONNX_HEAD_FILE))
+
+    tokenizer_dir = os.path.join(output_dir, ONNX_TOKENIZER_DIR)
+    shutil.rmtree(tokenizer_dir, ignore_errors=True)
+    embedding_model.tokenizer.save_pretrained(tokenizer_dir)
+
+    if quantize:
+        for file_name in (ONNX_ENCODER_FILE, ONNX_HEAD_FILE):
+            quantize_model(
+                onnx_model_path(output_dir, file_name, quantized=False),
+                onnx_model_path(output_dir, file_name, quantized=True)
+            )
+
+    meta = {
+        "max_seq_length": embedding_model.max_seq_length,
+        "pooling_mode": pooling_mode,
+        "num_labels": len(label_encoder.classes_),
+        "opset_version": ONNX_OPSET_VERSION,
+        "quantized": quantize,
+        "torch_version": torch.__version__,
+        "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "export_seconds": round(time.time() - started, 1),
+    }
+    with open(os.path.join(output_dir, ONNX_META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HS 코드 분류 모델 ONNX 내보내기")
+    parser.add_argument("--output-dir", default=HS_ONNX_DIR)
+    parser.add_argument("--quantize", action="store_true", help="int8 동적 양자화 모델도 생성")
+    parser.add_argument("--validation-file", help="내보낸 뒤 torch 모델과 비교할 검증 파일(.csv/.txt)")
+    parser.add_argument("--column", default="description", help="검증 CSV의 상품 설명 컬럼")
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    meta = export_onnx(args.output_dir, quantize=args.quantize)
+    logger.info("ONNX 내보내기 완료: %s", json.dumps(meta, ensure_ascii=False))
+
+    if args.validation_file:
+        from core.tariff_prediction.inference.onnx_parity import build_parity_report
+        report = build_parity_report(
+            args.validation_file, column=args.column, limit=args.limit,
+            onnx_dir=args.output_dir, quantized=args.quantize
+        )
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+ONNX 백엔드와 torch 모델의 HS 코드 예측 결과를 비교합니다.
+
+    python -m core.tariff_prediction.inference.onnx_parity \
+        --validation-file core/tariff_prediction/data/HS6.csv --column 검색텍스트 --limit 1000
+
+top-1/top-5 일치율과 확률 차이(drift)를 JSON 리포트로 출력합니다.
+"""
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import torch
+
+from core.tariff_prediction.constants.model_config import HS_ONNX_DIR, HS_ONNX_QUANTIZED
+from core.tariff_prediction.tools.get_hs_classification import (
+    HS_BACKEND_ONNX, HS_BACKEND_TORCH, HS_BATCH_SIZE, format_item_text, load_model
+)
+
+TOP_K = 5
+
+def load_validation_texts(path: str, column: str, limit: int) -> List[str]:
+    if os.path.splitext(path)[1].lower() == ".csv":
+        texts = pd.read_csv(path, dtype=str)[column].dropna().tolist()
+    else:
+        with open(path, encoding="utf-8") as f:
+            texts = [line.strip() for line in f]
+    texts = [text.strip() for text in texts if text and text.strip()]
+    return texts[:limit] if limit > 0 else texts
+
+def compute_probabilities(texts: List[str], embedding_model, classifier_model, device) -> np.ndarray:
+    with torch.no_grad():
+        embeddings = embedding_model.encode(
+            [format_item_text(text) for text in texts],
+            batch_size=HS_BATCH_SIZE, convert_to_tensor=True, normalize_embeddings=True
+        )
+        logits = classifier_model(embeddings.to(device))
+        return torch.softmax(logits, dim=1).cpu().numpy()
+
+def build_parity_report(validation_file: str, column: str = "description", limit: int = 1000,
+                        onnx_dir: str = HS_ONNX_DIR, quantized: bool = HS_ONNX_QUANTIZED) -> Dict[str, Any]:
+    texts = load_validation_texts(validation_file, column, limit)
+    if not texts:
+        raise ValueError(f"검증 데이터가 비어 있습니다: {validation_file}")
+
+    torch_models = load_model(HS_BACKEND_TORCH)
+    onnx_models = load_model(HS_BACKEND_ONNX, onnx_dir=onnx_dir, quantized=quantized)
+    if not all(torch_models) or not all(onnx_models):
+        raise RuntimeError("torch 또는 ONNX 모델을 로드하지 못했습니다.")
+
+    timings = {}
+    started = time.time()
+    torch_probs = compute_probabilities(texts, torch_models[0], torch_models[2], torch_models[3])
+    timings["torch_seconds"] = round(time.time() - started, 3)
+    started = time.time()
+    onnx_probs = compute_probabilities(texts, onnx_models[0], onnx_models[2], onnx_models[3])
+    timings["onnx_seconds"] = round(time.time() - started, 3)
+
+    torch_top = np.argsort(-torch_probs, axis=1)[:, :TOP_K]
+    onnx_top = np.argsort(-onnx_probs, axis=1)[:, :TOP_K]
+    top5_overlap = np.array([len(set(a) & set(b)) / TOP_K for a, b in zip(torch_top, onnx_top)])
+    # torch 모델의 top-5 코드에 대해 두 백엔드가 준 확률의 차이
+    top5_drift = np.abs(
+        np.take_along_axis(torch_probs, torch_top, axis=1) - np.take_along_axis(onnx_probs, torch_top, axis=1)
+    )
+    full_drift = np.abs(torch_probs - onnx_probs)
+
+    return {
+        "validation_file": validation_file,
+        "samples": len(texts),
+        "onnx_dir": onnx_dir,
+        "quantized": quantized,
+        "top1_agreement": round(float(np.mean(torch_top[:, 0] == onnx_top[:, 0])), 4),
+        "top5_exact_agreement": round(float(np.mean(top5_overlap == 1.0)), 4),
+        "top5_mean_overlap": round(float(np.mean(top5_overlap)), 4),
+        "top5_prob_drift_mean": round(float(np.mean(top5_drift)), 6),
+        "top5_prob_drift_max": round(float(np.max(top5_drift)), 6),
+        "prob_drift_max": round(float(np.max(full_drift)), 6),
+        **timings,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HS 코드 분류 ONNX/torch 일치도 리포트")
+    parser.add_argument("--validation-file", required=True)
+    parser.add_argument("--column", default="description")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--onnx-dir", default=HS_ONNX_DIR)
+    parser.add_argument("--fp32", action="store_true", help="양자화하지 않은 ONNX 모델과 비교")
+    parser.add_argument("--output", help="리포트를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = build_parity_report(
+        args.validation_file, column=args.column, limit=args.limit,
+        onnx_dir=args.onnx_dir, quantized=not args.fp32
+    )
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.tariff_prediction.constants import VAT_THRESHOLDS, TARIFF_CALCULATION
+from core.tariff_prediction.data.snapshot import tariff_snapshot
+from core.tariff_prediction.data.tariff_rate_index import get_tariff_rate_index
+from core.tariff_prediction.tools.get_exchange_rate_info import get_exchange_rate_api
+
+# 입력 테이블 컬럼 (quantity, shipping_cost, situation은 생략 가능)
+BULK_INPUT_COLUMNS = ['hs_code', 'origin_country', 'price', 'quantity', 'shipping_cost', 'situation']
+BULK_REQUIRED_COLUMNS = ['hs_code', 'origin_country', 'price']
+BULK_OUTPUT_COLUMNS = BULK_INPUT_COLUMNS + [
+    'tariff_rate', 'tariff_rule', 'fta', 'note', 'currency', 'exchange_rate',
+    'total_price', 'tax_amount', 'vat', 'total_tax', 'error'
+]
+
+# 환율 종류: 해외직구/해외체류 중 구매는 ttb, 해외배송은 tts (get_exchange_rate_api와 동일)
+RATE_SITUATIONS = {'해외직구': '해외직구', '해외체류 중 구매': '해외직구', '해외배송': '해외배송'}
+
+def _resolve_tariff_rules(pairs: pd.DataFrame) -> pd.DataFrame:
+    """(hs_code, origin_country) 조합별로 한 번씩 관세율을 찾아 조인용 테이블을 만듭니다."""
+    index = get_tariff_rate_index()
+    records = []
+    for hs_code, origin_country in pairs.itertuples(index=False):
+        info = index.resolve(hs_code, origin_country)
+        records.append({
+            'hs_code': hs_code,
+            'origin_country': origin_country,
+            'tariff_rate': info.get('관세율'),
+            'tariff_rule': info.get('적용 관세'),
+            'fta': info.get('FTA 적용'),
+            'note': info.get('비고'),
+            'error': f"관세율 조회 실패: {info['오류']}" if '오류' in info else None,
+        })
+    return pd.DataFrame(records, columns=['hs_code', 'origin_country', 'tariff_rate', 'tariff_rule', 'fta', 'note', 'error'])
+
+def _resolve_exchange_rates(pairs: pd.DataFrame, fetch_rate: Callable[[str, str], Optional[float]]) -> pd.DataFrame:
+    """(통화, 환율 종류) 조합마다 환율을 한 번만 조회합니다."""
+    cache: Dict[Tuple[str, str], float] = {}
+    rates = []
+    for currency, situation in pairs.itertuples(index=False):
+        if currency.upper() == 'KRW':
+            rates.append(1.0)
+            continue
+        # 지원하지 않는 시나리오는 단건 계산과 같이 환율 조회에 실패한 것으로 보고 기본 환율을 씁니다.
+        key = (currency, RATE_SITUATIONS.get(situation, situation))
+        if key not in cache:
+            rate = fetch_rate(currency, situation) if situation in RATE_SITUATIONS else None
+            cache[key] = rate if rate is not None else TARIFF_CALCULATION['DEFAULT_USD_RATE']
+        rates.append(cache[key])
+    return pairs.assign(exchange_rate=rates)
+
+def calculate_bulk_tariff_amount(
+    items: pd.DataFrame,
+    fetch_rate: Callable[[str, str], Optional[float]] = get_exchange_rate_api
+) -> pd.DataFrame:
+    """
+    여러 상품의 관세와 부가가치세를 한 번에 계산합니다.
+    calculate_tariff_amount와 같은 규칙(관세율 우선순위, 해외체류 면세 한도, 해외배송 관세 면제, 부가세 기준 금액)을
+    컬럼 연산으로 적용하며, 행마다 오류가 있으면 error 컬럼에 사유를 남기고 나머지 행은 계속 계산합니다.
+    """
+    missing = [column for column in BULK_REQUIRED_COLUMNS if column not in items.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    df = items.reset_index(drop=True).copy()
+    df['hs_code'] = df['hs_code'].fillna('').astype(str).str.strip()
+    df['origin_country'] = df['origin_country'].fillna('').astype(str)
+    df['price'] = pd.to_numeric(df['price'], errors='coerce')
+    df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce') if 'quantity' in df else 1
+    df['shipping_cost'] = pd.to_numeric(df['shipping_cost'], errors='coerce') if 'shipping_cost' in df else 0
+    df['situation'] = df['situation'].fillna('해외직구').astype(str).str.strip() if 'situation' in df else '해외직구'
+    df[['quantity', 'shipping_cost']] = df[['quantity', 'shipping_cost']].fillna({'quantity': 1, 'shipping_cost': 0})
+
+    # 1) 관세율: 관세율 조회는 입력한 원산지 그대로 사용합니다.
+    rules = _resolve_tariff_rules(df[['hs_code', 'origin_country']].drop_duplicates())
+    df = df.merge(rules, on=['hs_code', 'origin_country'], how='left')
+
+    # 2) 원산지가 비어 있으면 기본 국가로 환율·부가세 기준을 정합니다.
+    blank_country = df['origin_country'].str.strip() == ''
+    df.loc[blank_country, 'origin_country'] = TARIFF_CALCULATION['DEFAULT_COUNTRY']
+    countries = df['origin_country'].drop_duplicates()
+    currencies = {country: tariff_snapshot.get_currency_unit(country) or 'USD' for country in countries}
+    df['currency'] = df['origin_country'].map(currencies)
+    rates = _resolve_exchange_rates(df[['currency', 'situation']].drop_duplicates(), fetch_rate)
+    df = df.merge(rates, on=['currency', 'situation'], how='left')
+
+    # 3) 관세 계산
+    tax_rate = pd.to_numeric(df['tariff_rate'], errors='coerce')
+    invalid = df['error'].isna() & (tax_rate.isna() | df['price'].isna() | df['quantity'].isna())
+    df.loc[invalid, 'error'] = "관세 계산 중 오류 발생: 가격, 수량 또는 관세율이 올바르지 않습니다."
+    valid = df['error'].isna()
+
+    total_price = df['price'] * df['quantity'] + df['shipping_cost']
+    total_price_usd = total_price / df['exchange_rate']
+    tax_amount = total_price * (tax_rate / 100)
+    # 해외체류 중 구매는 면세 한도 이하일 때, 해외배송은 항상 관세를 부과하지 않습니다.
+    exempt = (
+        ((df['situation'] == '해외체류 중 구매') & (total_price_usd <= TARIFF_CALCULATION['PERSONAL_EXEMPTION_LIMIT']))
+        | (df['situation'] == '해외배송')
+    )
+    tax_amount = tax_amount.mask(exempt, 0.0)
+
+    # 4) 부가가치세 (미국 $200, 기타 $150 초과 시 부과)
+    vat_threshold = np.where(
+        df['origin_country'] == '미국', VAT_THRESHOLDS['US_THRESHOLD'], VAT_THRESHOLDS['OTHER_THRESHOLD']
+    )
+    vat = ((total_price + tax_amount) * VAT_THRESHOLDS['VAT_RATE']).where(total_price_usd > vat_threshold, 0.0)
+
+    df['total_price'] = total_price.where(valid)
+    df['tax_amount'] = tax_amount.where(valid)
+    df['vat'] = vat.where(valid)
+    df['total_tax'] = (tax_amount + vat).where(valid)
+    return df[BULK_OUTPUT_COLUMNS]
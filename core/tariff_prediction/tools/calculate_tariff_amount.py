@@ -1,8 +1,10 @@
 import pandas as pd
-import os
 from langchain_core.tools import tool
+from core.tariff_prediction.data.snapshot import tariff_snapshot
+from core.tariff_prediction.data.tariff_rate_index import get_tariff_rate_index
 from core.tariff_prediction.tools.get_exchange_rate_info import get_exchange_rate_api
 from core.tariff_prediction.constants import COUNTRY_GROUPS, VAT_THRESHOLDS, TARIFF_CALCULATION
+from core.tariff_prediction.dto.tariff_response import TariffCalculationResult
 
 def find_unit(country: str, df) -> str:
     """국가별 통화 단위를 찾습니다. df는 pandas DataFrame이어야 합니다."""
@@ -25,7 +27,8 @@ def find_unit(country: str, df) -> str:
         return 'USD'  # 국가 정보가 없으면 USD 반환 (None이 아닌 str)
 
 def get_tariff_info(hs_code: str, input_country: str, full_tariff_df) -> dict:
-    """주어진 HS코드와 국가명으로, 우선순위에 따라 가장 적합한 관세율 정보를 찾아 반환합니다. full_tariff_df는 pandas DataFrame이어야 합니다."""
+    """주어진 HS코드와 국가명으로, 우선순위에 따라 가장 적합한 관세율 정보를 찾아 반환합니다. full_tariff_df는 pandas DataFrame이어야 합니다.
+    런타임 조회는 같은 결과를 내는 TariffRateIndex.resolve를 사용하며, 이 함수는 검증용 기준 구현으로 유지합니다."""
     if not isinstance(full_tariff_df, pd.DataFrame):
         # numpy ndarray 등에서 DataFrame으로 변환 시 columns 지정 필요
         if hasattr(full_tariff_df, 'shape') and len(full_tariff_df.shape) == 2 and full_tariff_df.shape[1] >= 5:
@@ -124,6 +127,82 @@ def calculate_tax_amount(item_price: float, item_count: int, shipping_cost: floa
         'tax_amount_usd'  : tax_amount / usd_rate
     }
 
+class TariffCalculationError(ValueError):
+    """관세율·환율을 찾지 못해 계산할 수 없는 경우. 메시지는 사용자에게 그대로 보여 줄 수 있는 문장입니다."""
+
+def compute_tariff_amount(product_code: str, value: float, origin_country: str, item_count: int = 1,
+                          shipping_cost: float = 0, situation: str = "해외직구") -> TariffCalculationResult:
+    """calculate_tariff_amount와 같은 계산을 하되, 텍스트 대신 TariffCalculationResult를 반환합니다."""
+    # 관세율 정보 조회 (get_tariff_info와 같은 우선순위를 미리 색인한 dict로 찾습니다)
+    tariff_info = get_tariff_rate_index().resolve(product_code, origin_country)
+    if '오류' in tariff_info:
+        raise TariffCalculationError(f"관세율 조회 실패: {tariff_info['오류']}")
+
+    # 환율 조회
+    if not origin_country or origin_country.strip() == "":
+        origin_country = TARIFF_CALCULATION['DEFAULT_COUNTRY']  # 기본값으로 미국 설정
+
+    cur_unit = tariff_snapshot.get_currency_unit(origin_country) or 'USD'
+    # 원화 입력 시 환율 변환 생략
+    if cur_unit.upper() == 'KRW':
+        krw_rate = 1.0
+    else:
+        krw_rate = get_exchange_rate_api(cur_unit, situation)
+        if krw_rate is None:
+            krw_rate = TARIFF_CALCULATION['DEFAULT_USD_RATE']
+
+    # 관세 계산
+    tariff_rate = float(tariff_info['관세율'])
+    tax_info = calculate_tax_amount(value, item_count, shipping_cost, tariff_rate, krw_rate, situation)
+
+    # 부가가치세 계산 (미국 $200, 기타 $150 초과 시 무조건 부과)
+    VAT = 0
+    # USD 환율 계산
+    total_price_krw = tax_info['total_price']
+    total_price_usd = total_price_krw / krw_rate if krw_rate else 0
+    vat_threshold = VAT_THRESHOLDS['US_THRESHOLD'] if origin_country == '미국' else VAT_THRESHOLDS['OTHER_THRESHOLD']
+    if total_price_usd > vat_threshold:
+        VAT = (tax_info['total_price'] + tax_info['tax_amount']) * VAT_THRESHOLDS['VAT_RATE']
+
+    return TariffCalculationResult(
+        hs_code=product_code,
+        origin_country=origin_country,
+        product_price=value,
+        quantity=item_count,
+        shipping_cost=shipping_cost,
+        currency=cur_unit,
+        exchange_rate=krw_rate,
+        tariff_rate=tariff_rate,
+        tariff_amount=tax_info['tax_amount'],
+        vat_amount=VAT,
+        total_tax=tax_info['tax_amount'] + VAT,
+        fta_applied=tariff_info['FTA 적용'] == 'Yes',
+        applied_rule=str(tariff_info['적용 관세']),
+        notes=tariff_info['비고'],
+    )
+
+def plain_number(value: float):
+    """정수 값은 int로 바꿔 8.0%가 아닌 8%처럼 원래 표기로 렌더링되게 합니다."""
+    return int(value) if float(value).is_integer() else value
+
+def format_tariff_result_text(result: TariffCalculationResult) -> str:
+    """LLM 도구 응답용 '관세 계산 결과:' 텍스트로 렌더링합니다."""
+    fields = {
+        'HS코드': result.hs_code,
+        '원산지': result.origin_country,
+        '상품가격': f"{plain_number(result.product_price):,}원",
+        '수량': result.quantity,
+        '배송비': f"{plain_number(result.shipping_cost):,}원",
+        '관세율': f"{plain_number(result.tariff_rate)}%",
+        '관세금액': f"{result.tariff_amount:,.0f}원",
+        '부가가치세': f"{result.vat_amount:,.0f}원",
+        '총 세금': f"{result.total_tax:,.0f}원",
+        '적용 관세 규칙': result.applied_rule,
+        'FTA 적용': 'Yes' if result.fta_applied else 'No',
+        '비고': result.notes,
+    }
+    return f"관세 계산 결과:\n" + "\n".join([f"{k}: {v}" for k, v in fields.items()])
+
 @tool
 def calculate_tariff_amount(product_code: str, value: float, origin_country: str, item_count: int = 1, shipping_cost: float = 0, situation: str = "해외직구") -> str:
     """
@@ -131,61 +210,9 @@ def calculate_tariff_amount(product_code: str, value: float, origin_country: str
     실제 관세율 데이터베이스를 사용하여 정확한 관세를 계산합니다.
     """
     try:
-        # 데이터 파일 로드
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        tariff_df = pd.read_csv(os.path.join(data_dir, '국가별_관세_적용.csv'), dtype={'number': str})
-        currency_df = pd.read_csv(os.path.join(data_dir, '통화별_국가.csv'))
-        
-        # 관세율 정보 조회
-        tariff_info = get_tariff_info(product_code, origin_country, tariff_df)
-        
-        if '오류' in tariff_info:
-            return f"관세율 조회 실패: {tariff_info['오류']}"
-        
-        # 환율 조회
-        if not origin_country or origin_country.strip() == "":
-            origin_country = TARIFF_CALCULATION['DEFAULT_COUNTRY']  # 기본값으로 미국 설정
-        
-        cur_unit = find_unit(origin_country, currency_df)
-        if cur_unit is None:
-            return f"환율 정보를 찾을 수 없습니다. 국가: {origin_country}"
-        # 원화 입력 시 환율 변환 생략
-        if cur_unit.upper() == 'KRW':
-            krw_rate = 1.0
-        else:
-            krw_rate = get_exchange_rate_api(cur_unit, situation)
-            if krw_rate is None:
-                krw_rate = TARIFF_CALCULATION['DEFAULT_USD_RATE']
-
-        # 관세 계산
-        tax_info = calculate_tax_amount(value, item_count, shipping_cost, float(tariff_info['관세율']), krw_rate, situation)
-
-        # 부가가치세 계산 (미국 $200, 기타 $150 초과 시 무조건 부과)
-        VAT = 0
-        # USD 환율 계산
-        total_price_krw = tax_info['total_price']
-        total_price_usd = total_price_krw / krw_rate if krw_rate else 0
-        vat_threshold = VAT_THRESHOLDS['US_THRESHOLD'] if origin_country == '미국' else VAT_THRESHOLDS['OTHER_THRESHOLD']
-        if total_price_usd > vat_threshold:
-            VAT = (tax_info['total_price'] + tax_info['tax_amount']) * VAT_THRESHOLDS['VAT_RATE']
-
-        # 최종 결과
-        result = {
-            'HS코드': product_code,
-            '원산지': origin_country,
-            '상품가격': f"{value:,}원",
-            '수량': item_count,
-            '배송비': f"{shipping_cost:,}원",
-            '관세율': f"{tariff_info['관세율']}%",
-            '관세금액': f"{tax_info['tax_amount']:,.0f}원",
-            '부가가치세': f"{VAT:,.0f}원",
-            '총 세금': f"{tax_info['tax_amount'] + VAT:,.0f}원",
-            '적용 관세 규칙': tariff_info['적용 관세'],
-            'FTA 적용': tariff_info['FTA 적용'],
-            '비고': tariff_info['비고']
-        }
-        
-        return f"관세 계산 결과:\n" + "\n".join([f"{k}: {v}" for k, v in result.items()])
-        
+        result = compute_tariff_amount(product_code, value, origin_country, item_count, shipping_cost, situation)
+        return format_tariff_result_text(result)
+    except TariffCalculationError as e:
+        return str(e)
     except Exception as e:
-        return f"관세 계산 중 오류 발생: {str(e)}" 
\ No newline at end of file
+        return f"관세 계산 중 오류 발생: {str(e)}"
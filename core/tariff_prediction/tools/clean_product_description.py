@@ -2,6 +2,19 @@ from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 from core.shared.utils.llm import get_llm
 from core.tariff_prediction.constants import LLM_PROMPT_TEMPLATES
+from core.tariff_prediction.tools.llm_memo import tariff_llm_memo
+
+def _clean_with_llm(item_description: str) -> str:
+    llm = get_llm()
+    
+    prompt_template = LLM_PROMPT_TEMPLATES['clean_product_description']
+    
+    prompt = prompt_template.format(item_description=item_description)
+    
+    response = llm.invoke([HumanMessage(content=prompt)])
+
+    result = str(response.content) if hasattr(response, 'content') else str(response)
+    return result.strip()
 
 @tool
 def clean_product_description(item_description: str) -> str:
@@ -10,16 +23,9 @@ def clean_product_description(item_description: str) -> str:
     기능, 용도, 구성 재질, 작동 방식 등을 중심으로 명확한 설명을 생성합니다.
     """
     try:
-        llm = get_llm()
-        
-        prompt_template = LLM_PROMPT_TEMPLATES['clean_product_description']
-        
-        prompt = prompt_template.format(item_description=item_description)
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
-
-        result = str(response.content) if hasattr(response, 'content') else str(response)
-        return result.strip()
-
+        return tariff_llm_memo.get_or_compute(
+            "clean_product_description", LLM_PROMPT_TEMPLATES['clean_product_description'], item_description,
+            lambda: _clean_with_llm(item_description)
+        )
     except Exception as e:
-        return item_description  # 실패 시 원본 반환 
\ No newline at end of file
+        return item_description  # 실패 시 원본 반환
@@ -2,6 +2,23 @@ from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 from core.shared.utils.llm import get_llm
 from core.tariff_prediction.constants import VALID_SCENARIOS, SCENARIO_DETECTION, LLM_PROMPT_TEMPLATES
+from core.tariff_prediction.tools.llm_memo import tariff_llm_memo
+
+def _detect_with_llm(user_input: str) -> str | None:
+    llm = get_llm()
+    prompt = LLM_PROMPT_TEMPLATES['detect_scenario'].format(user_input=user_input)
+    response = llm.invoke([HumanMessage(content=prompt)])
+    result = str(response.content) if hasattr(response, 'content') else str(response)
+    
+    # LLM 응답 정제
+    for cleanup_keyword in SCENARIO_DETECTION['RESPONSE_CLEANUP_KEYWORDS']:
+        result = result.replace(cleanup_keyword, "")
+    result = result.strip()
+    
+    for scenario in VALID_SCENARIOS:
+        if scenario in result:
+            return scenario
+    return None
 
 @tool
 def detect_scenario_from_input(user_input: str) -> str | None:
@@ -10,19 +27,10 @@ def detect_scenario_from_input(user_input: str) -> str | None:
     LLM을 사용해 감지합니다.
     """
     try:
-        llm = get_llm()
-        prompt = LLM_PROMPT_TEMPLATES['detect_scenario'].format(user_input=user_input)
-        response = llm.invoke([HumanMessage(content=prompt)])
-        result = str(response.content) if hasattr(response, 'content') else str(response)
-        
-        # LLM 응답 정제
-        for cleanup_keyword in SCENARIO_DETECTION['RESPONSE_CLEANUP_KEYWORDS']:
-            result = result.replace(cleanup_keyword, "")
-        result = result.strip()
-        
-        for scenario in VALID_SCENARIOS:
-            if scenario in result:
-                return scenario
-        return None
+        # 시나리오를 찾지 못한 응답(None)도 캐시하고, LLM 호출 실패만 캐시하지 않습니다.
+        return tariff_llm_memo.get_or_compute(
+            "detect_scenario", LLM_PROMPT_TEMPLATES['detect_scenario'], user_input,
+            lambda: _detect_with_llm(user_input)
+        )
     except Exception:
-        return None 
\ No newline at end of file
+        return None
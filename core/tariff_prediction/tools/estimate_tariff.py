@@ -0,0 +1,83 @@
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from core.tariff_prediction.data.tariff_rate_index import get_tariff_rate_index
+from core.tariff_prediction.tools.calculate_bulk_tariff_amount import calculate_bulk_tariff_amount
+from core.tariff_prediction.tools.get_exchange_rate_info import get_exchange_rate_api
+from core.tariff_prediction.tools.get_hs_classification import classify_hs_code
+from core.tariff_prediction.tools.parse_hs_results import list_hs10_candidates
+from core.tariff_prediction.tools.rank_hs10_candidates import rank_hs10_candidates
+
+ESTIMATE_TARIFF_FIELDS = [
+    'tariff_rate', 'tariff_rule', 'fta', 'note', 'currency', 'exchange_rate',
+    'total_price', 'tax_amount', 'vat', 'total_tax', 'error'
+]
+
+def select_hs10_code(candidates: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """HS10 후보 중 관세율 규칙이 있는 첫 코드를 고릅니다. 규칙이 있는 코드가 없으면 첫 후보를 반환합니다."""
+    if not candidates:
+        return None
+    index = get_tariff_rate_index()
+    return next((candidate for candidate in candidates if index.has_hs_code(candidate['code'])), candidates[0])
+
+def _clean_value(value: Any) -> Any:
+    # JSON 응답을 위해 numpy 값을 파이썬 값으로 바꿉니다.
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+def estimate_tariff(product_description: str, origin_country: str, price: float, quantity: int = 1,
+                    shipping_cost: float = 0, scenario: str = '해외직구', top_k: int = 3,
+                    fetch_rate: Callable[[str, str], Optional[float]] = get_exchange_rate_api) -> Optional[Dict[str, Any]]:
+    """
+    HS 코드 선택 대화 없이 한 번에 관세를 추정합니다.
+    HS6는 분류 모델의 1순위, HS10은 그 아래에서 관세율 규칙이 있는 첫 코드를 사용하고,
+    나머지 HS6 후보와 HS10 후보를 함께 반환합니다. HS 코드 예측 모델이 준비되지 않았으면 None을 반환하고,
+    HS6 후보가 하나도 없으면 tariff.error에 사유를 담아 반환합니다.
+    """
+    results = classify_hs_code(product_description, top_k=top_k)
+    if results is None:
+        return None
+    hs6_candidates: List[Dict[str, Any]] = [
+        {'hs6_code': result.hs_code, 'probability': round(result.probability, 4), 'description': result.description}
+        for result in results
+    ]
+    if not hs6_candidates:
+        return {
+            'hs6': None,
+            'hs10': None,
+            'alternatives': [],
+            'hs10_alternatives': [],
+            'tariff': {'error': "상품 설명에 해당하는 HS6 후보가 없습니다."},
+        }
+    selected_hs6 = hs6_candidates[0]
+    # HS10은 상품 설명과 품목명이 가까운 순으로 정렬한 뒤 고릅니다.
+    hs10_candidates = rank_hs10_candidates(list_hs10_candidates(selected_hs6['hs6_code']), product_description)
+    selected_hs10 = select_hs10_code(hs10_candidates)
+    hs10_alternatives = [
+        candidate for candidate in hs10_candidates
+        if not selected_hs10 or candidate['code'] != selected_hs10['code']
+    ]
+
+    result: Dict[str, Any] = {
+        'hs6': selected_hs6,
+        'hs10': selected_hs10,
+        'alternatives': hs6_candidates[1:],
+        'hs10_alternatives': hs10_alternatives,
+    }
+    if selected_hs10 is None:
+        result['tariff'] = {'error': f"HS6 코드 '{selected_hs6['hs6_code']}'에 해당하는 HS10 코드가 없습니다."}
+        return result
+
+    # 일괄 계산과 같은 규칙으로 계산하도록 한 행짜리 테이블로 계산합니다.
+    row = calculate_bulk_tariff_amount(pd.DataFrame([{
+        'hs_code': selected_hs10['code'],
+        'origin_country': origin_country,
+        'price': price,
+        'quantity': quantity,
+        'shipping_cost': shipping_cost,
+        'situation': scenario,
+    }]), fetch_rate=fetch_rate).iloc[0]
+    result['tariff'] = {field: _clean_value(row[field]) for field in ESTIMATE_TARIFF_FIELDS}
+    return result
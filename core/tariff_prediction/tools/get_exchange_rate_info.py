@@ -1,12 +1,17 @@
+import logging
 import requests
 from datetime import datetime
-import pandas as pd
-import re
 from langchain_core.tools import tool
 
-from core.tariff_prediction.constants.api_config import KOREAEXIM_API_URL, KOREAEXIM_API_KEY
+from core.shared.utils.circuit_breaker import get_circuit_breaker
+from core.tariff_prediction.data.exchange_rate_store import ExchangeRateStore
+from core.tariff_prediction.constants.api_config import KOREAEXIM_API_URL, KOREAEXIM_API_KEY, KOREAEXIM_TIMEOUT_SECONDS
 from core.tariff_prediction.constants import SUPPORTED_COUNTRIES
 
+logger = logging.getLogger(__name__)
+
+koreaexim_circuit_breaker = get_circuit_breaker("koreaexim")
+
 def is_supported_country(country: str) -> bool:
     """지원되는 국가인지 확인합니다."""
     return country in SUPPORTED_COUNTRIES
@@ -15,39 +20,34 @@ def get_currency_for_country(country: str) -> str:
     """국가에 해당하는 통화를 반환합니다."""
     return SUPPORTED_COUNTRIES.get(country, 'USD')
 
-def get_exchange_rate_api(cur_unit: str, situation: str = '해외직구'):
-    """한국수출입은행 API를 사용하여 환율을 조회합니다."""
-
-    today_date = datetime.now().strftime('%Y%m%d')
-    
+def _fetch_exchange_table(searchdate: str) -> list:
+    """한국수출입은행 API에서 기준일의 AP01 환율표를 가져옵니다."""
     params = {
         'authkey': KOREAEXIM_API_KEY,
-        'searchdate': today_date,
+        'searchdate': searchdate,
         'data': 'AP01'
     }
+    response = requests.get(KOREAEXIM_API_URL, params=params, timeout=KOREAEXIM_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    return response.json()
 
-    try:
-        response = requests.get(KOREAEXIM_API_URL, params=params)
-        response.raise_for_status()
-        data = pd.DataFrame(response.json())
+def _fetch_exchange_table_with_breaker(searchdate: str) -> list:
+    fetched = koreaexim_circuit_breaker.call(searchdate, _fetch_exchange_table, searchdate)
+    if fetched.stale:
+        logger.warning("환율 api 장애: %s 에 조회한 %s 환율표를 사용합니다.", fetched.fetched_at_str, searchdate)
+    return fetched.value
 
-        filtered_data = data[data['cur_unit'] == cur_unit]
-        if filtered_data.empty:
-            raise ValueError(f"Currency {cur_unit} not found in exchange rate data")
-            
-        if situation == '해외직구' or situation == '해외체류 중 구매':
-            usd_rate = filtered_data['ttb'].iloc[0]
-        elif situation == '해외배송':
-            usd_rate = filtered_data['tts'].iloc[0]
-        else:
-            raise ValueError("Invalid situation. Use '해외직구' or '해외배송'.")
-        
-        usd_rate = re.sub(r'(?<=\d),(?=\d)', '', usd_rate)
-        usd_rate = float(usd_rate)
+exchange_rate_store = ExchangeRateStore(_fetch_exchange_table_with_breaker)
 
-        return usd_rate
+def get_exchange_rate_api(cur_unit: str, situation: str = '해외직구'):
+    """한국수출입은행 환율을 조회합니다. 환율표는 영업일마다 한 번만 받아 캐시된 dict에서 찾습니다."""
+    try:
+        rate = exchange_rate_store.get_rate(cur_unit, situation)
+        if rate is None:
+            logger.warning("환율 정보 없음: %s (%s)", cur_unit, situation)
+        return rate
     except Exception as e:
-        print("환율 api 오류: ",e)
+        logger.warning("환율 api 오류: %s", e)
         return None  # 오류 시 None 반환
 
 @tool
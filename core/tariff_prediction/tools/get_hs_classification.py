@@ -5,6 +5,17 @@ import pandas as pd
 import joblib
 from langchain_core.tools import tool
 import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.shared.utils.metrics import metrics
+from core.tariff_prediction.constants.model_config import (
+    EMBEDDING_MODEL_PATH, LABEL_ENCODER_PATH, MLP_MODEL_PATH, HS_CLASSIFIER_BACKEND
+)
+from core.tariff_prediction.data.hs_tables import get_hs_tables
+from core.tariff_prediction.dto.tariff_response import HSClassificationResult
+from core.tariff_prediction.inference.onnx_backend import load_onnx_models
 
 # sentence_transformers 임포트 시도
 try:
@@ -26,58 +37,196 @@ class MLP(nn.Module):
     def forward(self, x):
         return self.layers(x)
 
-def load_model():
-    """모델을 로드합니다."""
+HS_BACKEND_TORCH = "torch"
+HS_BACKEND_ONNX = "onnx"
+
+def load_model(backend: str = HS_CLASSIFIER_BACKEND, **onnx_options):
+    """모델을 로드합니다. backend가 onnx이면 내보낸 ONNX 인코더/분류기를 사용합니다."""
+    if backend == HS_BACKEND_ONNX:
+        return load_onnx_model(**onnx_options)
     if not SENTENCE_TRANSFORMERS_AVAILABLE:
         return None, None, None, None
     try:
-        model_dir = os.path.join(os.path.dirname(__file__), '..', 'model')
-        embedding_model_path = os.path.join(model_dir, 'bge-m3-custom-supervised')
-        label_encoder_path = os.path.join(model_dir, 'label_encoder.pkl')
-        mlp_model_path = os.path.join(model_dir, 'mlp_classifier.pth')
-        if not all(os.path.exists(path) for path in [embedding_model_path, label_encoder_path, mlp_model_path]):
+        if not all(os.path.exists(path) for path in [EMBEDDING_MODEL_PATH, LABEL_ENCODER_PATH, MLP_MODEL_PATH]):
             return None, None, None, None
         device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        embedding_model = SentenceTransformer(embedding_model_path)
-        label_encoder = joblib.load(label_encoder_path)
+        embedding_model = SentenceTransformer(EMBEDDING_MODEL_PATH)
+        label_encoder = joblib.load(LABEL_ENCODER_PATH)
         output_size = len(label_encoder.classes_)
         classifier_model = MLP(output_size).to(device)
-        classifier_model.load_state_dict(torch.load(mlp_model_path, map_location=device))
+        classifier_model.load_state_dict(torch.load(MLP_MODEL_PATH, map_location=device))
         classifier_model.eval()
         return embedding_model, label_encoder, classifier_model, device
     except Exception:
         return None, None, None, None
 
-def predict_hs_code(item_description: str, embedding_model, label_encoder, classifier_model, device):
-    if not all([embedding_model, label_encoder, classifier_model, device]):
+def load_onnx_model(**onnx_options):
+    """ONNX 백엔드 모델을 로드합니다. 라벨 인코더는 torch 모델과 같은 파일을 사용합니다."""
+    try:
+        embedding_model, classifier_model = load_onnx_models(**onnx_options)
+        if embedding_model is None or not os.path.exists(LABEL_ENCODER_PATH):
+            return None, None, None, None
+        label_encoder = joblib.load(LABEL_ENCODER_PATH)
+        return embedding_model, label_encoder, classifier_model, torch.device("cpu")
+    except Exception:
+        return None, None, None, None
+
+# 모델 로드 상태
+MODEL_NOT_LOADED = "not_loaded"
+MODEL_LOADING = "loading"
+MODEL_READY = "ready"
+MODEL_UNAVAILABLE = "unavailable"
+
+WARMUP_TEXT = "노트북 컴퓨터"
+HS_MODEL_EAGER_LOAD = os.getenv("HS_MODEL_EAGER_LOAD", "false").lower() == "true"
+# 로드/예열에 실패하면 이 시간(초)이 지난 뒤 다음 요청에서 다시 로드를 시도합니다.
+HS_MODEL_RETRY_SECONDS = float(os.getenv("HS_MODEL_RETRY_SECONDS", "60"))
+
+class HSClassifierRegistry:
+    """
+    HS 코드 분류 모델(임베딩 모델, 라벨 인코더, MLP)을 프로세스당 한 번만 로드해 공유합니다.
+    최초 사용 시 로드(lazy)하거나, 서버 시작 시 백그라운드로 미리 로드(eager)할 수 있습니다.
+    로드에 실패하면 HS_MODEL_RETRY_SECONDS 동안은 바로 실패를 반환하고, 그 뒤 요청에서 다시 로드합니다.
+    """
+
+    def __init__(self, retry_seconds: float = HS_MODEL_RETRY_SECONDS):
+        self._lock = threading.Lock()
+        self._models: Optional[Tuple[Any, Any, Any, Any]] = None
+        self._state = MODEL_NOT_LOADED
+        self._load_seconds: Optional[float] = None
+        self._loaded_at: Optional[float] = None
+        self._retry_seconds = retry_seconds
+        self._retry_at: Optional[float] = None
+        metrics.register_gauge("hs_classifier.state", lambda: self._state)
+
+    def _should_load(self) -> bool:
+        if self._state == MODEL_READY:
+            return False
+        if self._state == MODEL_UNAVAILABLE:
+            return self._retry_at is not None and time.time() >= self._retry_at
+        return True
+
+    def get(self) -> Tuple[Any, Any, Any, Any]:
+        """(embedding_model, label_encoder, classifier_model, device)를 반환합니다. 필요하면 로드합니다."""
+        if self._should_load():
+            self.load()
+        return self._models or (None, None, None, None)
+
+    def load(self, warmup: bool = True) -> bool:
+        with self._lock:
+            if not self._should_load():
+                return self._state == MODEL_READY
+            self._state = MODEL_LOADING
+            started = time.time()
+            models = load_model()
+            if not all(models):
+                return self._mark_unavailable()
+            if warmup:
+                # 첫 요청이 지연 초기화 비용을 치르지 않도록 한 번 추론해 둡니다.
+                try:
+                    predict_hs_code(WARMUP_TEXT, *models)
+                except Exception:
+                    return self._mark_unavailable()
+            # 예열까지 성공한 뒤에만 공개해 get()이 반쯤 초기화된 모델을 돌려주지 않게 합니다.
+            self._models = models
+            self._load_seconds = round(time.time() - started, 3)
+            self._loaded_at = time.time()
+            self._retry_at = None
+            self._state = MODEL_READY
+            return True
+
+    def _mark_unavailable(self) -> bool:
+        self._models = None
+        self._retry_at = time.time() + self._retry_seconds
+        self._state = MODEL_UNAVAILABLE
+        metrics.increment("hs_classifier.load_failures")
+        return False
+
+    def load_in_background(self) -> None:
+        threading.Thread(target=self.load, name="hs-classifier-load", daemon=True).start()
+
+    def is_ready(self) -> bool:
+        return self._state == MODEL_READY
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self._state,
+            "backend": HS_CLASSIFIER_BACKEND,
+            "load_seconds": self._load_seconds,
+            "loaded_at": self._loaded_at,
+            "retry_at": self._retry_at,
+        }
+
+hs_classifier_registry = HSClassifierRegistry()
+
+HS_BATCH_SIZE = int(os.getenv("HS_BATCH_SIZE", "32"))
+
+def format_item_text(item_description: str) -> str:
+    return f"품명: {item_description} [SEP] 상세설명:"
+
+def predict_hs_codes_batch(item_descriptions: List[str], embedding_model, label_encoder, classifier_model, device,
+                           top_k: int = 5, batch_size: int = HS_BATCH_SIZE) -> List[List[Dict[str, Any]]]:
+    """
+    여러 상품 설명의 HS 코드를 한 번에 예측합니다.
+    SentenceTransformer.encode가 입력을 길이순으로 정렬해 batch_size 단위로 인코딩하고,
+    MLP는 쌓인 임베딩 전체에 대해 한 번만 실행합니다. 결과는 입력 순서대로 반환됩니다.
+    """
+    if not all([embedding_model, label_encoder, classifier_model, device]) or not item_descriptions:
         return []
-    formatted_text = f"품명: {item_description} [SEP] 상세설명:"
+    top_k = max(1, min(top_k, len(label_encoder.classes_)))
+    formatted_texts = [format_item_text(description) for description in item_descriptions]
     with torch.no_grad():
-        embedding = embedding_model.encode(formatted_text, convert_to_tensor=True, normalize_embeddings=True)
-        embedding = embedding.to(device).unsqueeze(0)
-        logits = classifier_model(embedding)
-        probabilities = torch.nn.functional.softmax(logits, dim=1)
-        top5_prob, top5_indices = torch.topk(probabilities, 5)
-    results = []
-    top5_indices_cpu = top5_indices.cpu().numpy().flatten()
-    top5_prob_cpu = top5_prob.cpu().numpy().flatten()
-    predicted_hs_codes = label_encoder.inverse_transform(top5_indices_cpu)
-    for code, prob in zip(predicted_hs_codes, top5_prob_cpu):
-        results.append({"hs_code": code, "probability": f"{round(prob, 3):.1%}"})
-    return results
+        embeddings = embedding_model.encode(
+            formatted_texts, batch_size=batch_size, convert_to_tensor=True, normalize_embeddings=True
+        )
+        logits = classifier_model(embeddings.to(device))
+        # 전체 softmax 행렬을 만들지 않고 top-k 로짓만 확률로 변환합니다.
+        top_logits, top_indices = torch.topk(logits, top_k, dim=1)
+        top_probs = torch.exp(top_logits - torch.logsumexp(logits, dim=1, keepdim=True))
+    top_indices_cpu = top_indices.cpu().numpy()
+    top_probs_cpu = top_probs.cpu().numpy()
+    predicted_hs_codes = label_encoder.inverse_transform(top_indices_cpu.reshape(-1)).reshape(top_indices_cpu.shape)
+    return [
+        [{"hs_code": str(code), "probability": float(prob)} for code, prob in zip(codes, probs)]
+        for codes, probs in zip(predicted_hs_codes, top_probs_cpu)
+    ]
+
+def predict_hs_code(item_description: str, embedding_model, label_encoder, classifier_model, device):
+    batch_results = predict_hs_codes_batch([item_description], embedding_model, label_encoder, classifier_model, device)
+    if not batch_results:
+        return []
+    return [
+        {"hs_code": result["hs_code"], "probability": f"{round(result['probability'], 3):.1%}"}
+        for result in batch_results[0]
+    ]
+
+def classify_hs_code(product_name: str, top_k: int = 3) -> Optional[List[HSClassificationResult]]:
+    """상품명으로 HS6 코드를 예측해 확률순 HSClassificationResult 목록을 반환합니다. 모델이 준비되지 않았으면 None입니다."""
+    models = hs_classifier_registry.get()
+    if not all(models):
+        return None
+    batch_results = predict_hs_codes_batch([product_name], *models, top_k=top_k)
+    if not batch_results:
+        return []
+    hs_tables = get_hs_tables()
+    return [
+        HSClassificationResult(
+            hs_code=result["hs_code"],
+            probability=result["probability"],
+            description=hs_tables.get_hs6_search_text(result["hs_code"])
+        )
+        for result in batch_results[0]
+    ]
 
 @tool
 def get_hs_classification(product_name: str) -> str:
     """상품명으로 HS 코드를 예측합니다. 실제 ML 모델을 사용하여 정확한 HS 코드를 예측합니다."""
-    if not SENTENCE_TRANSFORMERS_AVAILABLE:
-        return "HS 코드 예측 모델이 준비되어 있지 않습니다."
-    embedding_model, label_encoder, classifier_model, device = load_model()
-    if not all([embedding_model, label_encoder, classifier_model, device]):
+    results = classify_hs_code(product_name)
+    if results is None:
         return "HS 코드 예측 모델이 준비되어 있지 않습니다."
-    results = predict_hs_code(product_name, embedding_model, label_encoder, classifier_model, device)
     if not results:
         return "HS 코드 예측 결과가 없습니다."
     result_text = f"{product_name}의 예측된 HS 코드:\n"
-    for i, result in enumerate(results[:3], 1):
-        result_text += f"{i}. {result['hs_code']} (확률: {result['probability']})\n"
-    return result_text 
\ No newline at end of file
+    for i, result in enumerate(results, 1):
+        result_text += f"{i}. {result.hs_code} (확률: {round(result.probability, 3):.1%})\n"
+    return result_text
@@ -0,0 +1,103 @@
+"""
+parse_user_input의 규칙 기반 추출기. 필드마다 하나의 정규식(이름 있는 그룹)과 한 번에 지우는 키워드 정규식을
+모듈 로드 시 미리 컴파일해 두어, LLM보다 먼저 모든 입력에 적용할 수 있을 만큼 가볍게 동작합니다.
+"""
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from core.shared.utils.keyword_matcher import keyword_matcher, COUNTRY
+from core.tariff_prediction.constants import (
+    SUPPORTED_COUNTRIES, REMOVE_KEYWORDS, PRODUCT_NAME_EXTRACTION
+)
+
+# 가격 단위 → (LLM 파싱 결과와 같은 price_unit, 배수)
+PRICE_UNITS = {
+    '만원': ('원', 10000),
+    '천원': ('원', 1000),
+    '원': ('원', 1),
+    '달러': ('달러', 1),
+    '엔': ('엔', 1),
+    '위안': ('위안', 1),
+    '유로': ('유로', 1),
+}
+KOREAN_COUNTS = {'한': 1, '두': 2, '세': 3, '네': 4}
+
+def _alternation(words: Iterable[str]) -> str:
+    # 긴 단어부터 시도해야 '만원'이 '원'보다, '미국에서'가 '미국'보다 먼저 일치합니다.
+    return '|'.join(re.escape(word) for word in sorted(set(words), key=len, reverse=True))
+
+PRICE_REGEX = re.compile(
+    r'(?:(?P<man>\d+)\s*만\s*(?=\d))?'  # '1만 5천원'처럼 만 단위가 앞에 붙은 원화 금액
+    r'(?P<amount>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)\s*'
+    r'(?P<unit>만\s*원|천\s*원|원|달러|엔|위안|유로)'
+)
+QUANTITY_REGEX = re.compile(r'(?P<count>\d+)\s*개|(?P<word>[한두세네]) ?개')
+COUNTRY_PRIORITY = {country: rank for rank, country in enumerate(SUPPORTED_COUNTRIES)}
+SIMPLE_NAME_REGEXES = [re.compile(pattern) for pattern in PRODUCT_NAME_EXTRACTION['SIMPLE_PATTERNS']]
+STRIP_REGEX = re.compile(_alternation(
+    list(SUPPORTED_COUNTRIES) + [country + '에서' for country in SUPPORTED_COUNTRIES]
+    + REMOVE_KEYWORDS + PRODUCT_NAME_EXTRACTION['REMOVE_KEYWORDS_EXTENDED']
+))
+
+def extract_price(user_input: str) -> Optional[Dict[str, Any]]:
+    """처음 나오는 '숫자+단위'를 찾아 {'price', 'price_unit'}을 반환합니다. 만원/천원은 원으로 환산합니다."""
+    match = PRICE_REGEX.search(user_input)
+    if not match:
+        return None
+    price_unit, multiplier = PRICE_UNITS[re.sub(r'\s', '', match.group('unit'))]
+    price = float(match.group('amount').replace(',', '')) * multiplier
+    if match.group('man') and price_unit == '원':
+        price += int(match.group('man')) * 10000
+    return {'price': price, 'price_unit': price_unit}
+
+def extract_quantity(user_input: str) -> Optional[int]:
+    """숫자로 쓴 수량을 우선하고, 없으면 '한 개', '두 개' 같은 표현을 사용합니다."""
+    word_count = None
+    for match in QUANTITY_REGEX.finditer(user_input):
+        if match.group('count'):
+            return int(match.group('count'))
+        if word_count is None:
+            word_count = KOREAN_COUNTS[match.group('word')]
+    return word_count
+
+def extract_country(user_input: str) -> Optional[str]:
+    """입력에 나오는 국가 중 SUPPORTED_COUNTRIES 순서가 가장 앞선 국가를 반환합니다."""
+    found = keyword_matcher.find(user_input).get(COUNTRY)
+    return min(found, key=COUNTRY_PRIORITY.__getitem__) if found else None
+
+def extract_product_name(user_input: str) -> str:
+    """상품명을 추출하는 전용 함수"""
+    stripped = user_input.strip()
+    for regex in SIMPLE_NAME_REGEXES:
+        match = regex.search(stripped)
+        if match:
+            product = match.group(1).strip()
+            if product and len(product) >= PRODUCT_NAME_EXTRACTION['MIN_LENGTH']:
+                return product
+
+    # 가격·수량 표현을 지운 뒤 국가명과 불필요한 키워드를 한 번에 지웁니다.
+    cleaned = QUANTITY_REGEX.sub('', PRICE_REGEX.sub('', user_input))
+    cleaned = STRIP_REGEX.sub('', cleaned).strip()
+    if cleaned and len(cleaned) >= PRODUCT_NAME_EXTRACTION['MIN_LENGTH']:
+        return cleaned
+
+    # 입력 전체를 상품명으로 사용
+    if PRODUCT_NAME_EXTRACTION['MIN_LENGTH'] <= len(stripped) <= PRODUCT_NAME_EXTRACTION['MAX_LENGTH']:
+        return stripped
+    return ""
+
+def parse_user_input_rule(user_input: str) -> Dict[str, Any]:
+    parsed: Dict[str, Any] = {}
+    product_name = extract_product_name(user_input)
+    if product_name:
+        parsed['product_name'] = product_name
+    price = extract_price(user_input)
+    if price:
+        parsed.update(price)
+    quantity = extract_quantity(user_input)
+    if quantity is not None:
+        parsed['quantity'] = quantity
+    country = extract_country(user_input)
+    if country:
+        parsed['country'] = country
+    return parsed
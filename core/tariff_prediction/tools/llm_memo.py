@@ -0,0 +1,13 @@
+from core.shared.utils.llm_cache import create_llm_memo
+from core.tariff_prediction.constants.llm_cache_config import (
+    TARIFF_LLM_CACHE_BACKEND, TARIFF_LLM_CACHE_DB_PATH, TARIFF_LLM_CACHE_TTL_SECONDS, TARIFF_LLM_CACHE_MAX_ENTRIES
+)
+
+# 관세 예측 LLM 도우미가 함께 쓰는 결과 캐시. 적중률은 /metrics의 tariff_llm_cache.* 로 확인합니다.
+tariff_llm_memo = create_llm_memo(
+    backend=TARIFF_LLM_CACHE_BACKEND,
+    db_path=TARIFF_LLM_CACHE_DB_PATH,
+    ttl_seconds=TARIFF_LLM_CACHE_TTL_SECONDS,
+    max_entries=TARIFF_LLM_CACHE_MAX_ENTRIES,
+    metric_prefix="tariff_llm_cache"
+)
@@ -1,16 +1,28 @@
 from typing import List, Dict
 import re
-import pandas as pd
-import os
 from langchain_core.tools import tool
 
+from core.tariff_prediction.data.hs_tables import get_hs_tables
+from core.tariff_prediction.data.hs_prefix_trie import HS_LEVEL_HS10, get_hs_prefix_trie, normalize_hs_prefix
+from core.tariff_prediction.dto.tariff_response import HSClassificationResult
+
+def hs6_candidates_from_results(results: List[HSClassificationResult]) -> List[Dict]:
+    """HS6 분류 결과를 parse_hs6_result와 같은 후보 dict 목록으로 변환합니다."""
+    return [
+        {
+            'code': result.hs_code,
+            'description': f'HS코드: {result.hs_code}, 설명: {result.description or ""}',
+            'confidence': round(result.probability, 3),
+            'full_code': result.hs_code
+        }
+        for result in results
+    ]
+
 @tool
 def parse_hs6_result(hs6_result: str) -> List[Dict]:
     """HS6 결과를 파싱합니다."""
     candidates = []
-    # HS6.csv 파일 로드
-    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-    hs6_df = pd.read_csv(os.path.join(data_dir, 'HS6.csv'), dtype={'HS코드': str})
+    hs_tables = get_hs_tables()
     
     # 결과에서 HS 코드와 확률 추출
     lines = hs6_result.strip().split('\n')
@@ -24,41 +36,34 @@ def parse_hs6_result(hs6_result: str) -> List[Dict]:
                 confidence = round(float(match.group(3)) / 100.0, 3)
                 hs6_code = code[:4] + '.' + code[4:]
                 # HS6.csv에서 정보 찾기
-                hs6_row = hs6_df[hs6_df['HS코드'] == code]
-                search_text = ""
-                if not hs6_row.empty:
-                    search_text = str(hs6_row.iloc[0]['검색텍스트'])
+                search_text = hs_tables.get_hs6_search_text(code) or ""
                 candidates.append({
                     'code': code,  # 포맷팅 없이 원본 6자리 코드 사용
                     'description': f'HS코드: {code}, 설명: {search_text}',
                     'confidence': confidence,
                     'full_code': code
                 })
-    print(f"[DEBUG] parse_hs6_result candidates: {candidates}")
     return candidates
 
-@tool
-def generate_hs10_candidates(hs6_code: str) -> List[Dict]:
-    """HS6 코드를 기반으로 HS10 후보를 생성합니다."""
+def list_hs10_candidates(hs6_code: str) -> List[Dict]:
+    """HS6 코드에 속한 HS10 후보를 {'code', 'description'} 목록으로 반환합니다. '8471'처럼 6자리보다 짧으면 그 코드로 시작하는 HS10을 모두 반환합니다."""
     try:
-        # HS10.csv 파일 로드
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        hs10_df = pd.read_csv(os.path.join(data_dir, 'HS10.csv'))
-        
-        # HS6 코드로 필터링 (HS6 컬럼에서 해당 코드로 시작하는 항목들 찾기)
-        hs6_formatted = hs6_code.replace('.', '')
+        hs6_formatted = normalize_hs_prefix(hs6_code)
+        if not hs6_formatted:
+            return []
         if len(hs6_formatted) < 6:
-            hs6_formatted = hs6_formatted.ljust(6, '0')
-        hs6_strs = hs10_df['HS6'].astype(str).str.zfill(6)
-        matching_rows = hs10_df[hs6_strs.str.startswith(hs6_formatted)]
-        
-        candidates = []
-        for _, row in matching_rows.iterrows():
-            candidates.append({
-                'code': str(row['HS10']),  # 항상 문자열로 변환
-                'description': row['한글품목명']
-            })
-        
-        return candidates
+            return [
+                {'code': entry.code, 'description': entry.description}
+                for entry in get_hs_prefix_trie().codes_under(hs6_formatted, level=HS_LEVEL_HS10)
+            ]
+        return [
+            {'code': hs10_code, 'description': description}
+            for hs10_code, description in get_hs_tables().get_hs10_candidates(hs6_formatted[:6])
+        ]
     except Exception:
-        return [] 
\ No newline at end of file
+        return [] 
+
+@tool
+def generate_hs10_candidates(hs6_code: str) -> List[Dict]:
+    """HS6 코드를 기반으로 HS10 후보를 생성합니다."""
+    return list_hs10_candidates(hs6_code)
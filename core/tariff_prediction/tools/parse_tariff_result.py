@@ -1,6 +1,8 @@
 from typing import Dict, Any
 from langchain_core.tools import tool
 from core.tariff_prediction.constants import TARIFF_RESULT_PARSING
+from core.tariff_prediction.dto.tariff_response import TariffCalculationResult
+from core.tariff_prediction.tools.calculate_tariff_amount import plain_number
 
 def format_price(price_str: str) -> str:
     """가격을 깔끔하게 포맷팅합니다."""
@@ -17,6 +19,57 @@ def format_price(price_str: str) -> str:
     except:
         return price_str
 
+def _render_markdown(fields: Dict[str, Any]) -> str:
+    """표시용 문자열로 채운 필드를 마크다운 결과로 렌더링합니다."""
+    return f"""## 📊 관세 계산 결과
+
+### 📦 상품 정보
+| 항목 | 내용 |
+|------|------|
+| **HS 코드** | `{fields['hs_code']}` |
+| **원산지** | {fields['origin_country']} |
+| **상품 가격** | {fields['product_price']} |
+| **수량** | {fields['quantity']}개 |
+
+### 💰 세금 정보
+| 항목 | 금액 |
+|------|------|
+| **관세율** | {fields['tariff_rate']} |
+| **관세금액** | {fields['tariff_amount']} |
+| **부가가치세** | {fields['vat_amount']} |
+| **총 세금** | **{fields['total_tax']}** |
+
+### 📋 추가 정보
+| 항목 | 내용 |
+|------|------|
+| **적용 관세 규칙** | {fields['tariff_rule']} |
+| **FTA 적용** | {fields['fta_applied']} |
+| **비고** | {fields['note']} |
+
+---
+
+**본 답변은 신청자가 제시한 자료만을 근거로 작성하였으며, 법적 효력을 갖는 유권해석(결정, 판단)이 아니므로 각종 신고, 불복청구 등의 증거자료로 사용할 수 없습니다.**"""
+
+def render_tariff_markdown(result: TariffCalculationResult) -> str:
+    """TariffCalculationResult를 사용자에게 보여 줄 마크다운으로 렌더링합니다."""
+    return _render_markdown({
+        'hs_code': result.hs_code,
+        'origin_country': result.origin_country,
+        'product_price': format_price(str(result.product_price)),
+        'quantity': result.quantity,
+        'tariff_rate': f"{plain_number(result.tariff_rate)}%",
+        'tariff_amount': format_price(str(round(result.tariff_amount))),
+        'vat_amount': format_price(str(round(result.vat_amount))),
+        'total_tax': format_price(str(round(result.total_tax))),
+        'tariff_rule': result.applied_rule,
+        'fta_applied': 'Yes' if result.fta_applied else 'No',
+        'note': result.notes,
+    })
+
+def tariff_result_to_dict(result: TariffCalculationResult) -> Dict[str, Any]:
+    """API 응답의 calculation_result 형태(필드 + formatted_result)로 변환합니다."""
+    return {**result.model_dump(), 'formatted_result': render_tariff_markdown(result)}
+
 @tool
 def parse_tariff_result(tariff_result: str) -> Dict[str, Any]:
     """관세 계산 결과를 파싱하고 포맷팅합니다."""
@@ -33,41 +86,14 @@ def parse_tariff_result(tariff_result: str) -> Dict[str, Any]:
                     parsed[field_name] = line.split(':')[-1].strip()
                     break
         
-        # 가격 포맷팅
-        formatted_price = format_price(parsed['product_price'])
-        formatted_tariff = format_price(parsed['tariff_amount'])
-        formatted_vat = format_price(parsed['vat_amount'])
-        formatted_total = format_price(parsed['total_tax'])
-        
         # 마크다운 형식의 결과 포맷팅
-        formatted_result = f"""## 📊 관세 계산 결과
-
-### 📦 상품 정보
-| 항목 | 내용 |
-|------|------|
-| **HS 코드** | `{parsed['hs_code']}` |
-| **원산지** | {parsed['origin_country']} |
-| **상품 가격** | {formatted_price} |
-| **수량** | {parsed['quantity']}개 |
-
-### 💰 세금 정보
-| 항목 | 금액 |
-|------|------|
-| **관세율** | {parsed['tariff_rate']} |
-| **관세금액** | {formatted_tariff} |
-| **부가가치세** | {formatted_vat} |
-| **총 세금** | **{formatted_total}** |
-
-### 📋 추가 정보
-| 항목 | 내용 |
-|------|------|
-| **적용 관세 규칙** | {parsed['tariff_rule']} |
-| **FTA 적용** | {parsed['fta_applied']} |
-| **비고** | {parsed['note']} |
-
----
-
-**본 답변은 신청자가 제시한 자료만을 근거로 작성하였으며, 법적 효력을 갖는 유권해석(결정, 판단)이 아니므로 각종 신고, 불복청구 등의 증거자료로 사용할 수 없습니다.**"""
+        formatted_result = _render_markdown({
+            **parsed,
+            'product_price': format_price(parsed['product_price']),
+            'tariff_amount': format_price(parsed['tariff_amount']),
+            'vat_amount': format_price(parsed['vat_amount']),
+            'total_tax': format_price(parsed['total_tax']),
+        })
         
         parsed['formatted_result'] = formatted_result
         
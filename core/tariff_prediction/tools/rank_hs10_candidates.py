@@ -0,0 +1,39 @@
+import logging
+from typing import Dict, List, Optional
+
+from core.shared.utils.metrics import metrics
+from core.tariff_prediction.inference.hs10_description_index import get_hs10_description_index
+from core.tariff_prediction.tools.get_hs_classification import hs_classifier_registry
+
+logger = logging.getLogger(__name__)
+
+def rank_hs10_candidates(candidates: List[Dict], product_name: Optional[str]) -> List[Dict]:
+    """
+    HS10 후보({'code', 'description'})를 상품명과 한글품목명의 코사인 유사도 순으로 정렬하고 similarity를 붙입니다.
+    상품명, 색인, 임베딩 모델 중 하나라도 없으면 원래(파일) 순서를 그대로 반환합니다.
+    """
+    if len(candidates) < 2 or not product_name or not product_name.strip():
+        return candidates
+    index = get_hs10_description_index()
+    embedding_model, _, _, _ = hs_classifier_registry.get()
+    if index is None or embedding_model is None:
+        metrics.increment("hs10_rank.unranked")
+        return candidates
+    try:
+        query_embedding = embedding_model.encode([product_name.strip()], normalize_embeddings=True)[0]
+    except Exception as e:
+        logger.warning("HS10 후보 정렬 실패: %s", e)
+        metrics.increment("hs10_rank.unranked")
+        return candidates
+    scores = index.scores(query_embedding, [c['code'] for c in candidates])
+    metrics.increment("hs10_rank.ranked")
+    ranked = [
+        {**c, 'similarity': round(scores[c['code']], 3)} if c['code'] in scores else c
+        for c in candidates
+    ]
+    # 색인에 없는 코드는 원래 순서대로 맨 뒤에 둡니다 (정렬은 안정적이므로 동점도 원래 순서 유지).
+    return sorted(ranked, key=lambda c: -scores.get(c['code'], float('-inf')))
+
+def paginate_candidates(candidates: List[Dict], page: int, page_size: int) -> List[Dict]:
+    start = (max(page, 1) - 1) * page_size
+    return candidates[start:start + page_size]
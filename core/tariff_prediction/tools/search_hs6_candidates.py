@@ -0,0 +1,65 @@
+import logging
+import re
+from typing import Dict, List, Sequence
+
+from core.shared.utils.llm import get_llm
+from core.tariff_prediction.constants import LLM_PROMPTS
+from core.tariff_prediction.constants.model_config import (
+    HS6_RERANK_WITH_LLM, HS6_REPREDICTION_SEARCH_SIZE, HS6_REPREDICTION_TOP_K
+)
+from core.tariff_prediction.data.hs_tables import get_hs_tables
+from core.tariff_prediction.inference.hs6_search_index import get_hs6_search_index
+from core.tariff_prediction.tools.context_utils import extract_llm_response
+from core.tariff_prediction.tools.get_hs_classification import hs_classifier_registry
+
+logger = logging.getLogger(__name__)
+
+def _rerank_with_llm(product_name: str, user_input: str, candidates: List[Dict]) -> List[Dict]:
+    """LLM이 후보 목록 안에서만 순서를 정하게 합니다. 응답을 해석하지 못하면 로컬 검색 순서를 유지합니다."""
+    candidate_lines = '\n'.join(c['description'] for c in candidates)
+    prompt = (
+        f"{LLM_PROMPTS['hs6_rerank_prompt']}\n\n{LLM_PROMPTS['product_name']}: {product_name}\n"
+        f"{LLM_PROMPTS['user_additional_opinion']}: {user_input}\n\n"
+        f"{LLM_PROMPTS['hs6_rerank_candidates']}:\n{candidate_lines}\n\n{LLM_PROMPTS['hs6_rerank_format']}"
+    )
+    try:
+        answer = extract_llm_response(get_llm().invoke([{"role": "user", "content": prompt}])) or ""
+    except Exception as e:
+        logger.warning("HS6 후보 재정렬 실패: %s", e)
+        return candidates
+    by_code = {c['code']: c for c in candidates}
+    ranked = []
+    for code in re.findall(r'(?<!\d)\d{6}(?!\d)', answer):
+        if code in by_code and by_code[code] not in ranked:
+            ranked.append(by_code[code])
+    return ranked + [c for c in candidates if c not in ranked] if ranked else candidates
+
+def search_hs6_candidates(product_name: str, user_input: str, exclude_codes: Sequence[str] = (),
+                          top_k: int = HS6_REPREDICTION_TOP_K,
+                          rerank_with_llm: bool = HS6_RERANK_WITH_LLM) -> List[Dict]:
+    """
+    상품명과 사용자의 추가 의견을 합친 문장으로 HS6 검색텍스트 색인에서 가까운 코드를 찾습니다.
+    이미 보여준 후보(exclude_codes)는 제외하며, confidence는 코사인 유사도입니다.
+    색인이나 임베딩 모델이 없으면 빈 목록을 반환합니다.
+    """
+    index = get_hs6_search_index()
+    embedding_model, _, _, _ = hs_classifier_registry.get()
+    if index is None or embedding_model is None:
+        return []
+
+    query = f"{product_name} {user_input}".strip()
+    query_embedding = embedding_model.encode([query], normalize_embeddings=True)[0]
+    search_size = max(top_k, HS6_REPREDICTION_SEARCH_SIZE) if rerank_with_llm else top_k
+    hs_tables = get_hs_tables()
+    candidates = [
+        {
+            'code': code,
+            'description': f'HS코드: {code}, 설명: {hs_tables.get_hs6_search_text(code) or ""}',
+            'confidence': round(min(max(score, 0.0), 1.0), 3),
+            'full_code': code
+        }
+        for code, score in index.search(query_embedding, search_size, exclude_codes=exclude_codes)
+    ]
+    if rerank_with_llm and candidates:
+        candidates = _rerank_with_llm(product_name, user_input, candidates)
+    return candidates[:top_k]
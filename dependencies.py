@@ -1,6 +1,21 @@
 import os
 
 from core.customs_tracking.client.unipass_cargo_api_client import UnipassCargoApiClient
+from core.customs_tracking.watch.cargo_watch_scheduler import CargoWatchScheduler
+from core.customs_tracking.watch.cargo_watch_store import CargoWatchStore
+from core.customs_tracking.watch.watch_config import CARGO_WATCH_DB_PATH
+from core.customs_tracking.api_spec.unipass_api_spec import (
+    UNIPASS_RATE_LIMIT_PER_SECOND,
+    UNIPASS_RATE_LIMIT_BURST,
+    UNIPASS_DAILY_QUOTA,
+    UNIPASS_RATE_LIMIT_MODE,
+    UNIPASS_RATE_LIMIT_MAX_WAIT,
+    UNIPASS_RATE_LIMIT_STATE_PATH,
+)
+from core.shared.utils.circuit_breaker import get_circuit_breaker
+from core.shared.utils.rate_limiter import RateLimitExceeded, create_rate_limiter
+from core.tariff_prediction.data.exchange_rate_prefetcher import ExchangeRatePrefetcher
+from core.tariff_prediction.tools.get_exchange_rate_info import exchange_rate_store
 
 # 의존성 구성 전용 클래스(?)
 # openai_client = OpenAiClient(
@@ -9,5 +24,23 @@ from core.customs_tracking.client.unipass_cargo_api_client import UnipassCargoAp
 # )
 unipass_cargo_api_client = UnipassCargoApiClient(
     api_key = os.getenv("UNIPASS_API_KEY"),
-    api_url = os.getenv("UNIPASS_API_PATH")
-)
\ No newline at end of file
+    api_url = os.getenv("UNIPASS_API_PATH"),
+    circuit_breaker = get_circuit_breaker("unipass", excluded_exceptions=(RateLimitExceeded,)),
+    rate_limiter = create_rate_limiter(
+        name = "unipass",
+        state_path = UNIPASS_RATE_LIMIT_STATE_PATH,
+        rate_per_second = UNIPASS_RATE_LIMIT_PER_SECOND,
+        burst = UNIPASS_RATE_LIMIT_BURST,
+        daily_quota = UNIPASS_DAILY_QUOTA,
+        mode = UNIPASS_RATE_LIMIT_MODE,
+        max_wait = UNIPASS_RATE_LIMIT_MAX_WAIT
+    )
+)
+
+cargo_watch_store = CargoWatchStore(db_path = CARGO_WATCH_DB_PATH)
+cargo_watch_scheduler = CargoWatchScheduler(
+    store = cargo_watch_store,
+    client = unipass_cargo_api_client
+)
+
+exchange_rate_prefetcher = ExchangeRatePrefetcher(store = exchange_rate_store)
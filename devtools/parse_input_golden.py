@@ -0,0 +1,83 @@
+"""
+규칙 기반 입력 파서(parse_user_input_rule)의 골든 코퍼스 검사
+
+    python -m devtools.parse_input_golden            # 코퍼스와 현재 결과 비교 (다르면 종료 코드 1)
+    python -m devtools.parse_input_golden --update   # 의도한 변경이면 현재 결과로 코퍼스 갱신
+
+코퍼스(fixtures/parse_user_input/golden.json)는 입력과 기대 결과의 목록입니다.
+기준 코퍼스(fixtures/parse_user_input/baseline.json)는 정규식 사전 컴파일 이전 파서의 결과이며 갱신하지 않습니다.
+현재 결과는 new_keys(새로 추가한 키)와 각 입력의 intentional_diff에 적힌 필드를 빼고 기준 결과와 같아야 합니다.
+"""
+import argparse
+import json
+import os
+import time
+
+from core.tariff_prediction.tools.input_rules import parse_user_input_rule
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "parse_user_input")
+GOLDEN_PATH = os.path.join(FIXTURE_DIR, "golden.json")
+BASELINE_PATH = os.path.join(FIXTURE_DIR, "baseline.json")
+
+def load_corpus(path: str = GOLDEN_PATH) -> list:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def verify(path: str = GOLDEN_PATH) -> dict:
+    corpus = load_corpus(path)
+    started = time.perf_counter()
+    mismatches = []
+    for case in corpus:
+        actual = parse_user_input_rule(case["input"])
+        if actual != case["expected"]:
+            mismatches.append({"input": case["input"], "expected": case["expected"], "actual": actual})
+    elapsed = time.perf_counter() - started
+    return {
+        "cases": len(corpus),
+        "mismatches": mismatches,
+        "avg_microseconds": round(elapsed / max(len(corpus), 1) * 1e6, 1),
+    }
+
+def verify_baseline(path: str = BASELINE_PATH) -> dict:
+    """기준 결과와 다른 필드 중 의도한 변경으로 적지 않은 필드, 그리고 더 이상 다르지 않은 의도한 변경을 찾습니다."""
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    new_keys = set(baseline["new_keys"])
+    mismatches = []
+    stale_diffs = []
+    for case in baseline["cases"]:
+        actual = parse_user_input_rule(case["input"])
+        expected = case["baseline"]
+        allowed = set(case.get("intentional_diff", {}).get("fields", []))
+        changed = {key for key in (set(expected) | set(actual)) - new_keys if expected.get(key) != actual.get(key)}
+        if changed - allowed:
+            mismatches.append({"input": case["input"], "baseline": expected, "actual": actual, "fields": sorted(changed - allowed)})
+        if allowed - changed:
+            stale_diffs.append({"input": case["input"], "fields": sorted(allowed - changed)})
+    return {
+        "cases": len(baseline["cases"]),
+        "intentional_diffs": sum(1 for case in baseline["cases"] if "intentional_diff" in case),
+        "mismatches": mismatches,
+        "stale_diffs": stale_diffs,
+    }
+
+def update(path: str = GOLDEN_PATH) -> None:
+    corpus = [{"input": case["input"], "expected": parse_user_input_rule(case["input"])} for case in load_corpus(path)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="parse_user_input_rule 골든 코퍼스 검사")
+    parser.add_argument("--update", action="store_true", help="현재 결과로 기대값 갱신")
+    args = parser.parse_args()
+    if args.update:
+        update()
+        return
+    report = {"golden": verify(), "baseline": verify_baseline()}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if report["golden"]["mismatches"] or report["baseline"]["mismatches"] or report["baseline"]["stale_diffs"]:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
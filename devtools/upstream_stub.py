@@ -0,0 +1,286 @@
+"""
+Unipass / 한국수출입은행 API 로컬 대역 서버
+
+실제 API 키와 네트워크 없이 UnipassCargoApiClient, get_exchange_rate_api 경로를
+부하 테스트하거나 회귀 테스트할 수 있도록, 기록된(또는 합성한) XML/JSON 응답을 재생합니다.
+
+    python -m devtools.upstream_stub --port 8090 --latency-ms 80 --error-rate 0.05
+
+서버를 띄운 뒤 환경 변수로 대역 서버를 선택합니다.
+
+    UNIPASS_API_PATH=http://localhost:8090/unipass
+    KOREAEXIM_API_URL=http://localhost:8090/koreaexim
+
+--record 모드에서는 요청을 실제 API로 전달하고, 받은 응답을 fixture 파일로 저장합니다.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import requests
+
+from core.customs_tracking.api_spec.unipass_api_spec import (
+    TAG_PROCESS_DETAIL,
+    TAG_PROCESS_DATETIME,
+    TAG_PROCESS_STATUS,
+    TAG_PROCESS_COMMENT,
+    PARAM_API_KEY,
+    PARAM_CARGO_NO,
+    PARAM_HBL_NO,
+    PARAM_MBL_NO,
+    PARAM_BL_YEAR,
+    UNIPASS_INPUT_FORMATTER,
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+UNIPASS_PREFIX = "/unipass"
+KOREAEXIM_PREFIX = "/koreaexim"
+
+API_KEY_PARAM_PATTERN = re.compile(rf"({PARAM_API_KEY}|authkey)=[^&\s]*")
+
+# 합성 응답에 사용하는 통관 진행 단계 (실제 Unipass 처리구분 순서)
+SYNTHETIC_PROGRESS_STEPS = [
+    ("입항보고 수리", "입항보고가 수리되었습니다."),
+    ("하선신고 수리", "하선신고가 수리되었습니다."),
+    ("반입신고", "보세구역에 반입되었습니다."),
+    ("수입신고", "수입신고가 접수되었습니다."),
+    ("수입신고수리", "수입신고가 수리되었습니다."),
+    ("반출신고", "보세구역에서 반출되었습니다."),
+]
+
+# 합성 환율표 (cur_unit, cur_nm, 매매기준율)
+SYNTHETIC_EXCHANGE_RATES = [
+    ("AED", "아랍에미리트 디르함", 374.52), ("AUD", "호주 달러", 905.17),
+    ("BHD", "바레인 디나르", 3648.44), ("BND", "브루나이 달러", 1068.21),
+    ("CAD", "캐나다 달러", 1003.36), ("CHF", "스위스 프랑", 1712.62),
+    ("CNH", "위안화", 191.53), ("DKK", "덴마아크 크로네", 214.97),
+    ("EUR", "유로", 1604.63), ("GBP", "영국 파운드", 1846.24),
+    ("HKD", "홍콩 달러", 175.23), ("IDR(100)", "인도네시아 루피아", 8.41),
+    ("JPY(100)", "일본 옌", 932.56), ("KRW", "한국 원", 1.0),
+    ("KWD", "쿠웨이트 디나르", 4502.64), ("MYR", "말레이지아 링기트", 325.97),
+    ("NOK", "노르웨이 크로네", 136.61), ("NZD", "뉴질랜드 달러", 823.61),
+    ("SAR", "사우디 리얄", 366.81), ("SEK", "스웨덴 크로나", 144.33),
+    ("SGD", "싱가포르 달러", 1068.21), ("THB", "태국 바트", 42.53),
+    ("USD", "미국 달러", 1375.60),
+]
+
+
+class StubConfig:
+    def __init__(self, latency_ms: int = 0, jitter_ms: int = 0, error_rate: float = 0.0,
+                 error_status: int = 503, payload_size: int = len(SYNTHETIC_PROGRESS_STEPS),
+                 empty_weekends: bool = False, record: bool = False,
+                 unipass_upstream: Optional[str] = None, koreaexim_upstream: Optional[str] = None,
+                 fixture_dir: str = FIXTURE_DIR):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.payload_size = payload_size
+        self.empty_weekends = empty_weekends
+        self.record = record
+        self.unipass_upstream = unipass_upstream
+        self.koreaexim_upstream = koreaexim_upstream
+        self.fixture_dir = fixture_dir
+
+
+def unipass_fixture_key(params: Dict[str, str]) -> str:
+    if params.get(PARAM_CARGO_NO):
+        return params[PARAM_CARGO_NO]
+    return "_".join(params.get(key, "") for key in (PARAM_BL_YEAR, PARAM_MBL_NO, PARAM_HBL_NO))
+
+
+def koreaexim_fixture_key(params: Dict[str, str]) -> str:
+    return params.get("searchdate") or datetime.now().strftime("%Y%m%d")
+
+
+def fixture_path(fixture_dir: str, upstream: str, key: str) -> str:
+    extension = "xml" if upstream == "unipass" else "json"
+    safe_key = "".join(ch for ch in key if ch.isalnum() or ch in "_-")
+    return os.path.join(fixture_dir, upstream, f"{safe_key}.{extension}")
+
+
+def build_unipass_xml(payload_size: int, start: Optional[datetime] = None) -> str:
+    """payload_size개의 통관 진행 내역을 가진 Unipass 응답 XML을 합성합니다."""
+    # 같은 날 반복 조회하면 같은 응답이 나오도록 시작 시각을 자정 기준으로 고정합니다.
+    start = start or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=2)
+    details = []
+    for i in range(payload_size):
+        status, comment = SYNTHETIC_PROGRESS_STEPS[i % len(SYNTHETIC_PROGRESS_STEPS)]
+        processed_at = (start + timedelta(hours=3 * i)).strftime(UNIPASS_INPUT_FORMATTER)
+        details.append(
+            f"<{TAG_PROCESS_DETAIL}>"
+            f"<{TAG_PROCESS_DATETIME}>{processed_at}</{TAG_PROCESS_DATETIME}>"
+            f"<{TAG_PROCESS_STATUS}>{status}</{TAG_PROCESS_STATUS}>"
+            f"<{TAG_PROCESS_COMMENT}>{comment}</{TAG_PROCESS_COMMENT}>"
+            f"</{TAG_PROCESS_DETAIL}>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<cargCsclPrgsInfoQryRtnVo><tCnt>{payload_size}</tCnt>"
+        + "".join(details)
+        + "</cargCsclPrgsInfoQryRtnVo>"
+    )
+
+
+def build_koreaexim_json(searchdate: str, empty_weekends: bool = False) -> str:
+    """AP01 환율표 응답 JSON을 합성합니다. 주말 재현 옵션이 켜져 있으면 빈 목록을 반환합니다."""
+    if empty_weekends:
+        try:
+            if datetime.strptime(searchdate, "%Y%m%d").weekday() >= 5:
+                return "[]"
+        except ValueError:
+            return "[]"
+    rows = []
+    for cur_unit, cur_nm, base_rate in SYNTHETIC_EXCHANGE_RATES:
+        rows.append({
+            "result": 1,
+            "cur_unit": cur_unit,
+            "ttb": f"{base_rate * 0.99:,.2f}",
+            "tts": f"{base_rate * 1.01:,.2f}",
+            "deal_bas_r": f"{base_rate:,.2f}",
+            "bkpr": f"{int(base_rate):,}",
+            "yy_efee_r": "0",
+            "ten_dd_efee_r": "0",
+            "kftc_bkpr": f"{int(base_rate):,}",
+            "kftc_deal_bas_r": f"{base_rate:,.2f}",
+            "cur_nm": cur_nm,
+        })
+    return json.dumps(rows, ensure_ascii=False)
+
+
+class UpstreamStubHandler(BaseHTTPRequestHandler):
+    server_version = "UpstreamStub/1.0"
+    config: StubConfig = StubConfig()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        if parsed.path.startswith(UNIPASS_PREFIX):
+            upstream, content_type = "unipass", "application/xml; charset=utf-8"
+        elif parsed.path.startswith(KOREAEXIM_PREFIX):
+            upstream, content_type = "koreaexim", "application/json; charset=utf-8"
+        else:
+            self._send(404, "text/plain; charset=utf-8", "unknown upstream")
+            return
+
+        self._simulate_latency()
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            self._send(self.config.error_status, "text/plain; charset=utf-8", "stub injected error")
+            return
+
+        status, body = self._respond(upstream, params)
+        self._send(status, content_type, body)
+
+    def _respond(self, upstream: str, params: Dict[str, str]) -> Tuple[int, str]:
+        key = unipass_fixture_key(params) if upstream == "unipass" else koreaexim_fixture_key(params)
+        path = fixture_path(self.config.fixture_dir, upstream, key)
+
+        if self.config.record:
+            return self._record(upstream, params, path)
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return 200, f.read()
+
+        if upstream == "unipass":
+            return 200, build_unipass_xml(self.config.payload_size)
+        return 200, build_koreaexim_json(key, self.config.empty_weekends)
+
+    def _record(self, upstream: str, params: Dict[str, str], path: str) -> Tuple[int, str]:
+        base_url = self.config.unipass_upstream if upstream == "unipass" else self.config.koreaexim_upstream
+        if not base_url:
+            return 502, f"no upstream configured for {upstream}"
+        response = requests.get(f"{base_url}?{urlencode(params)}", timeout=30)
+        if response.ok and response.text.strip():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(response.text)
+        return response.status_code, response.text
+
+    def _simulate_latency(self):
+        delay_ms = self.config.latency_ms
+        if self.config.jitter_ms:
+            delay_ms += random.uniform(-self.config.jitter_ms, self.config.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def _send(self, status: int, content_type: str, body: str):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # 키가 로그에 남지 않도록 API 키 파라미터를 가립니다.
+        message = API_KEY_PARAM_PATTERN.sub(r"\1=***", format % args)
+        super().log_message("%s", message)
+
+
+def create_stub_server(config: StubConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    handler = type("ConfiguredUpstreamStubHandler", (UpstreamStubHandler,), {"config": config})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def start_stub_server(config: StubConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """대역 서버를 백그라운드 스레드로 띄웁니다. port=0이면 빈 포트를 사용합니다."""
+    server = create_stub_server(config, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unipass / 한국수출입은행 API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=int, default=0, help="응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=int, default=0, help="응답 지연 편차 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="오류 응답 HTTP 상태 코드")
+    parser.add_argument("--payload-size", type=int, default=len(SYNTHETIC_PROGRESS_STEPS),
+                        help="합성 Unipass 응답의 진행 내역 개수")
+    parser.add_argument("--empty-weekends", action="store_true", help="주말 searchdate에 빈 환율표를 반환")
+    parser.add_argument("--record", action="store_true", help="실제 API 응답을 fixture로 저장")
+    parser.add_argument("--unipass-upstream", default=os.getenv("UNIPASS_UPSTREAM_API_PATH"),
+                        help="기록 모드에서 사용할 실제 Unipass API 경로")
+    parser.add_argument("--koreaexim-upstream", default=os.getenv("KOREAEXIM_UPSTREAM_API_URL"),
+                        help="기록 모드에서 사용할 실제 한국수출입은행 API 경로")
+    parser.add_argument("--fixture-dir", default=FIXTURE_DIR)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        payload_size=args.payload_size,
+        empty_weekends=args.empty_weekends,
+        record=args.record,
+        unipass_upstream=args.unipass_upstream,
+        koreaexim_upstream=args.koreaexim_upstream,
+        fixture_dir=args.fixture_dir,
+    )
+    server = create_stub_server(config, args.host, args.port)
+    print(f"upstream stub listening on http://{args.host}:{args.port} "
+          f"({UNIPASS_PREFIX}, {KOREAEXIM_PREFIX}, mode={'record' if args.record else 'replay'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()